@@ -0,0 +1,5 @@
+"""Benchmarks of rocket_twin.
+
+They are run from the repository root as modules, e.g. ``python -m benchmarks.suite run``,
+so that the package is found without installing it.
+"""
@@ -0,0 +1,79 @@
+"""Benchmark of the event location accuracy against the number of time steps.
+
+A three-stage station is fueled, launched and flown with the CoSApp Runge-Kutta driver and
+with the drivers using `EventLocator`. The fueling, launch and staging times are compared to
+their exact values for several time steps.
+
+Run with ``python -m benchmarks.bench_events`` from the repository root.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from cosapp.drivers import NonLinearSolver, RungeKutta
+
+from rocket_twin.drivers import AdaptiveRungeKutta, EventRungeKutta
+from rocket_twin.systems import Station
+
+INIT = {
+    "g_tank.fuel.weight_p": 20.0,
+    "g_tank.fuel.w_out_max": 3.0,
+    "rocket.stage_1.tank.fuel.w_out_max": 2.0,
+    "rocket.stage_2.tank.fuel.w_out_max": 1.0,
+    "rocket.stage_3.tank.fuel.w_out_max": 1.0,
+    "time_int": 0.7,
+}
+
+# Stages hold 5 kg, filled at 3 kg/s and emptied at 2, 1 and 1 kg/s
+EXACT = [5 / 3, 10 / 3, 5.0, 5.7, 8.2, 13.2, 18.2]
+
+DRIVERS = {
+    "cosapp": lambda dt: RungeKutta("rk", order=4, dt=dt, record_dt=True),
+    "located": lambda dt: EventRungeKutta("rk", order=4, dt=dt, record_dt=True),
+    "adaptive": lambda dt: AdaptiveRungeKutta("rk", dt=dt, record_dt=True),
+}
+
+
+def run_case(driver):
+    """Run the station and return the event times, the step count and the wall time."""
+    sys = Station("sys", n_stages=3, geometry="analytic")
+    sys.add_driver(driver)
+    driver.add_child(NonLinearSolver("solver"))
+    driver.time_interval = (0, 20)
+    driver.set_scenario(init=INIT)
+
+    start = time.perf_counter()
+    sys.run_drivers()
+    elapsed = time.perf_counter() - start
+
+    return [record.time for record in driver.recorded_events], len(driver.recorded_dt), elapsed
+
+
+def error(times):
+    """Largest event time error, infinite if events are missing or spurious."""
+    if len(times) != len(EXACT):
+        return np.inf
+    return np.max(np.abs(np.asarray(times) - EXACT))
+
+
+def main():
+    """Compare the event times and step counts of the drivers for each time step."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--dt", type=float, nargs="+", default=[0.05, 0.1, 0.5, 1.0, 2.0], help="time steps"
+    )
+    args = parser.parse_args()
+
+    print(f"{'driver':<10}{'dt':>8}{'steps':>8}{'events':>8}{'max error':>12}{'time':>10}")
+    for name, create in DRIVERS.items():
+        for dt in args.dt:
+            times, steps, elapsed = run_case(create(dt))
+            print(
+                f"{name:<10}{dt:>8.2f}{steps:>8d}{len(times):>8d}"
+                f"{error(times):>12.2e}{elapsed:>9.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
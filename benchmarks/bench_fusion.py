@@ -0,0 +1,88 @@
+"""Benchmark of the boolean fusion strategies on wings and multi-stage rockets.
+
+Run with ``python -m benchmarks.bench_fusion`` from the repository root.
+"""
+
+import argparse
+import time
+
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+
+from rocket_twin.systems import EngineGeom, NoseGeom, TankGeom, TubeGeom, WingsGeom
+from rocket_twin.utils.fusion import fuse_shapes, fuse_tree
+
+
+def fuse_chain(shapes):
+    """Fuse shapes pairwise over a growing shape, the reference strategy."""
+    fusion = shapes[0]
+    for shape in shapes[1:]:
+        fusion = BRepAlgoAPI_Fuse(fusion, shape).Shape()
+    return fusion
+
+
+STRATEGIES = {
+    "chain": fuse_chain,
+    "tree": fuse_tree,
+    "general": lambda shapes: fuse_shapes(shapes, parallel=False),
+    "general_parallel": lambda shapes: fuse_shapes(shapes, parallel=True),
+}
+
+
+def wing_shapes(n_wings):
+    """Solids of a set of `n_wings` default wings."""
+    wings = WingsGeom("wings")
+    return wings.create_wing_solids(
+        n_wings, wings.radius, wings.pos, wings.l_in, wings.l_out, wings.width, wings.th
+    )
+
+
+def rocket_shapes(n_stages, stage_height=7.0):
+    """Component solids of a rocket made of `n_stages` stacked default stages."""
+    shapes = []
+    for i in range(n_stages):
+        offset = i * stage_height
+        components = [TankGeom("tank"), EngineGeom("engine"), TubeGeom("tube")]
+        if i == 0:
+            components.append(WingsGeom("wings"))
+        if i == n_stages - 1:
+            components.append(NoseGeom("nose"))
+        for component in components:
+            component.pos += offset
+            shapes.append(component.create_shape())
+    return shapes
+
+
+def timeit(func, shapes, repeat):
+    """Best wall time of `repeat` calls of `func(shapes)`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(shapes)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(cases, repeat):
+    """Time every strategy on each case and print the speed-up over the chain."""
+    header = f"{'case':<16}" + "".join(f"{name:>18}" for name in STRATEGIES) + f"{'speed-up':>10}"
+    print(header)
+    for label, shapes in cases:
+        times = {name: timeit(func, shapes, repeat) for name, func in STRATEGIES.items()}
+        best = min(times["tree"], times["general"], times["general_parallel"])
+        row = f"{label:<16}" + "".join(f"{t * 1e3:>16.1f}ms" for t in times.values())
+        print(row + f"{times['chain'] / best:>9.1f}x")
+
+
+def main():
+    """Parse the command line and time the fusion of wings and rockets."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions per measure")
+    args = parser.parse_args()
+
+    cases = [(f"{n} wings", wing_shapes(n)) for n in (4, 8, 16, 32)]
+    cases += [(f"{n} stages", rocket_shapes(n)) for n in (1, 2, 3, 5, 10)]
+    run(cases, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
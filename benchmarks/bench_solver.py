@@ -0,0 +1,66 @@
+"""Benchmark of the explicit fast path of `ExplicitSolver` against the CoSApp solver.
+
+A station is fueled, launched and flown with a fixed-step Runge-Kutta driver, whose child is
+either the CoSApp `NonLinearSolver` or `ExplicitSolver`. The wall time per time step is the
+best of several repetitions.
+
+Run with ``python -m benchmarks.bench_solver`` from the repository root.
+"""
+
+import argparse
+import time
+
+from cosapp.drivers import NonLinearSolver
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+from rocket_twin.systems import Station
+
+INIT = {
+    "g_tank.fuel.weight_p": 40.0,
+    "g_tank.fuel.w_out_max": 3.0,
+    "time_int": 0.7,
+}
+
+SOLVERS = {"cosapp": NonLinearSolver, "explicit": ExplicitSolver}
+
+
+def run_case(solver, n_stages, dt, duration):
+    """Run the station and return the number of steps and the wall time."""
+    sys = Station("sys", n_stages=n_stages, geometry="analytic")
+    driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=dt, record_dt=True))
+    driver.add_child(solver("solver"))
+    driver.time_interval = (0, duration)
+    driver.set_scenario(init=INIT)
+
+    start = time.perf_counter()
+    sys.run_drivers()
+    elapsed = time.perf_counter() - start
+
+    return len(driver.recorded_dt), elapsed
+
+
+def main():
+    """Compare the solvers for each stage count and print the time per step."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 3], help="stage counts")
+    parser.add_argument("--dt", type=float, default=0.1, help="time step")
+    parser.add_argument("--duration", type=float, default=20.0, help="simulated time")
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions")
+    args = parser.parse_args()
+
+    print(f"{'stages':>6}{'solver':>10}{'steps':>8}{'time/step':>12}{'speed-up':>10}")
+    for n_stages in args.stages:
+        reference = None
+        for name, solver in SOLVERS.items():
+            runs = [run_case(solver, n_stages, args.dt, args.duration) for _ in range(args.repeat)]
+            steps = runs[0][0]
+            per_step = min(elapsed for _, elapsed in runs) / steps
+            reference = reference or per_step
+            print(
+                f"{n_stages:>6}{name:>10}{steps:>8d}{1e3 * per_step:>10.2f}ms"
+                f"{reference / per_step:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
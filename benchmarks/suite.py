@@ -0,0 +1,518 @@
+"""Benchmark suite of the subsystems, the station construction and complete missions.
+
+The suite times the `compute` of each geometry, mass, dynamics and controller system, the
+construction of stations of 1, 3 and 10 stages, the staging of rockets of up to 24 stages,
+the scaling of the construction, model pass and time steps with the number of stages, from 1
+to 64, and end-to-end `Mission` and `run_sequences` scenarios. The results are saved as JSON,
+and a run is compared to a stored baseline with the ``compare`` command, which exits with an
+error when a benchmark is slower than its baseline by more than a threshold.
+
+Cases whose dependencies are missing (pyoccad geometry, FMU controllers) are recorded as
+skipped. Geometry systems are timed with an empty geometry cache, so that the model is
+actually built at each call.
+
+Run from the repository root with::
+
+    python -m benchmarks.suite run --output benchmarks/results/baseline.json
+    python -m benchmarks.suite run
+    python -m benchmarks.suite compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import importlib.metadata
+import io
+import json
+import os
+import pathlib
+import platform
+import statistics
+import sys
+import timeit
+
+import numpy as np
+
+import rocket_twin.systems
+from rocket_twin._version import __version__
+
+RESULTS = pathlib.Path(__file__).parent / "results"
+CONTROL = pathlib.Path(rocket_twin.__file__).parent / "systems" / "control"
+
+BENCHMARKS = {}
+
+
+def benchmark(name, number=None):
+    """Register a benchmark.
+
+    The decorated function prepares the case and returns the callable to time. `number` is
+    the number of calls per repetition, chosen automatically if None.
+    """
+
+    def register(function):
+        BENCHMARKS[name] = (function, number)
+        return function
+
+    return register
+
+
+def compute_case(system, **inwards):
+    """Return the `compute` of a system, after a first run with the given inwards."""
+    for name, value in inwards.items():
+        system[name] = value
+    system.run_once()
+    return system.compute
+
+
+def geometry_case(name, backend):
+    """Return the `compute` of a pyoccad geometry system, with an empty geometry cache."""
+    from rocket_twin.utils import geometry_cache
+
+    system = getattr(rocket_twin.systems, name)("geom", backend=backend)
+    system.run_once()
+
+    def compute():
+        geometry_cache.clear()
+        system.compute()
+
+    return compute
+
+
+for _name in ("NoseGeom", "TubeGeom", "WingsGeom", "TankGeom", "EngineGeom"):
+    for _backend in ("occ", "analytic"):
+        benchmark(f"compute/{_name}/{_backend}")(
+            lambda name=_name, backend=_backend: geometry_case(name, backend)
+        )
+
+for _name in ("NoseMass", "TubeMass", "WingsMass", "TankMass", "EngineMass"):
+    benchmark(f"compute/{_name}")(
+        lambda name=_name: compute_case(getattr(rocket_twin.systems, name)("mass"))
+    )
+
+
+@benchmark("compute/OCCGeometry")
+def occ_geometry():
+    """Time the fusion and properties of a stage with nose and wings."""
+    from rocket_twin.systems import Stage
+
+    stage = Stage("stage", nose=True, wings=True)
+    stage.run_once()
+    return stage.geom.compute
+
+
+@benchmark("compute/MassGeometry")
+def mass_geometry():
+    """Time the properties of an analytic stage with nose and wings."""
+    from rocket_twin.systems import Stage
+
+    stage = Stage("stage", nose=True, wings=True, geometry="analytic")
+    stage.run_once()
+    return stage.geom.compute
+
+
+@benchmark("compute/Dynamics")
+def dynamics():
+    """Time the scalar dynamics of three forces and weights."""
+    from rocket_twin.systems import Dynamics
+
+    names = {"forces": ["thrust_1", "thrust_2", "thrust_3"], "weights": ["w_1", "w_2", "w_3"]}
+    return compute_case(Dynamics("dyn", **names), w_1=1.0, w_2=2.0, w_3=3.0)
+
+
+@benchmark("compute/VectorDynamics")
+def vector_dynamics():
+    """Time the vector dynamics of three forces and weights."""
+    from rocket_twin.systems import VectorDynamics
+
+    names = {"forces": ["thrust_1", "thrust_2", "thrust_3"], "weights": ["w_1", "w_2", "w_3"]}
+    return compute_case(VectorDynamics("dyn", **names), m=np.array([1.0, 2.0, 3.0]))
+
+
+@benchmark("compute/StationControllerCoSApp")
+def station_controller_cosapp():
+    """Time the CoSApp station controller."""
+    from rocket_twin.systems import StationControllerCoSApp
+
+    return compute_case(StationControllerCoSApp("controller"))
+
+
+@benchmark("compute/StageControllerCoSApp")
+def stage_controller_cosapp():
+    """Time the CoSApp stage controller."""
+    from rocket_twin.systems import StageControllerCoSApp
+
+    return compute_case(StageControllerCoSApp("controller"))
+
+
+@benchmark("compute/RocketControllerCoSApp")
+def rocket_controller_cosapp():
+    """Time the CoSApp controller of a three-stage rocket."""
+    from rocket_twin.systems import RocketControllerCoSApp
+
+    return compute_case(RocketControllerCoSApp("controller", n_stages=3))
+
+
+@benchmark("compute/StationControllerFMU")
+def station_controller_fmu():
+    """Time the FMU station controller."""
+    from rocket_twin.systems import StationControllerFMU
+
+    model = CONTROL / "station_controller.mo"
+    return compute_case(
+        StationControllerFMU("controller", model_path=model, model_name="station_controller")
+    )
+
+
+@benchmark("compute/StageControllerFMU")
+def stage_controller_fmu():
+    """Time the FMU stage controller."""
+    from rocket_twin.systems import StageControllerFMU
+
+    model = CONTROL / "stage_controller.mo"
+    return compute_case(
+        StageControllerFMU("controller", model_path=model, model_name="stage_controller")
+    )
+
+
+@benchmark("compute/RocketControllerFMU")
+def rocket_controller_fmu():
+    """Time the FMU controller of a three-stage rocket."""
+    from rocket_twin.systems import RocketControllerFMU
+
+    model = CONTROL / "rocket_controller.mo"
+    return compute_case(
+        RocketControllerFMU(
+            "controller", n_stages=3, model_path=model, model_name="rocket_controller"
+        )
+    )
+
+
+for _n_stages in (1, 3, 10):
+    for _geometry in ("analytic", "occ"):
+        benchmark(f"station/{_n_stages}/{_geometry}", number=1)(
+            lambda n_stages=_n_stages, geometry=_geometry: lambda: rocket_twin.systems.Station(
+                "sys", n_stages=n_stages, geometry=geometry
+            )
+        )
+
+
+def mission_case(geometry, dt):
+    """Return a fueling and flight of a one-stage station with the `Mission` driver."""
+    from rocket_twin.drivers import Mission
+    from rocket_twin.systems import Station
+
+    init = {
+        "rocket.stage_1.tank.fuel.weight_p": 0.0,
+        "g_tank.fuel.weight_p": 10.0,
+        "g_tank.w_in": 0.0,
+        "g_tank.fuel.w_out_max": 3.0,
+    }
+    stop = "rocket.stage_1.tank.weight_prop <= 0."
+
+    def run():
+        sys = Station("sys", geometry=geometry)
+        sys.add_driver(
+            Mission("mission", owner=sys, init=init, stop=stop, includes=["rocket.a"], dt=dt)
+        )
+        sys.run_drivers()
+
+    return run
+
+
+def sequences_case(geometry, dt):
+    """Return the initialization, fueling and flight sequences of a one-stage station."""
+    from rocket_twin.systems import Station
+    from rocket_twin.utils import run_sequences
+
+    sequences = [
+        {"name": "start", "init": {"g_tank.fuel.weight_p": 10.0}, "type": "static"},
+        {
+            "name": "fuel",
+            "type": "transient",
+            "init": {"g_tank.fuel.w_out_max": 1.0},
+            "dt": dt,
+            "stop": "rocket.stage_1.tank.weight_prop == rocket.stage_1.tank.weight_max",
+        },
+        {
+            "name": "flight",
+            "type": "transient",
+            "init": {"rocket.stage_1.tank.fuel.w_out_max": 0.5},
+            "dt": dt,
+            "stop": "rocket.stage_1.tank.weight_prop == 0",
+        },
+    ]
+
+    def run():
+        sys = Station("sys", geometry=geometry)
+        # run_sequences prints the name of each sequence
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_sequences(sys, sequences, includes=["rocket.a"])
+
+    return run
+
+
+for _geometry in ("analytic", "occ"):
+    for _dt in (1.0, 0.1):
+        benchmark(f"mission/{_geometry}/dt={_dt}", number=1)(
+            lambda geometry=_geometry, dt=_dt: mission_case(geometry, dt)
+        )
+        benchmark(f"sequences/{_geometry}/dt={_dt}", number=1)(
+            lambda geometry=_geometry, dt=_dt: sequences_case(geometry, dt)
+        )
+
+
+def staging_case(n_stages):
+    """Return the flight of a rocket dropping each of its stages with one unit of fuel."""
+    from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+    from rocket_twin.systems import Rocket
+
+    init = {"flying": True, "controller.is_on_1": True}
+    for i in range(1, n_stages + 1):
+        init[f"stage_{i}.tank.fuel.weight_p"] = 1.0
+        init[f"stage_{i}.tank.fuel.w_out_max"] = 1.0
+
+    def run():
+        rocket = Rocket("rocket", n_stages=n_stages, geometry="analytic")
+        driver = rocket.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+        driver.add_child(ExplicitSolver("solver"))
+        driver.time_interval = (0.0, n_stages + 0.5)
+        driver.set_scenario(init=init, stop=f"stage_{n_stages}.tank.weight_prop <= 0.")
+        rocket.run_drivers()
+
+    return run
+
+
+def drop_case(n_stages):
+    """Return the drop of all stages but the last one and their reattachment."""
+    from rocket_twin.systems import Rocket
+
+    rocket = Rocket("rocket", n_stages=n_stages, geometry="analytic")
+    rocket.run_once()
+
+    def drop():
+        rocket.set_topology({"dropped": n_stages - 1})
+        rocket.run_once()
+        rocket.set_topology({"dropped": 0})
+        rocket.run_once()
+
+    return drop
+
+
+for _n_stages in (3, 12):
+    benchmark(f"staging/{_n_stages}", number=1)(lambda n_stages=_n_stages: staging_case(n_stages))
+
+for _n_stages in (3, 12, 24):
+    benchmark(f"event/drop/{_n_stages}")(lambda n_stages=_n_stages: drop_case(n_stages))
+
+
+def build_case(n_stages):
+    """Return the construction of a rocket."""
+    from rocket_twin.systems import Rocket
+
+    return lambda: Rocket("rocket", n_stages=n_stages, geometry="analytic")
+
+
+def pass_case(n_stages):
+    """Return a complete model pass of a flying rocket, all of its systems being recomputed."""
+    from rocket_twin.systems import Rocket
+
+    rocket = Rocket("rocket", n_stages=n_stages, geometry="analytic")
+    rocket.flying = True
+    rocket.run_once()
+    systems = list(rocket.tree())
+
+    def run():
+        for system in systems:
+            system.inwards.touch()
+        rocket.run_once()
+
+    return run
+
+
+def steps_case(n_stages):
+    """Return four time steps of the flight of a rocket, including the driver setup."""
+    from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+    from rocket_twin.systems import Rocket
+
+    init = {"flying": True, "controller.is_on_1": True}
+    for i in range(1, n_stages + 1):
+        init[f"stage_{i}.tank.fuel.weight_p"] = 10.0
+        init[f"stage_{i}.tank.fuel.w_out_max"] = 1.0
+
+    rocket = Rocket("rocket", n_stages=n_stages, geometry="analytic")
+    driver = rocket.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+    driver.add_child(ExplicitSolver("solver"))
+    driver.time_interval = (0.0, 1.0)
+    driver.set_scenario(init=init)
+
+    return rocket.run_drivers
+
+
+def station_steps_case(n_stages):
+    """Return the construction of a station and four time steps of its fueling."""
+    from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+    from rocket_twin.systems import Station
+
+    def run():
+        station = Station("station", n_stages=n_stages, geometry="analytic")
+        driver = station.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+        driver.add_child(ExplicitSolver("solver"))
+        driver.time_interval = (0.0, 1.0)
+        driver.set_scenario(init={"g_tank.fuel.weight_p": 1000.0, "g_tank.fuel.w_out_max": 1.0})
+        station.run_drivers()
+
+    return run
+
+
+# Costs divided by the number of stages should stay about constant
+for _n_stages in (1, 2, 4, 8, 16, 32, 64):
+    benchmark(f"scaling/build/{_n_stages}", number=1)(
+        lambda n_stages=_n_stages: build_case(n_stages)
+    )
+    benchmark(f"scaling/pass/{_n_stages}")(lambda n_stages=_n_stages: pass_case(n_stages))
+
+for _n_stages in (1, 4, 16):
+    benchmark(f"scaling/steps/{_n_stages}", number=1)(
+        lambda n_stages=_n_stages: steps_case(n_stages)
+    )
+    benchmark(f"scaling/station/{_n_stages}", number=1)(
+        lambda n_stages=_n_stages: station_steps_case(n_stages)
+    )
+
+
+def run_benchmark(name, repeat):
+    """Time a benchmark and return its result, or the reason why it was skipped."""
+    function, number = BENCHMARKS[name]
+    try:
+        statement = function()
+        statement()
+    except ImportError as error:
+        return {"skipped": f"{type(error).__name__}: {error}"}
+
+    timer = timeit.Timer(statement)
+    if number is None:
+        number = timer.autorange()[0]
+    times = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "best": min(times),
+        "median": statistics.median(times),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def metadata():
+    """Return the description of the environment of a run."""
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "cosapp": importlib.metadata.version("cosapp"),
+        "rocket_twin": __version__,
+    }
+
+
+def run(args):
+    """Run the benchmarks matching the filters and save their results."""
+    names = [name for name in BENCHMARKS if any(fnmatch.fnmatch(name, p) for p in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = {}
+    for name in names:
+        result = run_benchmark(name, args.repeat)
+        results[name] = result
+        if "skipped" in result:
+            print(f"{name:<40}{'skipped':>12}  {result['skipped']}")
+        else:
+            print(f"{name:<40}{format_time(result['best']):>12}")
+
+    output = pathlib.Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as file:
+        json.dump({"metadata": metadata(), "results": results}, file, indent=2)
+    print(f"Results saved to {output}")
+    return 0
+
+
+def compare(args):
+    """Compare results to a baseline and return 1 if a benchmark regressed."""
+    with open(args.baseline) as file:
+        baseline = json.load(file)["results"]
+    with open(args.results) as file:
+        results = json.load(file)["results"]
+
+    # Benchmarks of the baseline left out of the current run are not reported
+    regressions = []
+    print(f"{'benchmark':<40}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name in sorted(results):
+        old = baseline.get(name, {}).get("best")
+        new = results[name].get("best")
+        if old is None or new is None:
+            status = "skipped" if new is None else "new"
+            print(f"{name:<40}{format_time(old):>12}{format_time(new):>12}{'':>8}  {status}")
+            continue
+
+        ratio = new / old
+        status = ""
+        if ratio > 1 + args.threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 / (1 + args.threshold):
+            status = "improvement"
+        print(f"{name:<40}{format_time(old):>12}{format_time(new):>12}{ratio:>8.2f}  {status}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {100 * args.threshold:.0f}%")
+        return 1
+    return 0
+
+
+def format_time(seconds):
+    """Format a duration with a suitable unit."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main():
+    """Parse the command line and run the command."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_run = commands.add_parser("run", help="run the benchmarks and save the results")
+    parser_run.add_argument(
+        "filter", nargs="*", default=["*"], help="benchmark name patterns, e.g. 'compute/*'"
+    )
+    parser_run.add_argument("--repeat", type=int, default=5, help="repetitions")
+    parser_run.add_argument(
+        "--output", default=os.fspath(RESULTS / "latest.json"), help="JSON results file"
+    )
+    parser_run.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser_run.set_defaults(function=run)
+
+    parser_compare = commands.add_parser("compare", help="compare results to a baseline")
+    parser_compare.add_argument("baseline", help="JSON results of the baseline")
+    parser_compare.add_argument(
+        "results", nargs="?", default=os.fspath(RESULTS / "latest.json"), help="JSON results"
+    )
+    parser_compare.add_argument(
+        "--threshold", type=float, default=0.2, help="relative slow-down flagged as regression"
+    )
+    parser_compare.set_defaults(function=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.function(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,15 @@
-from rocket_twin.drivers.fueling_rocket import FuelingRocket
-from rocket_twin.drivers.mission import Mission
-from rocket_twin.drivers.vertical_flying_rocket import VerticalFlyingRocket
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = ["FuelingRocket", "VerticalFlyingRocket", "Mission"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "FuelingRocket": "rocket_twin.drivers.fueling_rocket",
+        "VerticalFlyingRocket": "rocket_twin.drivers.vertical_flying_rocket",
+        "Mission": "rocket_twin.drivers.mission",
+        "AdaptiveRungeKutta": "rocket_twin.drivers.adaptive_runge_kutta",
+        "EventLocator": "rocket_twin.drivers.event_location",
+        "EventRungeKutta": "rocket_twin.drivers.event_location",
+        "ExplicitSolver": "rocket_twin.drivers.explicit_solver",
+        "IntegrationStatistics": "rocket_twin.drivers.integration_statistics",
+    },
+)
@@ -0,0 +1,139 @@
+from typing import Optional
+
+import numpy as np
+from cosapp.drivers.time.interfaces import ExplicitTimeDriver
+from cosapp.systems import System
+
+from rocket_twin.drivers.event_location import EventLocation
+
+# Dormand-Prince 5(4) coefficients
+_C = np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B = np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0])
+_E = _B - np.array(
+    [5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40]
+)
+
+
+class AdaptiveRungeKutta(EventLocation, ExplicitTimeDriver):
+    """Time driver with error-controlled step size, based on the Dormand-Prince 5(4) scheme.
+
+    Each time step is integrated with embedded fifth and fourth order solutions. Their
+    difference estimates the local error, which sets the size of the next step, and steps
+    with a too large error are rejected and retried with a smaller one. Events are located
+    with `EventLocator`.
+
+    Inputs
+    ------
+    name: string,
+        the name of the driver
+    owner: System,
+        the system that owns the driver
+    dt [s]: float,
+        initial time step
+    rtol: float,
+        relative tolerance on the transients
+    atol: float,
+        absolute tolerance on the transients
+    min_dt [s]: float,
+        minimum time step, steps at this size are accepted whatever their error
+    max_dt [s]: float,
+        maximum time step
+
+    Outputs
+    ------
+    statistics: dictionary,
+        number of time steps, accepted and rejected steps, and system evaluations
+    """
+
+    def __init__(
+        self,
+        name: str = "rk45",
+        owner: Optional["System"] = None,
+        dt: Optional[float] = 0.1,
+        rtol: float = 1e-6,
+        atol: float = 1e-6,
+        min_dt: float = 1e-6,
+        max_dt: float = np.inf,
+        **options
+    ):
+        super().__init__(name, owner, dt=dt, max_dt_growth_rate=5.0, **options)
+        self.rtol = rtol
+        self.atol = atol
+        self.min_dt = min_dt
+        self.max_dt = max_dt
+        self.initial_dt = dt
+        self.statistics = {"steps": 0, "accepted": 0, "rejected": 0, "evaluations": 0}
+
+    def _initialize(self):
+        self.dt = self.initial_dt
+        self.statistics = dict.fromkeys(self.statistics, 0)
+        super()._initialize()
+
+    def transition(self):
+        # Restart from the initial time step after a discontinuity
+        super().transition()
+        self.dt = self.initial_dt
+
+    def _update_transients(self, dt):
+        """Integrate the transients over `dt`, in as many accepted steps as needed."""
+        # Event location bookkeeping of the step
+        super()._update_transients(dt)
+
+        transients = self._transients
+        self.statistics["steps"] += 1
+        if not transients:
+            return
+
+        t, t_end = self.time, self.time + dt
+        h = dt
+        while t < t_end:
+            h = min(h, t_end - t)
+            error = self.__try_step(t, h)
+
+            if error <= 1.0 or h <= self.min_dt:
+                self.statistics["accepted"] += 1
+                t += h
+            else:
+                self.statistics["rejected"] += 1
+                for x, y in zip(transients.values(), self.__y):
+                    x.value = y
+                self._set_time(t)
+
+            factor = 5.0 if error == 0.0 else min(5.0, max(0.2, 0.9 * error ** (-1 / 5)))
+            h = min(self.max_dt, max(self.min_dt, h * factor))
+
+        self.dt = h
+
+    def __try_step(self, t, h):
+        """Take one embedded step of size `h` from `t` and return its scaled error norm."""
+        transients = list(self._transients.values())
+        self.__y = y = [np.array(x.value, dtype=float) for x in transients]
+        k = [[np.array(x.d_dt, dtype=float) for x in transients]]
+
+        for c, a in zip(_C[1:], _A[1:]):
+            for i, x in enumerate(transients):
+                x.value = y[i] + h * sum(a_j * k_j[i] for a_j, k_j in zip(a, k))
+            self._set_time(t + c * h)
+            self.statistics["evaluations"] += 1
+            k.append([np.array(x.d_dt, dtype=float) for x in transients])
+
+        # The last stage is evaluated at the fifth order solution
+        y_new = [np.array(x.value, dtype=float) for x in transients]
+        err = np.concatenate(
+            [
+                np.ravel(h * sum(e_j * k_j[i] for e_j, k_j in zip(_E, k)))
+                / (self.atol + self.rtol * np.maximum(np.abs(y[i]), np.abs(y_new[i])))
+                for i in range(len(transients))
+            ]
+        )
+
+        return np.sqrt(np.mean(err**2)) if err.size else 0.0
@@ -0,0 +1,120 @@
+import copy
+from importlib.metadata import version
+
+from cosapp.drivers import RungeKutta
+from cosapp.drivers.time.utils import TwoPointCubicInterpolator
+from cosapp.multimode.discreteStepper import DiscreteStepper
+
+# cosapp version whose private attributes are used by the event locator and the profiler
+COSAPP_VERSION = "0.15.0"
+
+
+def private(obj, name):
+    """Return a private attribute of a cosapp object, with a clear error if it is missing.
+
+    Inputs
+    ------
+    obj: object,
+        the cosapp object
+    name: string,
+        the name of the attribute
+
+    Outputs
+    ------
+    value: object,
+        the attribute
+    """
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        raise RuntimeError(
+            f"rocket_twin relies on {type(obj).__name__}.{name} of cosapp {COSAPP_VERSION}, "
+            f"missing in cosapp {version('cosapp')}"
+        ) from None
+
+
+class EventLocator(DiscreteStepper):
+    """Discrete stepper locating zero-crossing events on the dense output of the current step.
+
+    The transients are interpolated between their values and derivatives at both ends of the
+    step in which an event is detected, and the trigger time is bracketed by root finding on
+    this interpolation. The start of the step is the actual state of the system, also when
+    the step follows an event.
+    """
+
+    __slots__ = ("_start",)
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._start = None
+
+    def save_start(self):
+        """Store the transients and their derivatives at the start of the current step."""
+        self._start = {
+            key: (copy.copy(var.value), copy.copy(var.d_dt))
+            for key, var in self.sysview.transients.items()
+        }
+
+    def prime(self):
+        """Evaluate the zero-crossing functions at the start of the first step.
+
+        Without it, a crossing during the first step is not detected. Events whose function is
+        exactly zero at the start are locked until it changes, so that they are not triggered
+        by their initial value.
+        """
+        self.reevaluate_primitive_events()
+        self.shift()
+        for event in private(self, "_primitives"):
+            if event.value() == 0.0:
+                private(event, "_state").lock()
+
+    def set_data(self, interval, interpol):
+        interpol = {
+            key: TwoPointCubicInterpolator(
+                xs=interval,
+                ys=(self._start[key][0], copy.copy(var.value)),
+                dy=(self._start[key][1], copy.copy(var.d_dt)),
+            )
+            for key, var in self.sysview.transients.items()
+        }
+        super().set_data(interval, interpol)
+
+
+class EventLocation:
+    """Time driver mixin locating events with `EventLocator`."""
+
+    _primed = False
+
+    def setup_run(self):
+        super().setup_run()
+        # The stepper is private to ExplicitTimeDriver
+        private(self, "_ExplicitTimeDriver__stepper")
+        self._ExplicitTimeDriver__stepper = EventLocator(self)
+
+    def _initialize(self):
+        super()._initialize()
+        self._primed = False
+
+    def _update_transients(self, dt):
+        stepper = private(self, "_ExplicitTimeDriver__stepper")
+        if not self._primed:
+            stepper.prime()
+            self._primed = True
+        stepper.save_start()
+        super()._update_transients(dt)
+
+
+class EventRungeKutta(EventLocation, RungeKutta):
+    """Runge-Kutta time driver with accurate event location.
+
+    Inputs
+    ------
+    name: string,
+        the name of the driver
+    owner: System,
+        the system that owns the driver
+    order: int,
+        order of the Runge-Kutta scheme, from 2 to 4
+    dt [s]: float,
+        time step
+    """
@@ -0,0 +1,118 @@
+from typing import Optional
+
+import numpy as np
+from cosapp.drivers import NonLinearSolver
+from cosapp.systems import System
+
+
+class ExplicitSolver(NonLinearSolver):
+    """Non-linear solver with a fast path for explicit models.
+
+    Without unknowns or equations, the owner system is run directly. When the only unknowns
+    are those of the loops opened by CoSApp, such as the tank to controller connections of
+    the stages, the loops are closed by fixed-point passes: each sink is set to its source
+    and the model is run again until they agree. This converges in two passes when the
+    looped values only depend on the transients. Other problems are solved by the
+    non-linear solver, as are loops that do not converge within `max_passes`.
+
+    Inputs
+    ------
+    name: string,
+        the name of the driver
+    owner: System,
+        the system that owns the driver
+    max_passes: int,
+        maximum number of fixed-point passes before falling back to the non-linear solver
+    loop_tol: float,
+        absolute tolerance on the loop residues
+
+    Outputs
+    ------
+    statistics: dictionary,
+        number of calls, of calls solved without the non-linear solver, of model passes
+        made by them and of non-linear solver iterations
+    """
+
+    def __init__(
+        self,
+        name: str,
+        owner: Optional["System"] = None,
+        max_passes: int = 5,
+        loop_tol: float = 1e-12,
+        **kwargs
+    ):
+        super().__init__(name, owner, **kwargs)
+        self.max_passes = max_passes
+        self.loop_tol = loop_tol
+        self.loops = None
+        self.statistics = {"calls": 0, "explicit": 0, "passes": 0, "iterations": 0}
+
+    def reset_statistics(self):
+        """Reset the solver statistics."""
+        self.statistics = dict.fromkeys(self.statistics, 0)
+
+    @property
+    def is_explicit(self):
+        """bool: whether the problem is solved without the non-linear solver."""
+        return self.problem.is_empty() or self.loops is not None
+
+    def setup_run(self):
+        super().setup_run()
+
+        # Each opened loop adds an unknown and an equation "sink == source (loop)"
+        residues = self.problem.residues
+        if len(residues) == len(self.problem.unknowns) and all(
+            name.endswith(" (loop)") for name in residues
+        ):
+            self.loops = [
+                connector
+                for system in self.owner.tree()
+                for connector in system.all_connectors()
+                if not connector.is_active
+            ]
+        else:
+            self.loops = None
+
+    def _fresidues(self, x):
+        self.statistics["iterations"] += 1
+        return super()._fresidues(x)
+
+    def compute(self):
+        self.statistics["calls"] += 1
+
+        if self.problem.is_empty():
+            self.statistics["explicit"] += 1
+            self.statistics["passes"] += 1
+            self.owner.run_children_drivers()
+            return
+
+        if self.loops is not None and self.__close_loops():
+            self.statistics["explicit"] += 1
+            return
+
+        super().compute()
+
+    def __close_loops(self):
+        """Run fixed-point passes over the opened loops and return whether they converged."""
+        for _ in range(self.max_passes):
+            self.statistics["passes"] += 1
+            self.owner.run_children_drivers()
+
+            converged = True
+            for connector in self.loops:
+                sink = connector.sink
+                before = [np.copy(sink[name]) for name in connector.mapping]
+                # The opened connector is briefly activated, and only transfers a dirty source
+                connector.activate()
+                connector.source.touch()
+                connector.transfer()
+                connector.deactivate()
+                converged &= all(
+                    np.all(np.abs(sink[name] - value) <= self.loop_tol)
+                    for name, value in zip(connector.mapping, before)
+                )
+
+            if converged:
+                return True
+
+        return False
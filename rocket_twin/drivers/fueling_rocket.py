@@ -1,11 +1,17 @@
 from typing import Optional
 
-from cosapp.drivers import Driver, NonLinearSolver, RungeKutta
+from cosapp.drivers import Driver
 from cosapp.recorders import DataFrameRecorder
 from cosapp.systems import System
 
+from rocket_twin.drivers.adaptive_runge_kutta import AdaptiveRungeKutta
+from rocket_twin.drivers.event_location import EventRungeKutta
+from rocket_twin.drivers.explicit_solver import ExplicitSolver
+from rocket_twin.drivers.integration_statistics import IntegrationStatistics
+from rocket_twin.utils.chunk_recorder import ChunkRecorder
 
-class FuelingRocket(Driver):
+
+class FuelingRocket(IntegrationStatistics, Driver):
     """Driver that simulates the fueling of a rocket.
 
     Inputs
@@ -18,6 +24,20 @@ class FuelingRocket(Driver):
         integration time step
     owner: System,
         the system that owns the driver
+    adaptive: boolean,
+        whether the time step is error-controlled instead of fixed to dt
+    rtol: float,
+        relative tolerance of the adaptive time step
+    atol: float,
+        absolute tolerance of the adaptive time step
+    min_dt [s]: float,
+        minimum adaptive time step
+    max_dt [s]: float,
+        maximum adaptive time step
+    folder: string,
+        if given, the records are streamed to chunk files of this folder
+    chunk_size: int,
+        number of records per chunk file
 
     Outputs
     ------
@@ -31,20 +51,38 @@ class FuelingRocket(Driver):
         stop: Optional[str] = None,
         dt: Optional[float] = 0.1,
         includes: Optional[list[str]] = None,
+        adaptive: bool = False,
+        rtol: float = 1e-6,
+        atol: float = 1e-6,
+        min_dt: float = 1e-6,
+        max_dt: float = 100.0,
+        folder: Optional[str] = None,
+        chunk_size: int = 1000,
         **kwargs
     ):
         super().__init__(name, owner, **kwargs)
 
         # Fueling:
-        self.rk = self.add_driver(RungeKutta("rk", owner=owner, order=4, dt=dt))
+        if adaptive:
+            self.rk = self.add_driver(
+                AdaptiveRungeKutta(
+                    "rk", owner=owner, dt=dt, rtol=rtol, atol=atol, min_dt=min_dt, max_dt=max_dt
+                )
+            )
+        else:
+            self.rk = self.add_driver(
+                EventRungeKutta("rk", owner=owner, order=4, dt=dt, record_dt=True)
+            )
         self.rk.time_interval = (self.owner.time, 1000000.0)
-        self.solver = self.rk.add_child(NonLinearSolver("solver"))
+        self.solver = self.rk.add_child(ExplicitSolver("solver"))
 
         self.rk.set_scenario(init=init, stop=stop)
-        self.rk.add_recorder(
-            DataFrameRecorder(includes=includes, hold=True),
-            period=dt,
-        )
+        # Adaptive steps are all recorded
+        if folder is None:
+            recorder = DataFrameRecorder(includes=includes, hold=True)
+        else:
+            recorder = ChunkRecorder(folder, includes=includes, hold=True, chunk_size=chunk_size)
+        self.rk.add_recorder(recorder, period=None if adaptive else dt)
 
     @property
     def data(self):
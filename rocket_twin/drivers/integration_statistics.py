@@ -0,0 +1,40 @@
+from rocket_twin.drivers.adaptive_runge_kutta import AdaptiveRungeKutta
+
+
+class IntegrationStatistics:
+    """Mixin reporting the statistics of the time integration of a driver.
+
+    The driver integrates with its `rk` time driver, whose non-linear solver is `solver`.
+    Fixed-step Runge-Kutta drivers evaluate the system once per stage, that is `order` times
+    per step.
+
+    Outputs
+    ------
+    statistics: dictionary,
+        number of time steps, accepted and rejected steps, system evaluations and non-linear
+        solver iterations
+    """
+
+    @property
+    def statistics(self):
+        """dict: time integration statistics.
+
+        Number of time steps, accepted and rejected steps, system evaluations and non-linear
+        solver iterations.
+        """
+        if isinstance(self.rk, AdaptiveRungeKutta):
+            statistics = self.rk.statistics.copy()
+        else:
+            n_steps = len(self.rk.recorded_dt)
+            statistics = {
+                "steps": n_steps,
+                "accepted": n_steps,
+                "rejected": 0,
+                "evaluations": self.rk.order * n_steps,
+            }
+        statistics["solver_iterations"] = self.solver.statistics["iterations"]
+        return statistics
+
+    def _precompute(self):
+        super()._precompute()
+        self.solver.reset_statistics()
@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 
 import pandas as pd
@@ -6,6 +7,14 @@ from cosapp.systems import System
 
 from rocket_twin.drivers.fueling_rocket import FuelingRocket
 from rocket_twin.drivers.vertical_flying_rocket import VerticalFlyingRocket
+from rocket_twin.utils.chunk_recorder import ChunkReader, ChunkRecorder
+
+# Initial conditions of the flight, and end of the fueling at launch
+INIT_FLIGHT = {
+    "rocket.stage_1.tank.fuel.w_out_max": 3.0,
+    "rocket.controller.is_on_1": True,
+}
+STOP_FUELING = "rocket.flying == 1."
 
 
 class Mission(Driver):
@@ -23,6 +32,17 @@ class Mission(Driver):
         integration time step
     owner: System,
         the system that owns the driver
+    adaptive: boolean,
+        whether the time step is error-controlled instead of fixed to dt
+    rtol, atol: float,
+        relative and absolute tolerances of the adaptive time step
+    min_dt, max_dt [s]: float,
+        bounds of the adaptive time step
+    folder: string,
+        if given, the records are streamed to chunk files of the "fueling" and "flight"
+        subfolders of this folder
+    chunk_size: int,
+        number of records per chunk file
 
     Outputs
     ------
@@ -36,31 +56,56 @@ class Mission(Driver):
         stop: Optional[str] = None,
         dt: Optional[float] = 0.1,
         includes: Optional[list[str]] = None,
+        adaptive: bool = False,
+        rtol: float = 1e-6,
+        atol: float = 1e-6,
+        min_dt: float = 1e-6,
+        max_dt: float = 100.0,
+        folder: Optional[str] = None,
+        chunk_size: int = 1000,
         **kwargs
     ):
         super().__init__(name, owner, **kwargs)
 
         # Init and stop conditions
         init_fuel = init
-        init_flight = {
-            "rocket.stage_1.tank.fuel.w_out_max": 3.0,
-            "rocket.controller.is_on_1": True,
-        }
+        init_flight = INIT_FLIGHT
 
-        stop_fuel = "rocket.flying == 1."
+        stop_fuel = STOP_FUELING
         stop_flight = stop
 
+        options = dict(adaptive=adaptive, rtol=rtol, atol=atol, min_dt=min_dt, max_dt=max_dt)
+        folders = dict.fromkeys(("fueling", "flight"))
+        if folder is not None:
+            folders = {phase: os.path.join(folder, phase) for phase in folders}
+
         # Fueling
         self.add_child(
             FuelingRocket(
-                "fr", owner=owner, init=init_fuel, stop=stop_fuel, includes=includes, dt=dt
+                "fr",
+                owner=owner,
+                init=init_fuel,
+                stop=stop_fuel,
+                includes=includes,
+                dt=dt,
+                folder=folders["fueling"],
+                chunk_size=chunk_size,
+                **options,
             )
         )
 
         # Flying
         self.add_child(
             VerticalFlyingRocket(
-                "vfr", owner=owner, init=init_flight, stop=stop_flight, includes=includes, dt=dt
+                "vfr",
+                owner=owner,
+                init=init_flight,
+                stop=stop_flight,
+                includes=includes,
+                dt=dt,
+                folder=folders["flight"],
+                chunk_size=chunk_size,
+                **options,
             )
         )
 
@@ -70,3 +115,24 @@ class Mission(Driver):
         for child in self.children.values():
             data = pd.concat([data, child.rk.recorder.export_data()], ignore_index=True)
         return data
+
+    @property
+    def reader(self):
+        """ChunkReader: lazy reader of the whole mission, if it is recorded to a folder."""
+        recorders = [child.rk.recorder for child in self.children.values()]
+        if not all(isinstance(recorder, ChunkRecorder) for recorder in recorders):
+            return None
+        return ChunkReader(*(recorder.folder for recorder in recorders))
+
+    @property
+    def statistics(self):
+        """dict: time integration statistics.
+
+        Number of time steps, accepted and rejected steps, system evaluations and non-linear
+        solver iterations.
+        """
+        statistics = {}
+        for child in self.children.values():
+            for key, value in child.statistics.items():
+                statistics[key] = statistics.get(key, 0) + value
+        return statistics
@@ -1,41 +1,38 @@
-from rocket_twin.systems.control import (
-    RocketControllerCoSApp,
-    RocketControllerFMU,
-    StageControllerCoSApp,
-    StageControllerFMU,
-    StationControllerCoSApp,
-    StationControllerFMU,
-)
-from rocket_twin.systems.engine import Engine, EngineGeom, EnginePerfo
-from rocket_twin.systems.ground import Ground
-from rocket_twin.systems.physics import Dynamics
-from rocket_twin.systems.structure import NoseGeom, TubeGeom, WingsGeom
-from rocket_twin.systems.tank import Pipe, Tank, TankFuel, TankGeom
-
-from rocket_twin.systems.rocket import OCCGeometry, Stage, Rocket  # isort: skip
-from rocket_twin.systems.station import Station  # isort: skip
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = [
-    "Engine",
-    "EnginePerfo",
-    "EngineGeom",
-    "TankFuel",
-    "TankGeom",
-    "Tank",
-    "Stage",
-    "Rocket",
-    "Pipe",
-    "Dynamics",
-    "Station",
-    "Ground",
-    "StageControllerCoSApp",
-    "StationControllerCoSApp",
-    "RocketControllerCoSApp",
-    "StageControllerFMU",
-    "StationControllerFMU",
-    "RocketControllerFMU",
-    "NoseGeom",
-    "TubeGeom",
-    "WingsGeom",
-    "OCCGeometry",
-]
+__all__ = lazy_module(
+    __name__,
+    {
+        "Engine": "rocket_twin.systems.engine.engine",
+        "EnginePerfo": "rocket_twin.systems.engine.engine_perfo",
+        "EngineGeom": "rocket_twin.systems.engine.engine_geom",
+        "TankFuel": "rocket_twin.systems.tank.tank_fuel",
+        "TankGeom": "rocket_twin.systems.tank.tank_geom",
+        "Tank": "rocket_twin.systems.tank.tank",
+        "Stage": "rocket_twin.systems.rocket.stage",
+        "Rocket": "rocket_twin.systems.rocket.rocket",
+        "Pipe": "rocket_twin.systems.tank.pipe",
+        "Manifold": "rocket_twin.systems.tank.manifold",
+        "Dynamics": "rocket_twin.systems.physics.dynamics",
+        "VectorDynamics": "rocket_twin.systems.physics.vector_dynamics",
+        "Station": "rocket_twin.systems.station.station",
+        "Ground": "rocket_twin.systems.ground",
+        "StageControllerCoSApp": "rocket_twin.systems.control.stage_controller_cosapp",
+        "StationControllerCoSApp": "rocket_twin.systems.control.station_controller_cosapp",
+        "RocketControllerCoSApp": "rocket_twin.systems.control.rocket_controller_cosapp",
+        "StageControllerFMU": "rocket_twin.systems.control.stage_controller_fmu",
+        "StationControllerFMU": "rocket_twin.systems.control.station_controller_fmu",
+        "RocketControllerFMU": "rocket_twin.systems.control.rocket_controller_fmu",
+        "PooledFMUSystem": "rocket_twin.systems.control.pooled_fmu_system",
+        "NoseGeom": "rocket_twin.systems.structure.nose_geom",
+        "TubeGeom": "rocket_twin.systems.structure.tube_geom",
+        "WingsGeom": "rocket_twin.systems.structure.wings_geom",
+        "OCCGeometry": "rocket_twin.systems.rocket.occ_geometry",
+        "EngineMass": "rocket_twin.systems.mass.engine_mass",
+        "NoseMass": "rocket_twin.systems.mass.nose_mass",
+        "TankMass": "rocket_twin.systems.mass.tank_mass",
+        "TubeMass": "rocket_twin.systems.mass.tube_mass",
+        "WingsMass": "rocket_twin.systems.mass.wings_mass",
+        "MassGeometry": "rocket_twin.systems.mass.mass_geometry",
+    },
+)
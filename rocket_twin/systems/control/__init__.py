@@ -1,16 +1,14 @@
-from rocket_twin.systems.control.rocket_controller_cosapp import RocketControllerCoSApp
-from rocket_twin.systems.control.stage_controller_cosapp import StageControllerCoSApp
-from rocket_twin.systems.control.station_controller_cosapp import StationControllerCoSApp
+from rocket_twin.utils.lazy import lazy_module
 
-from rocket_twin.systems.control.rocket_controller_fmu import RocketControllerFMU  # isort: skip
-from rocket_twin.systems.control.stage_controller_fmu import StageControllerFMU  # isort: skip
-from rocket_twin.systems.control.station_controller_fmu import StationControllerFMU  # isort: skip
-
-__all__ = [
-    "StageControllerCoSApp",
-    "StationControllerCoSApp",
-    "RocketControllerCoSApp",
-    "StageControllerFMU",
-    "StationControllerFMU",
-    "RocketControllerFMU",
-]
+__all__ = lazy_module(
+    __name__,
+    {
+        "StageControllerCoSApp": "rocket_twin.systems.control.stage_controller_cosapp",
+        "StationControllerCoSApp": "rocket_twin.systems.control.station_controller_cosapp",
+        "RocketControllerCoSApp": "rocket_twin.systems.control.rocket_controller_cosapp",
+        "StageControllerFMU": "rocket_twin.systems.control.stage_controller_fmu",
+        "StationControllerFMU": "rocket_twin.systems.control.station_controller_fmu",
+        "RocketControllerFMU": "rocket_twin.systems.control.rocket_controller_fmu",
+        "PooledFMUSystem": "rocket_twin.systems.control.pooled_fmu_system",
+    },
+)
@@ -0,0 +1,165 @@
+import weakref
+
+from cosapp.base import System
+
+from rocket_twin.utils.fmu_pool import fmu_pool
+
+_TYPES = {"Real": float, "Integer": int, "Enumeration": int, "Boolean": bool}
+
+
+def _start(variable):
+    """Return the start value of an FMU variable, converted to its Python type."""
+    cast = _TYPES[variable.type]
+    if variable.start is None:
+        return cast(0)
+    if variable.type == "Boolean":
+        return str(variable.start).lower() in ("true", "1")
+    return cast(float(variable.start))
+
+
+class PooledFMUSystem(System):
+    """Co-simulation FMU system whose slave is borrowed from an `FMUPool`.
+
+    The FMU inputs and outputs become inwards and outwards of the system. At each
+    computation, the inputs are set, the slave is stepped up to the current time and the
+    outputs are read. The slave is restarted at the start of each run, and given back to the
+    pool by `close`, or at the exit of a `with` block, to be reset for the next system using
+    the same FMU. A system deleted without being closed gives its slave back when it is
+    garbage collected.
+
+    Time may go back, on the rejected steps of an adaptive driver or during the location of
+    an event. If the FMU can get and set its state, the state before each of the last
+    `max_checkpoints` steps is kept, and the slave is rewound to the latest one before the
+    new time and stepped from there. Otherwise, or further back, the slave is restarted at
+    the new time and loses its state.
+
+    Inputs
+    ------
+    fmu_path: string,
+        the path to the .fmu file
+    pool: FMUPool,
+        the pool lending the slave, defaults to `fmu_pool`
+    max_checkpoints: int,
+        number of slave states kept to go back in time
+    """
+
+    _last_time = 0.0
+    _restart = True
+    _release = None
+    _checkpoints = None
+
+    def setup(self, fmu_path, pool=None, max_checkpoints=8):
+
+        pool = fmu_pool if pool is None else pool
+        fmu = pool.acquire(fmu_path, instance_name=self.name)
+        # Fallback release of a system that is not closed
+        self._release = weakref.finalize(self, pool.release, fmu)
+
+        self.add_property("fmu", fmu)
+        self.add_property(
+            "max_checkpoints",
+            (
+                max_checkpoints
+                if getattr(fmu.model_description.coSimulation, "canGetAndSetFMUstate", False)
+                else 0
+            ),
+        )
+        self._checkpoints = []
+        self.add_property(
+            "fmu_inputs",
+            [v for v in fmu.model_description.modelVariables if v.causality == "input"],
+        )
+        self.add_property(
+            "fmu_outputs",
+            [v for v in fmu.model_description.modelVariables if v.causality == "output"],
+        )
+
+        for variable in self.fmu_inputs:
+            self.add_inward(variable.name, _start(variable))
+        for variable in self.fmu_outputs:
+            self.add_outward(variable.name, _start(variable))
+
+    def __enter__(self):
+        """Return the system, closed at the exit of the block."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the system."""
+        self.close()
+
+    def close(self):
+        """Give the slave back to the pool; the system must not be computed afterwards."""
+        if self._release.alive:
+            self.drop_checkpoints()
+        self._release()
+
+    def drop_checkpoints(self, time=None):
+        """Free the slave states saved after `time`, or all of them."""
+        while self._checkpoints and (time is None or self._checkpoints[-1][0] > time):
+            self.fmu.slave.freeFMUstate(self._checkpoints.pop()[1])
+
+    def rewind(self, time):
+        """Bring the slave back to an earlier time."""
+        self.drop_checkpoints(time)
+        if self._checkpoints:
+            self._last_time, state = self._checkpoints.pop()
+            self.fmu.slave.setFMUstate(state)
+            self.fmu.slave.freeFMUstate(state)
+        else:
+            self.fmu.initialize(start_time=time)
+            self._last_time = time
+
+    def reset(self):
+        """Restart the slave at the current time on the next computation."""
+        self._restart = True
+
+    def setup_run(self):
+        super().setup_run()
+        self.reset()
+
+    def _precompute(self):
+        super()._precompute()
+        if self.time != self._last_time:
+            # The slave state depends on time, even with unchanged inputs
+            self.inwards.touch()
+
+    def compute(self):
+
+        slave = self.fmu.slave
+
+        if self._restart:
+            self.drop_checkpoints()
+            self.fmu.initialize(start_time=self.time)
+            self._last_time = self.time
+            self._restart = False
+        elif self.time < self._last_time:
+            self.rewind(self.time)
+
+        for variable in self.fmu_inputs:
+            value = self[variable.name]
+            if variable.type == "Real":
+                slave.setReal([variable.valueReference], [float(value)])
+            elif variable.type == "Boolean":
+                slave.setBoolean([variable.valueReference], [bool(value)])
+            else:
+                slave.setInteger([variable.valueReference], [int(value)])
+
+        if self.time > self._last_time:
+            if self.max_checkpoints > 0:
+                self._checkpoints.append((self._last_time, slave.getFMUstate()))
+                if len(self._checkpoints) > self.max_checkpoints:
+                    slave.freeFMUstate(self._checkpoints.pop(0)[1])
+            slave.doStep(
+                currentCommunicationPoint=self._last_time,
+                communicationStepSize=self.time - self._last_time,
+            )
+            self._last_time = self.time
+
+        for variable in self.fmu_outputs:
+            if variable.type == "Real":
+                value = slave.getReal([variable.valueReference])[0]
+            elif variable.type == "Boolean":
+                value = slave.getBoolean([variable.valueReference])[0]
+            else:
+                value = slave.getInteger([variable.valueReference])[0]
+            self[variable.name] = value
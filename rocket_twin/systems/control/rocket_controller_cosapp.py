@@ -15,6 +15,8 @@ class RocketControllerCoSApp(System):
     ------
     is_on_i: float,
         whether the i-th stage controller is active or not
+    weight_prop [kg]: float,
+        fuel weight of the active stage, watched by the `drop` event
     """
 
     def setup(self, n_stages):
@@ -27,7 +29,14 @@ class RocketControllerCoSApp(System):
             self.add_inward(f"weight_prop_{i}", 0.0, desc=f"Stage {i} propellant weight", unit="kg")
             self.add_outward(f"is_on_{i}", False, desc=f"Whether the stage {i} is on or not")
 
-        self.add_event("drop", trigger="weight_prop_1 == 0.")
+        self.add_outward("weight_prop", 0.0, desc="Active stage propellant weight", unit="kg")
+
+        # The trigger is parsed once, stage changes only change the watched value
+        self.add_event("drop", trigger="weight_prop == 0.")
+
+    def compute(self):
+
+        self.weight_prop = self[f"weight_prop_{self.stage}"]
 
     def transition(self):
 
@@ -36,6 +45,5 @@ class RocketControllerCoSApp(System):
                 self[f"is_on_{self.stage}"] = False
                 self.stage += 1
                 self[f"is_on_{self.stage}"] = True
-                self.drop.trigger = f"weight_prop_{self.stage} == 0."
             else:
                 self[f"is_on_{self.stage}"] = False
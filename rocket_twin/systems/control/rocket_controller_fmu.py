@@ -2,9 +2,10 @@ import os
 
 from cosapp.base import System
 from cosapp_fmu.FMUsystem import FMUSystem
-from OMPython import ModelicaSystem
 
-import rocket_twin.systems.control
+import rocket_twin
+from rocket_twin.systems.control.pooled_fmu_system import PooledFMUSystem
+from rocket_twin.utils.fmu_cache import fmu_cache
 
 
 class RocketControllerFMU(System):
@@ -16,6 +17,8 @@ class RocketControllerFMU(System):
         the path to the .mo file, if any
     model_name: string,
         the .fmu file name
+    pool: FMUPool,
+        if given, the FMU slave is borrowed from this pool instead of being loaded
     flying: boolean,
         whether the rocket is mid-flight or not
     n_stages: int,
@@ -27,9 +30,11 @@ class RocketControllerFMU(System):
     ------
     is_on_i: boolean,
         whether the i-th stage controller is active or not
+    weight_prop [kg]: float,
+        fuel weight of the active stage, watched by the `drop` event
     """
 
-    def setup(self, n_stages, model_path, model_name):
+    def setup(self, n_stages, model_path, model_name, pool=None):
 
         self.add_inward("n_stages", n_stages, desc="number of stages")
         self.add_inward("stage", 1, desc="Current active stage")
@@ -43,14 +48,19 @@ class RocketControllerFMU(System):
 
         fmu_path = self.create_fmu(model_path, model_name)
         self.add_child(
-            FMUSystem("fmu_controller", fmu_path=fmu_path),
+            self.fmu_system(fmu_path, pool),
             pulling=pulling,
         )
 
-        self.add_event("drop", trigger="weight_prop_1 < 0.1")
+        self.add_outward("weight_prop", 0.0, desc="Active stage propellant weight", unit="kg")
+
+        # The trigger is parsed once, stage changes only change the watched value
+        self.add_event("drop", trigger="weight_prop < 0.1")
 
     def compute(self):
 
+        self.weight_prop = self[f"weight_prop_{self.stage}"]
+
         for i in range(1, self.n_stages):
             self[f"is_on_{i}"] = bool(self[f"is_on_{i}"])
 
@@ -59,17 +69,22 @@ class RocketControllerFMU(System):
         if self.drop.present:
             if self.stage < self.n_stages:
                 self.stage += 1
-                self.drop.trigger = f"weight_prop_{self.stage} < 0.1"
+
+    def fmu_system(self, fmu_path, pool):
+        """Return the FMU system of the controller, pooled if a pool is given."""
+        if pool is None:
+            return FMUSystem("fmu_controller", fmu_path=fmu_path)
+        return PooledFMUSystem("fmu_controller", fmu_path=fmu_path, pool=pool)
 
     def create_fmu(self, model_path, model_name):
-        """Create an fmu file in the control folder from an mo file.
+        """Return the fmu file of an mo file, compiled once and kept in the FMU cache.
 
         Inputs
         ------
         model_path: string
-            the path of the .mo file
+            the path of the .mo file, relative to the rocket_twin package
         model_name: string
-            the name of the .fmu file to be created
+            the name of the model
 
         Outputs
         ------
@@ -78,18 +93,7 @@ class RocketControllerFMU(System):
             the path to the .fmu file
         """
 
-        fmu_path = os.path.join(rocket_twin.systems.control.__path__[0], model_name)
         model_path = os.path.join(rocket_twin.__path__[0], model_path)
         model_path = model_path.replace("\\", "/")
-        try:
-            os.mkdir(fmu_path)
-        except OSError:
-            pass
-        os.chdir(fmu_path)
-        mod = ModelicaSystem(model_path, model_name)
-        fmu = mod.convertMo2Fmu()
-        for filename in os.listdir(fmu_path):
-            if filename != (model_name + ".fmu"):
-                os.remove(filename)
-
-        return fmu
+
+        return fmu_cache.get(model_path, model_name)
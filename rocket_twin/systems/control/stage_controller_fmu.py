@@ -2,9 +2,10 @@ import os
 
 from cosapp.base import System
 from cosapp_fmu.FMUsystem import FMUSystem
-from OMPython import ModelicaSystem
 
-import rocket_twin.systems.control
+import rocket_twin
+from rocket_twin.systems.control.pooled_fmu_system import PooledFMUSystem
+from rocket_twin.utils.fmu_cache import fmu_cache
 
 
 class StageControllerFMU(System):
@@ -16,6 +17,8 @@ class StageControllerFMU(System):
         the path to the .mo file, if any
     model_name: string,
         the .fmu file name
+    pool: FMUPool,
+        if given, the FMU slave is borrowed from this pool instead of being loaded
     is_on: boolean,
         whether the system is in fueling phase or not
     weight_prop: float,
@@ -29,7 +32,7 @@ class StageControllerFMU(System):
         command flux
     """
 
-    def setup(self, model_path, model_name):
+    def setup(self, model_path, model_name, pool=None):
 
         self.add_inward("weight_prop", 0.0, desc="Stage propellant weight", unit="kg")
         self.add_inward("weight_max", 1.0, desc="Stage maximum propellant weight", unit="kg")
@@ -37,21 +40,27 @@ class StageControllerFMU(System):
 
         fmu_path = self.create_fmu(model_path, model_name)
         self.add_child(
-            FMUSystem("fmu_controller", fmu_path=fmu_path),
+            self.fmu_system(fmu_path, pool),
             pulling=["is_on", "w"],
         )
 
         self.add_event("full", trigger="weight_prop == weight_max")
 
+    def fmu_system(self, fmu_path, pool):
+        """Return the FMU system of the controller, pooled if a pool is given."""
+        if pool is None:
+            return FMUSystem("fmu_controller", fmu_path=fmu_path)
+        return PooledFMUSystem("fmu_controller", fmu_path=fmu_path, pool=pool)
+
     def create_fmu(self, model_path, model_name):
-        """Create an fmu file in the control folder from an mo file.
+        """Return the fmu file of an mo file, compiled once and kept in the FMU cache.
 
         Inputs
         ------
         model_path: string
-            the path of the .mo file
+            the path of the .mo file, relative to the rocket_twin package
         model_name: string
-            the name of the .fmu file to be created
+            the name of the model
 
         Outputs
         ------
@@ -60,18 +69,7 @@ class StageControllerFMU(System):
             the path to the .fmu file
         """
 
-        fmu_path = os.path.join(rocket_twin.systems.control.__path__[0], model_name)
         model_path = os.path.join(rocket_twin.__path__[0], model_path)
         model_path = model_path.replace("\\", "/")
-        try:
-            os.mkdir(fmu_path)
-        except OSError:
-            pass
-        os.chdir(fmu_path)
-        mod = ModelicaSystem(model_path, model_name)
-        fmu = mod.convertMo2Fmu()
-        for filename in os.listdir(fmu_path):
-            if filename != (model_name + ".fmu"):
-                os.remove(filename)
-
-        return fmu
+
+        return fmu_cache.get(model_path, model_name)
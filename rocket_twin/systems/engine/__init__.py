@@ -1,6 +1,10 @@
-from rocket_twin.systems.engine.engine_geom import EngineGeom
-from rocket_twin.systems.engine.engine_perfo import EnginePerfo
+from rocket_twin.utils.lazy import lazy_module
 
-from rocket_twin.systems.engine.engine import Engine  # isort: skip
-
-__all__ = ["Engine", "EngineGeom", "EnginePerfo"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "Engine": "rocket_twin.systems.engine.engine",
+        "EngineGeom": "rocket_twin.systems.engine.engine_geom",
+        "EnginePerfo": "rocket_twin.systems.engine.engine_perfo",
+    },
+)
@@ -1,6 +1,8 @@
 from cosapp.base import System
 
-from rocket_twin.systems.engine import EngineGeom, EnginePerfo
+from rocket_twin.systems.engine import EnginePerfo
+from rocket_twin.systems.mass import EngineMass
+from rocket_twin.utils.shapes import geometry_backend
 
 
 class Engine(System):
@@ -10,6 +12,9 @@ class Engine(System):
     ------
     w_out [kg/s]: float,
         fuel consumption rate
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models
+        only built on request, "analytic" for mass models without pyoccad
 
     Outputs
     ------
@@ -21,7 +26,15 @@ class Engine(System):
         model properties
     """
 
-    def setup(self):
+    def setup(self, geometry="occ"):
 
-        self.add_child(EngineGeom("geom"), pulling=["shape", "props"])
+        backend = geometry_backend(geometry)
+
+        if backend is None:
+            self.add_child(EngineMass("geom"), pulling=["props"])
+        else:
+            # pyoccad is only imported when a pyoccad model is requested
+            from rocket_twin.systems.engine import EngineGeom
+
+            self.add_child(EngineGeom("geom", backend=backend), pulling=["shape", "props"])
         self.add_child(EnginePerfo("perfo"), pulling=["w_out", "force"])
@@ -5,22 +5,31 @@ from OCC.Core.gp import gp_Pnt, gp_Vec
 from OCC.Core.GProp import GProp_GProps
 from pyoccad.create import CreateCone, CreateSphere
 
+from rocket_twin.utils.geometry_cache import geometry_cache
+from rocket_twin.utils.mass_properties import engine_properties, geometry_key
+from rocket_twin.utils.shapes import LazyShape
 
-class EngineGeom(System):
+
+class EngineGeom(LazyShape, System):
     """Pyoccad model of an engine.
 
     Inputs
     ------
+    backend: string,
+        "occ" to compute properties from the pyoccad model, "analytic" to use closed-form
+        formulas and only build the model on request
 
     Outputs
     ------
     shape: TopoDS_Solid,
-        pyoccad model
+        pyoccad model, only built on request with the analytic backend
     props: GProp_GProps,
         model properties
     """
 
-    def setup(self):
+    def setup(self, backend="occ"):
+
+        self.add_backend(backend)
 
         # Geometric parameters
         self.add_inward("base_radius", 1.0, desc="Base radius", unit="m")
@@ -39,10 +48,26 @@ class EngineGeom(System):
 
     def compute(self):
 
-        self.shape = CreateCone.from_base_and_dir(
-            gp_Pnt(0, 0, self.pos), gp_Vec(0, 0, self.height), self.base_radius, self.top_radius
-        )
-        vprop = GProp_GProps()
-        brepgprop.VolumeProperties(self.shape, vprop)
+        key = geometry_key("engine", self)
+
+        if self.backend == "analytic":
+            self.props = (engine_properties(self) * self.rho).to_gprops()
+            self.update_shape(lambda: geometry_cache.get(key, self.create_volume)[0])
+            return
+
+        self.shape, vprop = geometry_cache.get(key, self.create_volume)
         self.props = GProp_GProps()
         self.props.Add(vprop, self.rho)
+
+    def create_volume(self):
+        """Create the pyoccad model and its volume properties from the current inwards."""
+        shape = self.create_shape()
+        vprop = GProp_GProps()
+        brepgprop.VolumeProperties(shape, vprop)
+        return shape, vprop
+
+    def create_shape(self):
+        """Create the pyoccad model of the engine from the current inwards."""
+        return CreateCone.from_base_and_dir(
+            gp_Pnt(0, 0, self.pos), gp_Vec(0, 0, self.height), self.base_radius, self.top_radius
+        )
@@ -0,0 +1,13 @@
+from rocket_twin.utils.lazy import lazy_module
+
+__all__ = lazy_module(
+    __name__,
+    {
+        "EngineMass": "rocket_twin.systems.mass.engine_mass",
+        "NoseMass": "rocket_twin.systems.mass.nose_mass",
+        "TankMass": "rocket_twin.systems.mass.tank_mass",
+        "TubeMass": "rocket_twin.systems.mass.tube_mass",
+        "WingsMass": "rocket_twin.systems.mass.wings_mass",
+        "MassGeometry": "rocket_twin.systems.mass.mass_geometry",
+    },
+)
@@ -0,0 +1,38 @@
+import numpy as np
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+from rocket_twin.utils.mass_properties import engine_properties
+
+
+class EngineMass(System):
+    """Mass model of an engine, without pyoccad model.
+
+    Inputs
+    ------
+
+    Outputs
+    ------
+    props: MassProperties,
+        model properties
+    """
+
+    def setup(self):
+
+        # Geometric parameters
+        self.add_inward("base_radius", 1.0, desc="Base radius", unit="m")
+        self.add_inward("top_radius", 0.5, desc="top radius", unit="m")
+        self.add_inward("height", 1.0, desc="Height", unit="m")
+
+        # Density
+        self.add_inward("rho", 12 / (7 * np.pi), desc="density", unit="kg/m**3")
+
+        # Positional parameters
+        self.add_inward("pos", -1.2, desc="Base center z-position", unit="m")
+
+        # Outputs
+        self.add_outward("props", MassProperties(), desc="model properties")
+
+    def compute(self):
+
+        self.props = engine_properties(self) * self.rho
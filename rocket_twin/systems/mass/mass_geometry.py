@@ -0,0 +1,59 @@
+import numpy as np
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+
+
+class MassGeometry(System):
+    """Mass properties of a system, without pyoccad models.
+
+    Lightweight counterpart of `OCCGeometry`, fed with `MassProperties` instead of
+    `GProp_GProps`.
+
+    Inputs
+    ------
+    props: MassProperties,
+        properties of each component
+    attached: np.ndarray[bool],
+        whether each component, in the order of `properties`, belongs to the system
+
+    Outputs
+    ------
+    props: MassProperties,
+        properties of the global model
+    cg [m]: float,
+        center of gravity
+    weight [kg]: float,
+        total weight
+    I [kg*m**2] : float,
+        Inertia matrix
+    """
+
+    def setup(self, properties=None):
+
+        if properties is None:
+            properties = []
+
+        self.add_property("properties", properties)
+
+        for props in properties:
+            self.add_inward(props, MassProperties(), desc=f"Properties of the {props}")
+        self.add_inward(
+            "attached", np.ones(len(properties), dtype=bool), desc="Attached components"
+        )
+
+        self.add_outward("props", MassProperties(), desc="global properties")
+        self.add_outward("weight", 1.0, desc="weight", unit="kg")
+        self.add_outward("cg", 1.0, desc="center of gravity", unit="m")
+        self.add_outward("I", np.zeros((3, 3)), desc="Inertia matrix", unit="kg*m**2")
+
+    def compute(self):
+
+        self.props = MassProperties()
+        for props, attached in zip(self.properties, self.attached):
+            if attached:
+                self.props = self.props + self[props]
+
+        self.weight = self.props.mass
+        self.cg = self.props.cg[2]
+        self.I[:, :] = self.props.inertia
@@ -0,0 +1,37 @@
+import numpy as np
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+from rocket_twin.utils.mass_properties import nose_properties
+
+
+class NoseMass(System):
+    """Mass model of a solid nose, without pyoccad model.
+
+    Inputs
+    ------
+
+    Outputs
+    ------
+    props: MassProperties,
+        model properties
+    """
+
+    def setup(self):
+
+        # Geometric parameters
+        self.add_inward("radius", 1.0, desc="Base radius", unit="m")
+        self.add_inward("height", 1.0, desc="Height", unit="m")
+
+        # Density
+        self.add_inward("rho", 3 / np.pi, desc="density", unit="kg/m**3")
+
+        # Positional parameters
+        self.add_inward("pos", 6.0, desc="Base center z-position", unit="m")
+
+        # Outputs
+        self.add_outward("props", MassProperties(), desc="model properties")
+
+    def compute(self):
+
+        self.props = nose_properties(self) * self.rho
@@ -0,0 +1,51 @@
+import numpy as np
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+from rocket_twin.utils.mass_properties import cylinder, tank_properties
+
+
+class TankMass(System):
+    """Mass model of the tank structure and fuel, without pyoccad model.
+
+    Inputs
+    ------
+
+    Outputs
+    ------
+    props: MassProperties,
+        model properties
+    weight_max [kg]: float,
+        maximum fuel capacity
+    """
+
+    def setup(self):
+
+        # Structure parameters
+        self.add_inward("r_int", 0.8, desc="internal radius", unit="m")
+        self.add_inward("r_ext", 1.0, desc="external radius", unit="m")
+        self.add_inward("thickness", self.r_ext - self.r_int, desc="thickness", unit="m")
+        self.add_inward("height", 1.0, desc="Height", unit="m")
+        self.add_inward("rho_struct", 1 / (0.56 * np.pi), desc="Structure density", unit="kg/m**3")
+
+        # Fuel parameters
+        self.add_inward("weight_prop", 0.0, desc="Fuel weight", unit="kg")
+        self.add_inward("rho_fuel", 7.8125 / np.pi, desc="Fuel density", unit="kg/m**3")
+
+        # Position
+        self.add_inward("pos", 0.0, desc="base center z-coordinate", unit="m")
+
+        # Outputs
+        self.add_outward("props", MassProperties(), desc="model properties")
+        self.add_outward("weight_max", 1.0, desc="Maximum fuel capacity", unit="kg")
+
+    def compute(self):
+
+        self.weight_max = np.pi * self.r_int**2 * self.height * self.rho_fuel
+
+        struct_prop = tank_properties(self)
+
+        height_fuel = self.weight_prop / (np.pi * self.r_int**2 * self.rho_fuel)
+        fuel_prop = cylinder(self.r_int, height_fuel, self.pos)
+
+        self.props = struct_prop * self.rho_struct + fuel_prop * self.rho_fuel
@@ -0,0 +1,37 @@
+import numpy as np
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+from rocket_twin.utils.mass_properties import tube_properties
+
+
+class TubeMass(System):
+    """Mass model of a solid tube, without pyoccad model.
+
+    Inputs
+    ------
+
+    Outputs
+    ------
+    props: MassProperties,
+        model properties
+    """
+
+    def setup(self):
+
+        # Geometric parameters
+        self.add_inward("radius", 1.0, desc="internal radius", unit="m")
+        self.add_inward("length", 5.0, desc="length", unit="m")
+
+        # Density
+        self.add_inward("rho", 0.2 / np.pi, desc="density", unit="kg/m**3")
+
+        # Positional parameters
+        self.add_inward("pos", 1.0, desc="lowest point z coordinate", unit="m")
+
+        # Outputs
+        self.add_outward("props", MassProperties(), desc="model properties")
+
+    def compute(self):
+
+        self.props = tube_properties(self) * self.rho
@@ -0,0 +1,40 @@
+from cosapp.base import System
+
+from rocket_twin.utils import MassProperties
+from rocket_twin.utils.mass_properties import wings_properties
+
+
+class WingsMass(System):
+    """Mass model of a set of wings, without pyoccad model.
+
+    Inputs
+    ------
+
+    Outputs
+    ------
+    props: MassProperties,
+        model properties
+    """
+
+    def setup(self):
+
+        # Geometric parameters
+        self.add_inward("n", 4, desc="Number of wings", unit="")
+        self.add_inward("l_in", 1.0, desc="rocket edge length", unit="m")
+        self.add_inward("l_out", 0.5, desc="free edge length", unit="m")
+        self.add_inward("width", 4 / 3, desc="width", unit="m")
+        self.add_inward("th", 0.1, desc="thickness", unit="m")
+
+        # Density
+        self.add_inward("rho", 10.0, desc="density", unit="kg/m**3")
+
+        # Positional parameters
+        self.add_inward("radius", 1.0, desc="radius of the set", unit="m")
+        self.add_inward("pos", 0.0, desc="lowest point z-coordinate", unit="m")
+
+        # Outputs
+        self.add_outward("props", MassProperties(), desc="model properties")
+
+    def compute(self):
+
+        self.props = wings_properties(self) * self.rho
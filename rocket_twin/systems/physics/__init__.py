@@ -1,3 +1,9 @@
-from rocket_twin.systems.physics.dynamics import Dynamics
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = ["Dynamics"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "Dynamics": "rocket_twin.systems.physics.dynamics",
+        "VectorDynamics": "rocket_twin.systems.physics.vector_dynamics",
+    },
+)
@@ -1,3 +1,4 @@
+import numpy as np
 from cosapp.base import System
 
 
@@ -12,6 +13,8 @@ class Dynamics(System):
         total weight of each component of the system
     centers[m]: float,
         center of gravity of each component of the system
+    attached: np.ndarray[bool],
+        whether each force, in the order of `forces`, applies to the system
 
     Outputs
     ------
@@ -40,6 +43,7 @@ class Dynamics(System):
             self.add_inward(weight, 0.0, desc=f"Weight called {weight}", unit="kg")
         for force in self.forces:
             self.add_inward(force, 0.0, desc=f"Force called {force}", unit="N")
+        self.add_inward("attached", np.ones(len(forces), dtype=bool), desc="Applied forces")
 
         self.add_outward("force", 1.0, desc="Force", unit="N")
         self.add_outward("weight", 1.0, desc="Weight", unit="kg")
@@ -51,7 +55,8 @@ class Dynamics(System):
             self.weight += self[weight]
 
         self.force = self.weight * self.g
-        for force in self.forces:
-            self.force += self[force]
+        for force, attached in zip(self.forces, self.attached):
+            if attached:
+                self.force += self[force]
 
         self.a = self.force / self.weight
@@ -0,0 +1,58 @@
+import numpy as np
+from cosapp.base import System
+
+
+class VectorDynamics(System):
+    """Dynamics of a physical system, with forces and weights stored in arrays.
+
+    Each named force is a row of `F` and each named weight an element of `m`, so that the
+    sums do not depend on per-name attribute access. Scalar outputs of other systems can be
+    connected to a single element with `rocket_twin.utils.IndexConnector`.
+
+    Inputs
+    ------
+    F [N]: np.ndarray,
+        force vector of each component of the system, one row per force
+    m [kg]: np.ndarray,
+        weight of each component of the system
+    g [m/s**2]: np.ndarray,
+        gravity vector
+    attached: np.ndarray[bool],
+        whether each row of `F` applies to the system
+
+    Outputs
+    ------
+    force [N]: np.ndarray,
+        total force vector
+    weight [kg]: float,
+        total weight
+    acc [m/s**2]: np.ndarray,
+        acceleration vector
+    a [m/s**2] : float,
+        vertical acceleration
+    """
+
+    def setup(self, forces=None, weights=None):
+        if forces is None:
+            forces = []
+        if weights is None:
+            weights = []
+
+        self.add_property("forces", forces)
+        self.add_property("weights", weights)
+
+        self.add_inward("g", np.array([0.0, 0.0, -10.0]), desc="Gravity", unit="m/s**2")
+        self.add_inward("F", np.zeros((len(forces), 3)), desc="Forces", unit="N")
+        self.add_inward("m", np.zeros(len(weights)), desc="Weights", unit="kg")
+        self.add_inward("attached", np.ones(len(forces), dtype=bool), desc="Applied forces")
+
+        self.add_outward("force", np.zeros(3), desc="Force", unit="N")
+        self.add_outward("weight", 1.0, desc="Weight", unit="kg")
+        self.add_outward("acc", np.zeros(3), desc="Acceleration vector", unit="m/s**2")
+        self.add_outward("a", 0.0, desc="Acceleration", unit="m/s**2")
+
+    def compute(self):
+        self.weight = self.m.sum()
+        self.force = self.weight * self.g + self.attached @ self.F
+        self.acc = self.force / self.weight
+        self.a = self.acc[2]
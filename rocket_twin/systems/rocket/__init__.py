@@ -1,6 +1,10 @@
-from rocket_twin.systems.rocket.occ_geometry import OCCGeometry
-from rocket_twin.systems.rocket.stage import Stage
+from rocket_twin.utils.lazy import lazy_module
 
-from rocket_twin.systems.rocket.rocket import Rocket  # isort: skip
-
-__all__ = ["Stage", "Rocket", "OCCGeometry"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "Stage": "rocket_twin.systems.rocket.stage",
+        "Rocket": "rocket_twin.systems.rocket.rocket",
+        "OCCGeometry": "rocket_twin.systems.rocket.occ_geometry",
+    },
+)
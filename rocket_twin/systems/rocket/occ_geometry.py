@@ -1,12 +1,15 @@
 import numpy as np
 from cosapp.base import System
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRep import BRep_Builder
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Solid
 from pyoccad.create import CreateSphere
 
+from rocket_twin.utils.fusion import fuse_shapes
+from rocket_twin.utils.shapes import LazyShape
 
-class OCCGeometry(System):
+
+class OCCGeometry(LazyShape, System):
     """Geometrical properties of a system.
 
     Inputs
@@ -15,11 +18,17 @@ class OCCGeometry(System):
         pyoccad models of each component of the system
     props: GProp_GProps,
         properties of each model
+    attached: np.ndarray[bool],
+        whether each component, in the order of `properties` and `shapes`, belongs to the
+        system
+    lazy: boolean,
+        if True, the fused shape is only built on request and at events
 
     Outputs
     ------
     shape: TopoDS_Solid, TopoDS_Compound,
-        fusion of all input models
+        fusion of all attached models, empty if none is attached; if lazy, only valid after
+        `request_shape` and the next computation, or after an event
     props: GProp_GProps,
         properties of the global model
     cg [m]: float,
@@ -30,7 +39,7 @@ class OCCGeometry(System):
         Inertia matrix
     """
 
-    def setup(self, shapes=None, properties=None):
+    def setup(self, shapes=None, properties=None, lazy=False):
 
         if shapes is None:
             shapes = []
@@ -39,6 +48,7 @@ class OCCGeometry(System):
 
         self.add_property("shapes", shapes)
         self.add_property("properties", properties)
+        self.add_property("lazy", lazy)
 
         for shape in shapes:
             self.add_inward(
@@ -49,6 +59,9 @@ class OCCGeometry(System):
             )
         for props in properties:
             self.add_inward(props, GProp_GProps(), desc=f"Properties of the {props}")
+        self.add_inward(
+            "attached", np.ones(len(properties), dtype=bool), desc="Attached components"
+        )
 
         self.add_outward(
             "shape",
@@ -64,13 +77,11 @@ class OCCGeometry(System):
     def compute(self):
 
         self.props = GProp_GProps()
-        for props in self.properties:
-            self.props.Add(self[props])
+        for props, attached in zip(self.properties, self.attached):
+            if attached:
+                self.props.Add(self[props])
 
-        try:
-            self.shape = self.fusion(self.shapes)
-        except TypeError:
-            pass
+        self.update_shape(self.fuse_attached, force=not self.lazy)
 
         self.weight = self.props.Mass()
         self.cg = self.props.CentreOfMass().Z()
@@ -79,11 +90,27 @@ class OCCGeometry(System):
         for i, j in zip(range(3), range(3)):
             self.I[i, j] = inertia.Value(i + 1, j + 1)
 
-    def fusion(self, shapes):
+    def transition(self):
+
+        if self.lazy:
+            self.request_shape()
 
-        shape_list = shapes.copy()
-        fusion = self[shape_list.pop(0)]
-        for shape in shape_list:
-            fusion = BRepAlgoAPI_Fuse(fusion, self[shape]).Shape()
+    def fuse_attached(self):
+        """Fuse the shapes of the attached components.
+
+        Keep the current shape if they are not all built yet, or return an empty compound if
+        none is attached.
+        """
+        shapes = [shape for shape, attached in zip(self.shapes, self.attached) if attached]
+        if not shapes:
+            compound = TopoDS_Compound()
+            BRep_Builder().MakeCompound(compound)
+            return compound
+        try:
+            return self.fusion(shapes)
+        except TypeError:
+            return self.shape
+
+    def fusion(self, shapes):
 
-        return fusion
+        return fuse_shapes([self[shape] for shape in shapes])
@@ -1,8 +1,11 @@
+import numpy as np
 from cosapp.base import System
-from OCC.Core.GProp import GProp_GProps
 
-from rocket_twin.systems import Dynamics, RocketControllerCoSApp
-from rocket_twin.systems.rocket import OCCGeometry, Stage
+from rocket_twin.systems import Dynamics, RocketControllerCoSApp, VectorDynamics
+from rocket_twin.systems.mass import MassGeometry
+from rocket_twin.systems.rocket import Stage
+from rocket_twin.utils import IndexConnector
+from rocket_twin.utils.shapes import geometry_backend
 
 
 class Rocket(System):
@@ -14,6 +17,15 @@ class Rocket(System):
         whether the rocket is already flying or still on ground
     n_stages: int,
         how many stages the rocket has
+    lazy: boolean,
+        if True, the stage and rocket shapes are only fused on request and at events
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models
+        only built on request, "analytic" for mass models without pyoccad
+    dynamics: string,
+        "scalar" for one named inward per force, "vector" for forces and weights stored in arrays
+    attached: np.ndarray[bool],
+        whether each stage still belongs to the rocket
 
     Values
     ------
@@ -30,7 +42,11 @@ class Rocket(System):
         rocket acceleration
     """
 
-    def setup(self, n_stages=1):
+    def setup(self, n_stages=1, lazy=False, geometry="occ", dynamics="scalar"):
+
+        backend = geometry_backend(geometry)
+        if dynamics not in ("scalar", "vector"):
+            raise ValueError(f"Unknown dynamics {dynamics!r}")
 
         shapes, properties, forces = ([None] * n_stages for i in range(3))
 
@@ -47,7 +63,7 @@ class Rocket(System):
                 nose = True
 
             self.add_child(
-                Stage(f"stage_{i}", nose=nose, wings=wings),
+                Stage(f"stage_{i}", nose=nose, wings=wings, lazy=lazy, geometry=geometry),
                 pulling={
                     "w_in": f"w_in_{i}",
                     "weight_prop": f"weight_prop_{i}",
@@ -62,8 +78,26 @@ class Rocket(System):
             execution_index=0,
             pulling=["flying"],
         )
-        self.add_child(OCCGeometry("geom", shapes=shapes, properties=properties))
-        self.add_child(Dynamics("dyn", forces=forces, weights=["weight_rocket"]), pulling=["a"])
+        # Dropped stages stay in the tree, they are masked out of the geometry and dynamics
+        if backend is None:
+            self.add_child(MassGeometry("geom", properties=properties), pulling=["attached"])
+        else:
+            # pyoccad is only imported when a pyoccad model is requested
+            from rocket_twin.systems.rocket import OCCGeometry
+
+            self.add_child(
+                OCCGeometry("geom", shapes=shapes, properties=properties, lazy=lazy),
+                pulling=["attached"],
+            )
+        if dynamics == "vector":
+            self.add_child(
+                VectorDynamics("dyn", forces=forces, weights=["weight_rocket"]),
+                pulling=["a", "attached"],
+            )
+        else:
+            self.add_child(
+                Dynamics("dyn", forces=forces, weights=["weight_rocket"]), pulling=["a", "attached"]
+            )
 
         for i in range(1, n_stages + 1):
             self.connect(
@@ -75,9 +109,25 @@ class Rocket(System):
                 {"weight_prop": f"weight_prop_{i}"},
             )
             self.connect(self[f"stage_{i}"].outwards, self.geom.inwards, {"props": f"stage_{i}"})
-            self.connect(self[f"stage_{i}"].outwards, self.dyn.inwards, {"thrust": f"thrust_{i}"})
-
-        self.connect(self.geom.outwards, self.dyn.inwards, {"weight": "weight_rocket"})
+            if dynamics == "vector":
+                self.connect(
+                    self[f"stage_{i}"].outwards,
+                    self.dyn.inwards,
+                    {"thrust": "F"},
+                    cls=IndexConnector,
+                    index=(i - 1, 2),
+                )
+            else:
+                self.connect(
+                    self[f"stage_{i}"].outwards, self.dyn.inwards, {"thrust": f"thrust_{i}"}
+                )
+
+        if dynamics == "vector":
+            self.connect(
+                self.geom.outwards, self.dyn.inwards, {"weight": "m"}, cls=IndexConnector, index=0
+            )
+        else:
+            self.connect(self.geom.outwards, self.dyn.inwards, {"weight": "weight_rocket"})
 
     def compute(self):
         self.a *= self.flying
@@ -86,8 +136,24 @@ class Rocket(System):
 
         if self.controller.drop.present:
             if self.stage < self.n_stages:
-                stage = self.pop_child(f"stage_{self.stage}")
-                self.add_child(stage, execution_index=self.stage - 1)
-                self.geom[f"stage_{self.stage}"] = GProp_GProps()
-                self.dyn[f"thrust_{self.stage}"] = 0.0
+                self.drop_stage(self.stage)
                 self.stage += 1
+
+    def drop_stage(self, i):
+        """Remove the stage `i` from the geometry and the dynamics of the rocket."""
+        attached = self.attached.copy()
+        attached[i - 1] = False
+        self.attached = attached
+
+    def get_topology(self):
+        """Return the number of dropped stages."""
+        return {"dropped": self.stage - 1}
+
+    def set_topology(self, topology):
+        """Attach the stages of the rocket after the dropped ones, detach the other ones.
+
+        The number of dropped stages is the one given by `get_topology`.
+        """
+        dropped = topology["dropped"]
+        self.attached = np.arange(self.n_stages) >= dropped
+        self.stage = dropped + 1
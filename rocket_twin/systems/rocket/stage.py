@@ -1,7 +1,8 @@
 from cosapp.base import System
 
-from rocket_twin.systems import Engine, NoseGeom, StageControllerCoSApp, Tank, TubeGeom, WingsGeom
-from rocket_twin.systems.rocket import OCCGeometry
+from rocket_twin.systems import Engine, StageControllerCoSApp, Tank
+from rocket_twin.systems.mass import MassGeometry, NoseMass, TubeMass, WingsMass
+from rocket_twin.utils.shapes import geometry_backend
 
 
 class Stage(System):
@@ -11,6 +12,11 @@ class Stage(System):
     ------
     is_on: float,
         whether the stage is on or not
+    lazy: boolean,
+        if True, the stage shape is only fused on request and at events
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models
+        only built on request, "analytic" for mass models without pyoccad
 
     Outputs
     ------
@@ -24,35 +30,54 @@ class Stage(System):
         how much fuel the stage has
     """
 
-    def setup(self, nose=False, wings=False):
+    def setup(self, nose=False, wings=False, lazy=False, geometry="occ"):
+
+        backend = geometry_backend(geometry)
 
         shapes = ["tank_s", "engine_s", "tube_s"]
         properties = ["tank", "engine", "tube"]
 
+        if backend is None:
+            components = {"tube": TubeMass, "nose": NoseMass, "wings": WingsMass}
+            options = {}
+        else:
+            # pyoccad is only imported when a pyoccad model is requested
+            from rocket_twin.systems import NoseGeom, TubeGeom, WingsGeom
+
+            components = {"tube": TubeGeom, "nose": NoseGeom, "wings": WingsGeom}
+            options = {"backend": backend}
+
         self.add_child(StageControllerCoSApp("controller"), pulling=["is_on"])
-        self.add_child(Tank("tank"), pulling=["w_in", "weight_prop"])
-        self.add_child(Engine("engine"), pulling={"force": "thrust"})
-        self.add_child(TubeGeom("tube"))
+        self.add_child(Tank("tank", geometry=geometry), pulling=["w_in", "weight_prop"])
+        self.add_child(Engine("engine", geometry=geometry), pulling={"force": "thrust"})
+        self.add_child(components["tube"]("tube", **options))
 
         if nose:
-            self.add_child(NoseGeom("nose"))
+            self.add_child(components["nose"]("nose", **options))
             shapes.append("nose_s")
             properties.append("nose")
 
         if wings:
-            self.add_child(WingsGeom("wings"))
+            self.add_child(components["wings"]("wings", **options))
             shapes.append("wings_s")
             properties.append("wings")
 
-        self.add_child(
-            OCCGeometry("geom", shapes=shapes, properties=properties), pulling=["shape", "props"]
-        )
-
         self.connect(self.controller.outwards, self.tank.inwards, {"w": "w_command"})
         self.connect(self.tank.outwards, self.engine.inwards, {"w_out": "w_out"})
         self.connect(self.tank.outwards, self.controller.inwards, ["weight_prop", "weight_max"])
 
-        for prop in properties:
-            self.connect(
-                self[prop].outwards, self.geom.inwards, {"shape": prop + "_s", "props": prop}
+        if backend is None:
+            self.add_child(MassGeometry("geom", properties=properties), pulling=["props"])
+            for prop in properties:
+                self.connect(self[prop].outwards, self.geom.inwards, {"props": prop})
+        else:
+            from rocket_twin.systems.rocket import OCCGeometry
+
+            self.add_child(
+                OCCGeometry("geom", shapes=shapes, properties=properties, lazy=lazy),
+                pulling=["shape", "props"],
             )
+            for prop in properties:
+                self.connect(
+                    self[prop].outwards, self.geom.inwards, {"shape": prop + "_s", "props": prop}
+                )
@@ -1,3 +1,8 @@
-from rocket_twin.systems.station.station import Station
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = ["Station"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "Station": "rocket_twin.systems.station.station",
+    },
+)
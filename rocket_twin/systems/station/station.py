@@ -1,10 +1,13 @@
 from cosapp.base import System
 
-from rocket_twin.systems import Pipe, Rocket, StationControllerCoSApp, Tank
+from rocket_twin.systems import Manifold, Rocket, StationControllerCoSApp, Tank
 
 
 class Station(System):
-    """A space station composed by a rocket, a tank, a pipe connecting them and a controller.
+    """A space station composed by a rocket, a tank, a manifold connecting them and a controller.
+
+    The manifold feeds the fuel inlet of one stage at a time, the next stage is selected by
+    its `outlet` index when a stage is full.
 
     Inputs
     ------
@@ -16,12 +19,17 @@ class Station(System):
         interval between fueling end and launch
     time_lnc [s]: float,
         rocket launch time
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models
+        only built on request, "analytic" for mass models without pyoccad
+    dynamics: string,
+        "scalar" or "vector" dynamics model of the rocket
 
     Outputs
     ------
     """
 
-    def setup(self, n_stages=1):
+    def setup(self, n_stages=1, geometry="occ", dynamics="scalar"):
 
         self.add_inward("n_stages", n_stages, desc="Number of stages")
         self.add_outward("stage", 1, desc="Current stage")
@@ -31,12 +39,16 @@ class Station(System):
         self.add_inward("time_lnc", 100000.0, desc="Launch time", unit="s")
 
         self.add_child(StationControllerCoSApp("controller"), pulling=["fueling"])
-        self.add_child(Tank("g_tank"))
-        self.add_child(Pipe("pipe"))
-        self.add_child(Rocket("rocket", n_stages=n_stages))
+        self.add_child(Tank("g_tank", geometry=geometry))
+        self.add_child(Manifold("manifold", n_outlets=n_stages))
+        self.add_child(Rocket("rocket", n_stages=n_stages, geometry=geometry, dynamics=dynamics))
 
-        self.connect(self.g_tank.outwards, self.pipe.inwards, {"w_out": "w_in"})
-        self.connect(self.pipe.outwards, self.rocket.inwards, {"w_out": "w_in_1"})
+        self.connect(self.g_tank.outwards, self.manifold.inwards, {"w_out": "w_in"})
+        self.connect(
+            self.manifold.outwards,
+            self.rocket.inwards,
+            {f"w_out_{i}": f"w_in_{i}" for i in range(1, n_stages + 1)},
+        )
 
         self.connect(self.controller.outwards, self.g_tank.inwards, {"w": "w_command"})
 
@@ -49,16 +61,8 @@ class Station(System):
         for i in range(1, self.n_stages + 1):
             if self.rocket[f"stage_{i}"].controller.full.present:
                 if self.stage < self.n_stages:
-                    self.pop_child("pipe")
-                    self.add_child(Pipe("pipe"), execution_index=2)
-
-                    self.connect(self.g_tank.outwards, self.pipe.inwards, {"w_out": "w_in"})
-                    self.connect(
-                        self.pipe.outwards, self.rocket.inwards, {"w_out": f"w_in_{self.stage + 1}"}
-                    )
-
-                    self.rocket[f"w_in_{self.stage}"] = 0.0
                     self.stage += 1
+                    self.manifold.outlet = self.stage
                 else:
                     self.time_lnc = self.time + self.time_int
                     self.fueling = False
@@ -67,3 +71,11 @@ class Station(System):
         if self.launch.present:
             self.rocket.flying = True
             self.rocket.controller.is_on_1 = True
+
+    def get_topology(self):
+        """Return the stage whose fuel inlet is fed by the manifold."""
+        return {"inlet": int(self.manifold.outlet)}
+
+    def set_topology(self, topology):
+        """Feed the fuel inlet given by `get_topology`."""
+        self.manifold.outlet = topology["inlet"]
@@ -1,5 +1,10 @@
-from rocket_twin.systems.structure.nose_geom import NoseGeom
-from rocket_twin.systems.structure.tube_geom import TubeGeom
-from rocket_twin.systems.structure.wings_geom import WingsGeom
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = ["NoseGeom", "TubeGeom", "WingsGeom"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "NoseGeom": "rocket_twin.systems.structure.nose_geom",
+        "TubeGeom": "rocket_twin.systems.structure.tube_geom",
+        "WingsGeom": "rocket_twin.systems.structure.wings_geom",
+    },
+)
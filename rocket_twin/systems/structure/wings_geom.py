@@ -1,28 +1,37 @@
 import numpy as np
 from cosapp.base import System
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.gp import gp_Pnt, gp_Vec
 from OCC.Core.GProp import GProp_GProps
 from OCC.Core.TopoDS import TopoDS_Compound
 from pyoccad.create import CreateEdge, CreateExtrusion, CreateFace, CreateTopology, CreateWire
 
+from rocket_twin.utils.fusion import fuse_shapes
+from rocket_twin.utils.geometry_cache import geometry_cache
+from rocket_twin.utils.mass_properties import geometry_key, wings_properties
+from rocket_twin.utils.shapes import LazyShape
 
-class WingsGeom(System):
+
+class WingsGeom(LazyShape, System):
     """Pyoccad model of a set of wings.
 
     Inputs
     ------
+    backend: string,
+        "occ" to compute properties from the pyoccad model, "analytic" to use closed-form
+        formulas and only build the model on request
 
     Outputs
     ------
     shape: TopoDS_Compound,
-        pyoccad model
+        pyoccad model, only built on request with the analytic backend
     props: GProp_GProps,
         model properties
     """
 
-    def setup(self):
+    def setup(self, backend="occ"):
+
+        self.add_backend(backend)
 
         # Geometric parameters
         self.add_inward("n", 4, desc="Number of wings", unit="")
@@ -44,14 +53,30 @@ class WingsGeom(System):
 
     def compute(self):
 
-        self.shape = self.create_wings(
-            self.n, self.radius, self.pos, self.l_in, self.l_out, self.width, self.th
-        )
-        vprop = GProp_GProps()
-        brepgprop.VolumeProperties(self.shape, vprop)
+        key = geometry_key("wings", self)
+
+        if self.backend == "analytic":
+            self.props = (wings_properties(self) * self.rho).to_gprops()
+            self.update_shape(lambda: geometry_cache.get(key, self.create_volume)[0])
+            return
+
+        self.shape, vprop = geometry_cache.get(key, self.create_volume)
         self.props = GProp_GProps()
         self.props.Add(vprop, self.rho)
 
+    def create_volume(self):
+        """Create the pyoccad model and its volume properties from the current inwards."""
+        shape = self.create_shape()
+        vprop = GProp_GProps()
+        brepgprop.VolumeProperties(shape, vprop)
+        return shape, vprop
+
+    def create_shape(self):
+        """Create the pyoccad model of the wings from the current inwards."""
+        return self.create_wings(
+            self.n, self.radius, self.pos, self.l_in, self.l_out, self.width, self.th
+        )
+
     def create_wings(self, n_wings, radius, pos, l_in, l_out, width, th):
         """Create a pyoccad model of a set of wings.
 
@@ -79,6 +104,37 @@ class WingsGeom(System):
             pyoccad model of the set of wings
         """
 
+        shapes = self.create_wing_solids(n_wings, radius, pos, l_in, l_out, width, th)
+
+        return fuse_shapes(shapes)
+
+    def create_wing_solids(self, n_wings, radius, pos, l_in, l_out, width, th):
+        """Create the pyoccad models of each wing of a set, without fusing them.
+
+        Inputs
+        ------
+        n_wings: int,
+            the number of wings
+        radius: float,
+            the distance of the internal edges to the center
+        pos: float,
+            the lower edges' z-coordinate
+        l_in: float,
+            the length of the inner edges
+        l_out: float,
+            the length of the outer edges
+        width: float,
+            width
+        th: float,
+            thickness
+
+        Outputs
+        ------
+
+        shapes: list[TopoDS_Solid],
+            pyoccad model of each wing
+        """
+
         theta = 2 * np.pi / n_wings
         shapes = [None] * n_wings
 
@@ -101,9 +157,4 @@ class WingsGeom(System):
             shell = CreateExtrusion().surface(face, gp_Vec(-th * np.sin(ang), th * np.cos(ang), 0))
             shapes[i] = CreateTopology().make_solid(shell)
 
-        fusion = BRepAlgoAPI_Fuse(shapes[0], shapes[1]).Shape()
-
-        for i in range(2, n_wings):
-            fusion = BRepAlgoAPI_Fuse(fusion, shapes[i]).Shape()
-
-        return fusion
+        return shapes
@@ -1,7 +1,12 @@
-from rocket_twin.systems.tank.pipe import Pipe
-from rocket_twin.systems.tank.tank_fuel import TankFuel
-from rocket_twin.systems.tank.tank_geom import TankGeom
+from rocket_twin.utils.lazy import lazy_module
 
-from rocket_twin.systems.tank.tank import Tank  # isort: skip
-
-__all__ = ["TankFuel", "TankGeom", "Tank", "Pipe"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "TankFuel": "rocket_twin.systems.tank.tank_fuel",
+        "TankGeom": "rocket_twin.systems.tank.tank_geom",
+        "Tank": "rocket_twin.systems.tank.tank",
+        "Pipe": "rocket_twin.systems.tank.pipe",
+        "Manifold": "rocket_twin.systems.tank.manifold",
+    },
+)
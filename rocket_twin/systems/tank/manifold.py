@@ -0,0 +1,37 @@
+from cosapp.base import System
+
+
+class Manifold(System):
+    """A pipe routing a fuel flow to one of several outlets.
+
+    The fed outlet is chosen by an index, so that a station switches from a receiving tank
+    to the next one by a value change, without replacing pipes or connectors.
+
+    Inputs
+    ------
+    n_outlets: int,
+        how many outlets the manifold has
+    w_in [kg/s]: float,
+        mass flow of fuel entering the manifold
+    outlet: int,
+        index of the fed outlet, from 1 to n_outlets; 0 closes every outlet
+
+    Outputs
+    ------
+    w_out_i [kg/s]: float,
+        mass flow of fuel exiting the i-th outlet
+    """
+
+    def setup(self, n_outlets=1):
+
+        self.add_inward("n_outlets", n_outlets, desc="Number of outlets")
+        self.add_inward("w_in", 0.0, desc="Fuel income rate", unit="kg/s")
+        self.add_inward("outlet", 1, desc="Fed outlet")
+
+        for i in range(1, n_outlets + 1):
+            self.add_outward(f"w_out_{i}", 0.0, desc=f"Fuel exit rate of outlet {i}", unit="kg/s")
+
+    def compute(self):
+
+        for i in range(1, self.n_outlets + 1):
+            self[f"w_out_{i}"] = self.w_in if i == self.outlet else 0.0
@@ -1,6 +1,8 @@
 from cosapp.base import System
 
-from rocket_twin.systems.tank import TankFuel, TankGeom
+from rocket_twin.systems.mass import TankMass
+from rocket_twin.systems.tank import TankFuel
+from rocket_twin.utils.shapes import geometry_backend
 
 
 class Tank(System):
@@ -12,6 +14,9 @@ class Tank(System):
         mass flow of fuel entering the tank
     w_command: float,
         fuel exit flux control. 0 means tank exit fully closed, 1 means fully open
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models
+        only built on request, "analytic" for mass models without pyoccad
 
     Outputs
     ------
@@ -27,9 +32,20 @@ class Tank(System):
         model properties
     """
 
-    def setup(self):
+    def setup(self, geometry="occ"):
+
+        backend = geometry_backend(geometry)
 
         self.add_child(TankFuel("fuel"), pulling=["w_out", "w_in", "w_command", "weight_prop"])
-        self.add_child(TankGeom("geom"), pulling=["shape", "props", "weight_max"])
+
+        if backend is None:
+            self.add_child(TankMass("geom"), pulling=["props", "weight_max"])
+        else:
+            # pyoccad is only imported when a pyoccad model is requested
+            from rocket_twin.systems.tank import TankGeom
+
+            self.add_child(
+                TankGeom("geom", backend=backend), pulling=["shape", "props", "weight_max"]
+            )
 
         self.connect(self.fuel.outwards, self.geom.inwards, ["weight_prop"])
@@ -1,5 +1,6 @@
 import numpy as np
 from cosapp.base import System
+from OCC.Core.BRep import BRep_Builder
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
 from OCC.Core.BRepGProp import brepgprop
 from OCC.Core.gp import gp_Pnt, gp_Vec
@@ -7,22 +8,31 @@ from OCC.Core.GProp import GProp_GProps
 from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Solid
 from pyoccad.create import CreateCircle, CreateCylinder, CreateExtrusion, CreateFace, CreateSphere
 
+from rocket_twin.utils.geometry_cache import geometry_cache
+from rocket_twin.utils.mass_properties import cylinder, geometry_key, tank_properties
+from rocket_twin.utils.shapes import LazyShape
 
-class TankGeom(System):
+
+class TankGeom(LazyShape, System):
     """Pyoccad model of the tank structure and fuel.
 
     Inputs
     ------
+    backend: string,
+        "occ" to compute properties from the pyoccad model, "analytic" to use closed-form
+        formulas and only build the model on request
 
     Outputs
     ------
     shape: TopoDS_Solid,
-        pyoccad model
+        pyoccad model, only built on request with the analytic backend
     props: GProp_GProps,
         model properties
     """
 
-    def setup(self):
+    def setup(self, backend="occ"):
+
+        self.add_backend(backend)
 
         # Structure parameters
         self.add_inward("r_int", 0.8, desc="internal radius", unit="m")
@@ -52,24 +62,70 @@ class TankGeom(System):
 
         self.weight_max = np.pi * self.r_int**2 * self.height * self.rho_fuel
 
+        # The structure only depends on these inwards, only the fuel column changes in time
+        key = geometry_key("tank", self)
+
+        height_fuel = self.weight_prop / (np.pi * self.r_int**2 * self.rho_fuel)
+        fuel_prop = cylinder(self.r_int, height_fuel, self.pos) * self.rho_fuel
+
+        if self.backend == "analytic":
+            self.props = (tank_properties(self) * self.rho_struct + fuel_prop).to_gprops()
+            self.update_shape(self.create_shape)
+            return
+
+        shape_struct, struct_prop = geometry_cache.get(key, self.create_structure_volume)
+        self.shape = self.assemble(shape_struct, self.create_fuel())
+
+        self.props = GProp_GProps()
+        self.props.Add(fuel_prop.to_gprops())
+        self.props.Add(struct_prop, self.rho_struct)
+
+    def create_structure_volume(self):
+        """Create the pyoccad model of the structure and its volume properties."""
+        shape = self.create_structure(self.r_int, self.r_ext, self.height, self.thickness, self.pos)
+        vprop = GProp_GProps()
+        brepgprop.VolumeProperties(shape, vprop)
+        return shape, vprop
+
+    def create_fuel(self):
+        """Create the pyoccad model of the fuel from the current inwards."""
         height_fuel = self.weight_prop / (np.pi * self.r_int**2 * self.rho_fuel) + 0.00000001
 
-        shape_struct = self.create_structure(
-            self.r_int, self.r_ext, self.height, self.thickness, self.pos
-        )
-        shape_fuel = CreateCylinder.from_base_and_dir(
+        return CreateCylinder.from_base_and_dir(
             gp_Pnt(0, 0, self.pos + 0.000000001), gp_Vec(0, 0, height_fuel), self.r_int
         )
-        self.shape = BRepAlgoAPI_Fuse(shape_struct, shape_fuel).Shape()
 
-        fuel_prop = GProp_GProps()
-        struct_prop = GProp_GProps()
-        brepgprop.VolumeProperties(shape_struct, struct_prop)
-        brepgprop.VolumeProperties(shape_fuel, fuel_prop)
+    def create_shape(self):
+        """Create the pyoccad model of the tank from the current inwards."""
+        key = geometry_key("tank", self)
+        shape_struct = geometry_cache.get(key, self.create_structure_volume)[0]
+        return self.assemble(shape_struct, self.create_fuel())
 
-        self.props = GProp_GProps()
-        self.props.Add(fuel_prop, self.rho_fuel)
-        self.props.Add(struct_prop, self.rho_struct)
+    def assemble(self, shape_struct, shape_fuel):
+        """Gather the structure and the fuel in a compound.
+
+        The fuel lies inside the structure without touching it, so a compound gives the same
+        model as a boolean fusion at a fraction of the cost.
+
+        Inputs
+        ------
+        shape_struct: TopoDS_Solid,
+            pyoccad model of the structure
+        shape_fuel: TopoDS_Solid,
+            pyoccad model of the fuel
+
+        Outputs
+        ------
+        tank: TopoDS_Compound,
+            pyoccad model of the tank
+        """
+        tank = TopoDS_Compound()
+        builder = BRep_Builder()
+        builder.MakeCompound(tank)
+        builder.Add(tank, shape_struct)
+        builder.Add(tank, shape_fuel)
+
+        return tank
 
     def create_structure(self, r_int, r_ext, height, thickness, pos):
         """Create a pyoccad model of an empty cylindrical tank.
@@ -0,0 +1,97 @@
+import numpy as np
+from cosapp.base import System
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.drivers import AdaptiveRungeKutta, FuelingRocket, VerticalFlyingRocket
+from rocket_twin.systems import Station
+
+
+class Decay(System):
+    def setup(self):
+        self.add_inward("k", 1.0)
+        self.add_inward("x", 1.0)
+        self.add_transient("x", der="-k * x")
+
+
+class TestAdaptiveRungeKutta:
+    """Tests for the adaptive time driver."""
+
+    def test_accuracy(self):
+        sys = Decay("sys")
+
+        driver = sys.add_driver(AdaptiveRungeKutta("rk", dt=0.01, rtol=1e-8, atol=1e-10))
+        driver.time_interval = (0, 10)
+        driver.set_scenario(init={"x": 1.0})
+        driver.add_recorder(DataFrameRecorder(includes=["x"]))
+
+        sys.run_drivers()
+
+        data = driver.recorder.export_data()
+        time = np.asarray(data["time"])
+
+        np.testing.assert_allclose(data["x"], np.exp(-time), rtol=10 ** (-6))
+        assert driver.statistics["accepted"] < 200
+        assert driver.statistics["rejected"] < driver.statistics["accepted"]
+
+    def test_reset(self):
+        sys = Decay("sys")
+
+        driver = sys.add_driver(AdaptiveRungeKutta("rk", dt=0.01))
+        driver.time_interval = (0, 10)
+        driver.set_scenario(init={"x": 1.0})
+
+        sys.run_drivers()
+        statistics = driver.statistics.copy()
+        sys.run_drivers()
+
+        assert driver.statistics == statistics
+        assert driver.dt > 0.01
+
+    def test_mission(self):
+        includes = ["rocket.a", "g_tank.weight_prop", "rocket.stage_1.weight_prop"]
+        fueling = {
+            "rocket.stage_1.tank.fuel.weight_p": 0.0,
+            "g_tank.fuel.weight_p": 10.0,
+            "g_tank.w_in": 0.0,
+            "g_tank.fuel.w_out_max": 3.0,
+        }
+        flight = {"rocket.stage_1.tank.fuel.w_out_max": 3.0}
+
+        results = {}
+        for adaptive in (False, True):
+            sys = Station("sys", geometry="analytic")
+
+            fr = FuelingRocket(
+                "fr",
+                owner=sys,
+                init=fueling,
+                stop="rocket.flying == 1.",
+                includes=includes,
+                adaptive=adaptive,
+            )
+            sys.add_driver(fr)
+            sys.run_drivers()
+            np.testing.assert_allclose(sys.rocket.stage_1.weight_prop, 5.0, atol=10 ** (-10))
+            np.testing.assert_allclose(sys.g_tank.weight_prop, 5.0, atol=10 ** (-10))
+
+            sys.drivers.clear()
+            vfr = VerticalFlyingRocket(
+                "vfr",
+                owner=sys,
+                init=flight,
+                stop="rocket.stage_1.tank.weight_prop <= 0.",
+                includes=includes,
+                adaptive=adaptive,
+            )
+            sys.add_driver(vfr)
+            sys.run_drivers()
+
+            acel = np.asarray(vfr.data["rocket.a"])
+            np.testing.assert_allclose(acel[-2], 65.0, atol=10 ** (-10))
+            np.testing.assert_allclose(sys.rocket.stage_1.weight_prop, 0.0, atol=10 ** (-10))
+
+            results[adaptive] = fr.statistics["steps"] + vfr.statistics["steps"]
+            if not adaptive:
+                assert fr.statistics["evaluations"] == fr.rk.order * fr.statistics["steps"]
+
+        assert results[True] < results[False] / 5
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from rocket_twin.drivers import Mission
+from rocket_twin.systems import Rocket, Station
+
+
+class TestAnalyticGeometry:
+    """Tests for the geometry-free rocket models."""
+
+    def test_no_occ_import(self):
+        code = (
+            "import sys\n"
+            "from rocket_twin.systems import Station\n"
+            "Station('sys', n_stages=2, geometry='analytic').run_once()\n"
+            "assert not any(m.split('.')[0] in ('OCC', 'pyoccad') for m in sys.modules)\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_same_mass(self):
+        occ = Rocket("occ", n_stages=3)
+        hybrid = Rocket("hybrid", n_stages=3, geometry="hybrid")
+        analytic = Rocket("analytic", n_stages=3, geometry="analytic")
+
+        for rocket in (occ, hybrid, analytic):
+            rocket.stage_1.tank.fuel.weight_p = 2.0
+            rocket.run_once()
+
+        for rocket in (hybrid, analytic):
+            np.testing.assert_allclose(rocket.geom.weight, occ.geom.weight, rtol=10 ** (-6))
+            np.testing.assert_allclose(rocket.geom.cg, occ.geom.cg, rtol=10 ** (-6))
+            for i in range(3):
+                np.testing.assert_allclose(rocket.geom.I[i, i], occ.geom.I[i, i], rtol=10 ** (-4))
+
+    def test_unknown_geometry(self):
+        with pytest.raises(ValueError):
+            Rocket("sys", geometry="brep")
+
+    def test_mission(self):
+        sys = Station("sys", geometry="analytic")
+
+        init = {
+            "rocket.stage_1.tank.fuel.weight_p": 0.0,
+            "g_tank.fuel.weight_p": 10.0,
+            "g_tank.w_in": 0.0,
+            "g_tank.fuel.w_out_max": 3.0,
+        }
+
+        stop = "rocket.stage_1.tank.weight_prop <= 0."
+
+        sys.add_driver(
+            Mission("mission", owner=sys, init=init, stop=stop, includes=["rocket.a"], dt=1.0)
+        )
+
+        sys.run_drivers()
+
+        acel = np.asarray(sys.drivers["mission"].data["rocket.a"])
+
+        np.testing.assert_allclose(acel[-2], 65.0, atol=10 ** (-10))
+        np.testing.assert_allclose(sys.rocket.stage_1.tank.weight_prop, 0.0, atol=10 ** (-10))
+        np.testing.assert_allclose(sys.g_tank.weight_prop, 5.0, atol=10 ** (-10))
@@ -0,0 +1,62 @@
+import numpy as np
+from cosapp.drivers import NonLinearSolver, RungeKutta
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.systems import Rocket
+from rocket_twin.utils import BatchFlight
+
+
+class TestBatchFlight:
+    """Tests for the batched flight integrator."""
+
+    def test_cosapp(self):
+        sys = Rocket("sys", n_stages=2, geometry="analytic")
+
+        init = {
+            "flying": True,
+            "controller.is_on_1": True,
+            "stage_1.tank.fuel.weight_p": 5.0,
+            "stage_2.tank.fuel.weight_p": 4.0,
+            "stage_1.tank.fuel.w_out_max": 2.0,
+            "stage_2.tank.fuel.w_out_max": 1.0,
+        }
+        for var, value in init.items():
+            sys[var] = value
+        sys.run_once()
+
+        batch = BatchFlight.from_rocket(sys, n_cases=3)
+        data = batch.run(8.0, 0.5)
+
+        includes = ["a", "geom.weight", "stage_2.weight_prop"]
+        driver = sys.add_driver(RungeKutta("rk", order=4, dt=0.5))
+        driver.add_child(NonLinearSolver("solver"))
+        driver.time_interval = (0, 8)
+        driver.set_scenario(init=init)
+        driver.add_recorder(DataFrameRecorder(includes=includes), period=0.5)
+
+        sys.run_drivers()
+
+        # Keep the state after the events of each time
+        ref = driver.recorder.export_data().groupby("time").last()
+
+        for i in range(3):
+            np.testing.assert_allclose(data["a"][:, i], ref["a"], atol=10 ** (-10))
+            np.testing.assert_allclose(data["weight"][:, i], ref["geom.weight"], atol=10 ** (-10))
+            np.testing.assert_allclose(
+                data["weight_prop"][:, i, 1], ref["stage_2.weight_prop"], atol=10 ** (-10)
+            )
+        np.testing.assert_array_equal(data["stage"][-1], 1)
+
+    def test_velocity(self):
+        w_out = np.array([[1.0], [2.0], [3.0]])
+        batch = BatchFlight(weight_dry=4.0, weight_prop=6.0, w_out_max=w_out, isp=20.0)
+
+        data = batch.run(1.5, 0.01)
+
+        # Tsiolkovsky equation with gravity loss
+        time = data["time"][:, None]
+        weight = 10.0 - w_out.T * time
+        v = 200.0 * np.log(10.0 / weight) - 10.0 * time
+
+        np.testing.assert_allclose(data["v"], v, rtol=10 ** (-8))
+        np.testing.assert_allclose(data["weight"], weight, atol=10 ** (-10))
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from rocket_twin.drivers import Mission
+from rocket_twin.systems import Station
+from rocket_twin.utils import run_branches
+
+INIT = {
+    "rocket.stage_1.tank.fuel.weight_p": 0.0,
+    "g_tank.fuel.weight_p": 10.0,
+    "g_tank.w_in": 0.0,
+    "g_tank.fuel.w_out_max": 3.0,
+}
+
+STOP = "rocket.stage_1.tank.weight_prop <= 0."
+
+
+class TestBranches:
+    """Tests for the flights branching from a shared fueling."""
+
+    def test_variants(self):
+        variants = pd.DataFrame(
+            {
+                "rocket.stage_1.tank.fuel.w_out_max": [3.0, 1.0, 3.0, 3.0],
+                "rocket.stage_1.engine.perfo.isp": [20.0, 20.0, 30.0, 20.0],
+                "stop": [None, None, None, "rocket.stage_1.tank.weight_prop <= 2."],
+            },
+            index=pd.Index(["ref", "slow", "isp", "short"], name="variant"),
+        )
+
+        fueling, flights = run_branches(
+            variants,
+            init=INIT,
+            stop=STOP,
+            includes=["rocket.a", "rocket.stage_1.tank.weight_prop"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+            workers=2,
+        )
+
+        sys = Station("sys", geometry="analytic")
+        sys.add_driver(
+            Mission("mission", owner=sys, init=INIT, stop=STOP, includes=["rocket.a"], dt=1.0)
+        )
+        sys.run_drivers()
+        mission = sys.drivers["mission"]
+
+        assert flights.index.names == ["variant", "record"]
+        assert flights["error"].isna().all()
+        np.testing.assert_allclose(fueling["rocket.a"], mission.children["fr"].data["rocket.a"])
+
+        acel = flights["rocket.a"]
+        weight = flights["rocket.stage_1.tank.weight_prop"]
+
+        np.testing.assert_allclose(acel["ref"], mission.children["vfr"].data["rocket.a"])
+        np.testing.assert_allclose(acel["ref"].iloc[-2], 65.0, atol=10 ** (-10))
+        assert len(acel["slow"]) > len(acel["ref"])
+        assert acel["isp"].iloc[-2] > acel["ref"].iloc[-2]
+        np.testing.assert_allclose(weight["short"].iloc[-1], 2.0, atol=10 ** (-10))
+
+    def test_failure(self):
+        variants = pd.DataFrame({"rocket.stage_1.tank.fuel.w_out_max": [3.0, "unknown"]})
+
+        fueling, flights = run_branches(
+            variants,
+            init=INIT,
+            stop=STOP,
+            includes=["rocket.a"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+        )
+
+        assert flights.loc[0, "error"].isna().all()
+        assert flights.loc[1, "error"].notna().all()
+
+    def test_pool_failure(self):
+        # A variant that cannot be sent to its worker fails alone
+        variants = pd.DataFrame({"rocket.stage_1.tank.fuel.w_out_max": [3.0, lambda: 3.0]})
+
+        fueling, flights = run_branches(
+            variants,
+            init=INIT,
+            stop=STOP,
+            includes=["rocket.a"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+        )
+
+        assert flights.loc[0, "error"].isna().all()
+        assert flights.loc[1, "error"].notna().all()
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+from rocket_twin.systems import Station
+from rocket_twin.utils import Snapshot
+
+# Stages hold 5 kg, the first one is full at t = 5/3, the second one at t = 10/3, the
+# rocket is launched at t = 4.03 and drops its first stage at t = 6.53
+INIT = {
+    "g_tank.fuel.weight_p": 40.0,
+    "g_tank.fuel.w_out_max": 3.0,
+    "time_int": 0.7,
+    "rocket.stage_1.tank.fuel.w_out_max": 2.0,
+    "rocket.stage_2.tank.fuel.w_out_max": 1.0,
+}
+
+OUTPUTS = [
+    "rocket.stage_1.tank.weight_prop",
+    "rocket.stage_2.tank.weight_prop",
+    "g_tank.weight_prop",
+    "rocket.geom.weight",
+    "rocket.a",
+    "rocket.stage",
+]
+
+
+def run(sys, start, end, init=None):
+    driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+    driver.add_child(ExplicitSolver("nls"))
+    driver.time_interval = (start, end)
+    if init is not None:
+        driver.set_scenario(init=init)
+    sys.run_drivers()
+    sys.drivers.pop("rk")
+
+
+@pytest.fixture(scope="module")
+def reference():
+    """Station run without interruption."""
+    sys = Station("ref", n_stages=2, geometry="analytic")
+    run(sys, 0.0, 9.0, INIT)
+    return sys
+
+
+class TestSnapshot:
+    """Tests for the snapshots of a station."""
+
+    @pytest.mark.parametrize("time", [2.5, 7.0])
+    def test_resume(self, time, tmp_path, reference):
+        sys = Station("sys", n_stages=2, geometry="analytic")
+        run(sys, 0.0, time, INIT)
+        Snapshot.take(sys).save(tmp_path / "snapshot.json")
+
+        snapshot = Snapshot.load(tmp_path / "snapshot.json")
+        restored = Station("restored", n_stages=2, geometry="analytic")
+        snapshot.restore(restored)
+
+        np.testing.assert_allclose(restored.time, time)
+        assert restored.get_topology() == sys.get_topology()
+        assert restored.rocket.get_topology() == sys.rocket.get_topology()
+        assert restored.rocket.controller.drop.trigger == sys.rocket.controller.drop.trigger
+
+        run(restored, time, 9.0)
+
+        for name in OUTPUTS:
+            np.testing.assert_allclose(restored[name], reference[name], atol=1e-10)
+
+    def test_topology(self, reference):
+        sys = Station("sys", n_stages=2, geometry="analytic")
+        run(sys, 0.0, 7.0, INIT)
+        snapshot = Snapshot.take(sys)
+
+        assert snapshot.topology == {"": {"inlet": 2}, "rocket": {"dropped": 1}}
+        assert snapshot.triggers["rocket.controller.drop"][0] == "weight_prop - (0.)"
+        assert snapshot.values["rocket.controller.inwards.stage"] == 2
+
+        # Dropped stages are attached again when restoring an earlier state
+        fueling = Station("fueling", n_stages=2, geometry="analytic")
+        run(fueling, 0.0, 2.5, INIT)
+        Snapshot.take(fueling).restore(sys)
+        assert sys.rocket.get_topology() == {"dropped": 0}
+        np.testing.assert_array_equal(sys.rocket.attached, [True, True])
+
+        run(sys, 2.5, 9.0)
+        for name in OUTPUTS:
+            np.testing.assert_allclose(sys[name], reference[name], atol=1e-10)
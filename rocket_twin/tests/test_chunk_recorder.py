@@ -0,0 +1,91 @@
+import numpy as np
+from cosapp.base import System
+from cosapp.drivers import RungeKutta
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.drivers import Mission
+from rocket_twin.systems import Station
+from rocket_twin.utils import ChunkReader, ChunkRecorder
+
+
+class Decay(System):
+    def setup(self):
+        self.add_inward("k", 1.0)
+        self.add_inward("x", np.ones(2))
+        self.add_transient("x", der="-k * x")
+
+
+def decay(recorder):
+    sys = Decay("sys")
+    driver = sys.add_driver(RungeKutta("rk", order=4, dt=0.1))
+    driver.time_interval = (0, 5)
+    driver.add_recorder(recorder, period=0.1)
+    return sys, driver
+
+
+def run_decay(recorder):
+    sys, driver = decay(recorder)
+    sys.run_drivers()
+    return driver.recorder.export_data()
+
+
+class TestChunkRecorder:
+    """Tests for the streaming chunk recorder and its reader."""
+
+    def test_chunks(self, tmp_path):
+        recorder = ChunkRecorder(tmp_path, includes=["x", "k"], chunk_size=7)
+        data = run_decay(recorder)
+        reference = run_decay(DataFrameRecorder(includes=["x", "k"]))
+
+        reader = ChunkReader(tmp_path)
+
+        assert len(reader.chunks) == 8
+        assert reader.shape == reference.shape
+        assert list(data.columns) == list(reference.columns)
+        np.testing.assert_allclose(reader["time"], reference["time"])
+        np.testing.assert_allclose(reader["x"], np.stack(reference["x"]))
+        np.testing.assert_allclose(np.stack(data["x"]), np.stack(reference["x"]))
+        assert list(data["Reference"]) == list(reference["Reference"])
+
+    def test_restart(self, tmp_path):
+        sys, driver = decay(ChunkRecorder(tmp_path, includes=["x"], chunk_size=7))
+        sys.run_drivers()
+        sys.run_drivers()
+
+        assert len(ChunkReader(tmp_path)) == 51
+
+        driver.recorder.hold = True
+        sys.run_drivers()
+
+        assert len(driver.recorder.export_data()) == 102
+
+    def test_mission(self, tmp_path):
+        includes = ["rocket.a", "rocket.weight_prop_1"]
+        init = {"g_tank.fuel.weight_p": 10.0, "g_tank.fuel.w_out_max": 3.0}
+        stop = "rocket.weight_prop_1 == 0."
+
+        sys = Station("sys", geometry="analytic")
+        mission = sys.add_driver(
+            Mission(
+                "mission",
+                owner=sys,
+                init=init,
+                stop=stop,
+                includes=includes,
+                folder=tmp_path,
+                chunk_size=10,
+            )
+        )
+        sys.run_drivers()
+
+        reader = mission.reader
+        data = mission.data
+
+        assert len(reader) == len(data)
+        assert (tmp_path / "fueling" / "index.json").exists()
+        assert (tmp_path / "flight" / "index.json").exists()
+        np.testing.assert_allclose(reader["rocket.a"], data["rocket.a"])
+        np.testing.assert_allclose(
+            reader.to_dataframe(["rocket.weight_prop_1"])["rocket.weight_prop_1"],
+            data["rocket.weight_prop_1"],
+        )
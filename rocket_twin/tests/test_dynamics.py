@@ -1,6 +1,9 @@
 import numpy as np
+from cosapp.drivers import NonLinearSolver, RungeKutta
+from cosapp.recorders import DataFrameRecorder
 
-from rocket_twin.systems.physics import Dynamics
+from rocket_twin.systems import Station
+from rocket_twin.systems.physics import Dynamics, VectorDynamics
 
 
 class TestDynamics:
@@ -23,3 +26,60 @@ class TestDynamics:
         sys.run_once()
 
         np.testing.assert_allclose(sys.a, -8.0, atol=10 ** (-10))
+
+    def test_vector(self):
+        sys = VectorDynamics("sys", forces=["F1", "F2"], weights=["w1", "w2"])
+        sys.F[0] = [30.0, 0.0, 100.0]
+        sys.F[1] = [-10.0, 40.0, 0.0]
+        sys.m[:] = [3.0, 2.0]
+
+        sys.run_once()
+
+        np.testing.assert_allclose(sys.weight, 5.0, atol=10 ** (-10))
+        np.testing.assert_allclose(sys.acc, [4.0, 8.0, 10.0], atol=10 ** (-10))
+        np.testing.assert_allclose(sys.a, 10.0, atol=10 ** (-10))
+
+    def test_attached(self):
+        sys = Dynamics("sys", forces=["F1", "F2"], weights=["w"])
+        sys.F1 = 100.0
+        sys.F2 = 50.0
+        sys.w = 5.0
+        sys.attached = np.array([True, False])
+
+        sys.run_once()
+
+        np.testing.assert_allclose(sys.a, 10.0, atol=10 ** (-10))
+
+        sys = VectorDynamics("sys", forces=["F1", "F2"], weights=["w"])
+        sys.F[:, 2] = [100.0, 50.0]
+        sys.m[:] = 5.0
+        sys.attached = np.array([True, False])
+
+        sys.run_once()
+
+        np.testing.assert_allclose(sys.a, 10.0, atol=10 ** (-10))
+
+    def test_vector_rocket(self):
+        init = {
+            "g_tank.fuel.weight_p": 20.0,
+            "g_tank.fuel.w_out_max": 1.0,
+            "rocket.stage_1.tank.fuel.w_out_max": 1.0,
+            "rocket.stage_2.tank.fuel.w_out_max": 1.0,
+            "time_int": 5.0,
+        }
+
+        acel = {}
+        for dynamics in ("scalar", "vector"):
+            sys = Station("sys", n_stages=2, geometry="analytic", dynamics=dynamics)
+            driver = sys.add_driver(RungeKutta("rk", order=4, dt=1))
+            driver.add_child(NonLinearSolver("solver"))
+            driver.time_interval = (0, 30)
+            driver.set_scenario(init=init)
+            driver.add_recorder(DataFrameRecorder(includes=["rocket.a"]), period=1.0)
+
+            sys.run_drivers()
+
+            acel[dynamics] = np.asarray(driver.recorder.export_data()["rocket.a"])
+
+        assert acel["scalar"].max() > 0.0
+        np.testing.assert_allclose(acel["vector"], acel["scalar"], atol=10 ** (-10))
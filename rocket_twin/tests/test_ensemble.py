@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from rocket_twin.utils import run_ensemble
+
+
+class TestEnsemble:
+    """Tests for the ensemble runner."""
+
+    def test_cases(self):
+        cases = pd.DataFrame(
+            {
+                "g_tank.fuel.weight_p": [10.0, 8.0, 10.0],
+                "rocket.stage_1.engine.perfo.isp": [20.0, 20.0, 30.0],
+            },
+            index=pd.Index(["ref", "light", "isp"], name="case"),
+        )
+
+        init = {
+            "rocket.stage_1.tank.fuel.weight_p": 0.0,
+            "g_tank.w_in": 0.0,
+            "g_tank.fuel.w_out_max": 3.0,
+        }
+
+        results = run_ensemble(
+            cases,
+            init=init,
+            stop="rocket.stage_1.tank.weight_prop <= 0.",
+            includes=["rocket.a", "g_tank.weight_prop"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+            workers=2,
+        )
+
+        assert results.index.names == ["case", "record"]
+        assert results["error"].isna().all()
+
+        acel = results["rocket.a"]
+        ground = results["g_tank.weight_prop"]
+
+        np.testing.assert_allclose(acel["ref"].iloc[-2], 65.0, atol=10 ** (-10))
+        np.testing.assert_allclose(ground["ref"].iloc[-1], 5.0, atol=10 ** (-10))
+        np.testing.assert_allclose(ground["light"].iloc[-1], 3.0, atol=10 ** (-10))
+        assert acel["isp"].iloc[-2] > acel["ref"].iloc[-2]
+
+    def test_failure(self):
+        cases = pd.DataFrame({"g_tank.fuel.w_out_max": [3.0, "unknown"]})
+
+        results = run_ensemble(
+            cases,
+            init={"g_tank.fuel.weight_p": 10.0},
+            stop="rocket.stage_1.tank.weight_prop <= 0.",
+            includes=["rocket.a"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+        )
+
+        assert results.loc[0, "error"].isna().all()
+        assert results.loc[1, "error"].notna().all()
+
+    def test_pool_failure(self):
+        # A case that cannot be sent to its worker fails alone
+        cases = pd.DataFrame({"g_tank.fuel.w_out_max": [3.0, lambda: 3.0]})
+
+        results = run_ensemble(
+            cases,
+            init={"g_tank.fuel.weight_p": 10.0},
+            stop="rocket.stage_1.tank.weight_prop <= 0.",
+            includes=["rocket.a"],
+            dt=1.0,
+            options={"geometry": "analytic"},
+        )
+
+        assert results.loc[0, "error"].isna().all()
+        assert results.loc[1, "error"].notna().all()
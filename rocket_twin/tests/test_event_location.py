@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from cosapp.drivers import NonLinearSolver
+
+from rocket_twin.drivers import AdaptiveRungeKutta, EventRungeKutta
+from rocket_twin.drivers.event_location import private
+from rocket_twin.systems import Station
+
+
+def run_station(driver):
+    sys = Station("sys", n_stages=3, geometry="analytic")
+
+    init = {
+        "g_tank.fuel.weight_p": 20.0,
+        "g_tank.fuel.w_out_max": 3.0,
+        "rocket.stage_1.tank.fuel.w_out_max": 2.0,
+        "rocket.stage_2.tank.fuel.w_out_max": 1.0,
+        "rocket.stage_3.tank.fuel.w_out_max": 1.0,
+        "time_int": 0.7,
+    }
+
+    sys.add_driver(driver)
+    driver.add_child(NonLinearSolver("solver"))
+    driver.time_interval = (0, 20)
+    driver.set_scenario(init=init)
+
+    sys.run_drivers()
+
+    return [(record.time, record.events[0].name) for record in driver.recorded_events]
+
+
+class TestEventLocation:
+    """Tests for the event location of the time drivers."""
+
+    # Stages hold 5 kg, filled at 3 kg/s and emptied at 2, 1 and 1 kg/s
+    events = [
+        (5 / 3, "full"),
+        (10 / 3, "full"),
+        (5.0, "full"),
+        (5.7, "launch"),
+        (8.2, "drop"),
+        (13.2, "drop"),
+        (18.2, "drop"),
+    ]
+
+    def test_coarse(self):
+        for dt in (0.5, 1.0, 2.0):
+            events = run_station(EventRungeKutta("rk", order=4, dt=dt))
+
+            assert [name for _, name in events] == [name for _, name in self.events]
+            np.testing.assert_allclose(
+                [time for time, _ in events], [time for time, _ in self.events], atol=10 ** (-8)
+            )
+
+    def test_adaptive(self):
+        events = run_station(AdaptiveRungeKutta("rk", dt=0.1))
+
+        assert [name for _, name in events] == [name for _, name in self.events]
+        np.testing.assert_allclose(
+            [time for time, _ in events], [time for time, _ in self.events], atol=10 ** (-8)
+        )
+
+    def test_private(self):
+        with pytest.raises(RuntimeError, match="cosapp"):
+            private(EventRungeKutta("rk"), "_ExplicitTimeDriver__missing")
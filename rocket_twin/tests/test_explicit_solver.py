@@ -0,0 +1,90 @@
+import numpy as np
+from cosapp.base import System
+from cosapp.drivers import NonLinearSolver
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver, Mission
+from rocket_twin.systems import Station
+
+
+class Square(System):
+    def setup(self):
+        self.add_inward("x", 1.0)
+        self.add_inward("y", 4.0)
+        self.add_outward("res", 0.0)
+
+    def compute(self):
+        self.res = self.x**2 - self.y
+
+
+def run_station(solver):
+    sys = Station("sys", n_stages=2, geometry="analytic")
+
+    init = {
+        "g_tank.fuel.weight_p": 20.0,
+        "g_tank.fuel.w_out_max": 3.0,
+        "rocket.stage_1.tank.fuel.w_out_max": 2.0,
+        "rocket.stage_2.tank.fuel.w_out_max": 1.0,
+        "time_int": 0.7,
+    }
+
+    driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=0.5))
+    driver.add_child(solver)
+    driver.time_interval = (0, 14)
+    driver.set_scenario(init=init)
+    driver.add_recorder(DataFrameRecorder(includes=["rocket.a", "rocket.weight_prop_2"]))
+
+    sys.run_drivers()
+
+    return driver.recorder.export_data()
+
+
+class TestExplicitSolver:
+    """Tests for the explicit fast path of the non-linear solver."""
+
+    def test_loops(self):
+        solver = ExplicitSolver("solver")
+        data = run_station(solver)
+        reference = run_station(NonLinearSolver("solver"))
+
+        np.testing.assert_allclose(data["rocket.a"], reference["rocket.a"], atol=10 ** (-9))
+        np.testing.assert_allclose(
+            data["rocket.weight_prop_2"], reference["rocket.weight_prop_2"], atol=10 ** (-9)
+        )
+        assert solver.is_explicit
+        assert solver.statistics["explicit"] == solver.statistics["calls"]
+        assert solver.statistics["iterations"] == 0
+
+    def test_empty(self):
+        sys = Square("sys")
+        solver = sys.add_driver(ExplicitSolver("solver"))
+
+        sys.x = 3.0
+        sys.run_drivers()
+
+        assert solver.problem.is_empty()
+        assert solver.statistics == {"calls": 1, "explicit": 1, "passes": 1, "iterations": 0}
+        np.testing.assert_allclose(sys.res, 5.0)
+
+    def test_fallback(self):
+        sys = Square("sys")
+        solver = sys.add_driver(ExplicitSolver("solver"))
+        solver.add_unknown("x").add_equation("res == 0")
+
+        sys.run_drivers()
+
+        assert not solver.is_explicit
+        assert solver.statistics["explicit"] == 0
+        assert solver.statistics["iterations"] > 1
+        np.testing.assert_allclose(sys.x, 2.0, rtol=10 ** (-6))
+
+    def test_mission(self):
+        sys = Station("sys", geometry="analytic")
+        init = {"g_tank.fuel.weight_p": 10.0, "g_tank.fuel.w_out_max": 3.0}
+        mission = sys.add_driver(
+            Mission("mission", owner=sys, init=init, stop="rocket.weight_prop_1 == 0.", dt=0.5)
+        )
+
+        sys.run_drivers()
+
+        assert mission.statistics["solver_iterations"] == 0
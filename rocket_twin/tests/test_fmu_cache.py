@@ -0,0 +1,137 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rocket_twin.utils import FMUCache
+from rocket_twin.utils.fmu_cache import CONTROLLERS, build_controllers
+
+
+class FakeCompiler:
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, model_path, model_name, directory):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.duration)
+        fmu = os.path.join(directory, model_name + ".fmu")
+        with open(model_path) as source, open(fmu, "w") as file:
+            file.write(source.read())
+        with self.lock:
+            self.running -= 1
+        return fmu
+
+
+class TestFMUCache:
+    """Tests for the FMU build cache."""
+
+    def test_reuse(self, tmp_path):
+        model_path = tmp_path / "controller.mo"
+        model_path.write_text("model controller end controller;")
+        build = FakeCompiler()
+
+        cache = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+        fmu = cache.get(model_path, "controller")
+
+        assert cache.get(model_path, "controller") == fmu
+        assert build.calls == 1
+        assert cache.info()["hits"] == 1
+
+        # Another process sharing the folder
+        other = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+        assert other.get(model_path, "controller") == fmu
+        assert build.calls == 1
+
+    def test_key(self, tmp_path):
+        model_path = tmp_path / "controller.mo"
+        model_path.write_text("model controller end controller;")
+        build = FakeCompiler()
+
+        cache = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+        fmu = cache.get(model_path, "controller")
+
+        model_path.write_text("model controller Real x; end controller;")
+        assert cache.get(model_path, "controller") != fmu
+
+        cache._compiler_version = "1.1"
+        cache.get(model_path, "controller")
+
+        assert build.calls == 3
+        assert cache.info()["size"] == 3
+
+    def test_invalidate(self, tmp_path):
+        build = FakeCompiler()
+        cache = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+        for name in ("stage", "stage_controller", "station"):
+            model_path = tmp_path / f"{name}.mo"
+            model_path.write_text(f"model {name} end {name};")
+            cache.get(model_path, name)
+
+        assert cache.invalidate("stage") == 1
+        assert cache.info()["size"] == 2
+
+        cache.get(tmp_path / "stage.mo", "stage")
+        assert build.calls == 4
+
+        assert cache.invalidate() == 3
+        assert cache.info()["size"] == 0
+
+    def test_parallel(self, tmp_path):
+        build = FakeCompiler(duration=0.2)
+        cache = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+        cwd = os.getcwd()
+
+        fmus = build_controllers(cache)
+
+        assert list(fmus) == list(CONTROLLERS)
+        assert build.max_running == 3
+        assert os.getcwd() == cwd
+        # Only the FMUs are left in the cache
+        assert sorted(path.suffix for path in (tmp_path / "cache").iterdir()) == [".fmu"] * 3
+
+    def test_concurrent(self, tmp_path):
+        model_path = tmp_path / "controller.mo"
+        model_path.write_text("model controller end controller;")
+        build = FakeCompiler(duration=0.1)
+        cache = FMUCache(tmp_path / "cache", compiler_version="1.0", build=build)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fmus = list(executor.map(lambda i: cache.get(model_path, "controller"), range(4)))
+
+        assert len(set(fmus)) == 1
+        assert build.calls == 1
+
+    def test_warm_hit(self, tmp_path, monkeypatch):
+        model_path = tmp_path / "controller.mo"
+        model_path.write_text("model controller end controller;")
+        executable = tmp_path / "omc"
+        executable.write_text("")
+        versions = ["1.0"]
+        build = FakeCompiler()
+
+        module = sys.modules[FMUCache.__module__]
+        monkeypatch.setattr(module, "omc_executable", lambda: str(executable))
+        monkeypatch.setattr(module, "omc_version", lambda: versions.pop(0))
+
+        fmu = FMUCache(tmp_path / "cache", build=build).get(model_path, "controller")
+
+        # The version stored for the executable is reused without asking OpenModelica
+        other = FMUCache(tmp_path / "cache", build=build)
+        assert other.get(model_path, "controller") == fmu
+        assert build.calls == 1
+
+        # An upgraded compiler is asked its version and rebuilds the FMU
+        versions.append("1.1")
+        os.utime(executable, ns=(0, 0))
+        upgraded = FMUCache(tmp_path / "cache", build=build)
+        assert upgraded.get(model_path, "controller") != fmu
+        assert upgraded.compiler_version == "1.1"
+        assert build.calls == 2
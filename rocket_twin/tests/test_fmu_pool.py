@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+import numpy as np
+from cosapp.core.time import UniversalClock
+from cosapp.drivers import RungeKutta
+
+from rocket_twin.systems import PooledFMUSystem
+from rocket_twin.utils import FMUPool
+
+# Model description of a controller with w = is_on
+MODEL = SimpleNamespace(
+    modelVariables=[
+        SimpleNamespace(
+            name="is_on", valueReference=0, type="Boolean", causality="input", start="false"
+        ),
+        SimpleNamespace(name="w", valueReference=1, type="Real", causality="output", start=None),
+    ],
+    coSimulation=SimpleNamespace(canGetAndSetFMUstate=True),
+)
+
+
+class FakeSlave:
+    def __init__(self):
+        self.values = {0: False, 1: 0.0}
+        self.calls = []
+
+    def __getattr__(self, name):
+        # FMI functions without effect on the values
+        return lambda *args, **kwargs: self.calls.append(name)
+
+    def reset(self):
+        self.calls.append("reset")
+        self.values = {0: False, 1: 0.0}
+
+    def getFMUstate(self):
+        self.calls.append("getFMUstate")
+        return dict(self.values)
+
+    def setFMUstate(self, state):
+        self.calls.append("setFMUstate")
+        self.values = dict(state)
+
+    def setBoolean(self, vrs, values):
+        self.values.update(zip(vrs, values))
+
+    def getReal(self, vrs):
+        return [float(self.values[0])]
+
+    def getBoolean(self, vrs):
+        return [self.values[vr] for vr in vrs]
+
+
+def fake_pool(maxsize=4):
+    return FMUPool(
+        maxsize=maxsize,
+        unpack=lambda fmu_path: (MODEL, "unzipdir"),
+        instantiate=lambda model_description, unzipdir, instance_name: FakeSlave(),
+    )
+
+
+class TestFMUPool:
+    """Tests for the FMU instance pool."""
+
+    def test_reuse(self):
+        pool = fake_pool()
+
+        fmu = pool.acquire("controller.fmu")
+        fmu.initialize()
+        pool.release(fmu)
+        other = pool.acquire("controller.fmu")
+        other.initialize()
+
+        assert other is fmu
+        assert pool.info() == {"hits": 1, "misses": 1, "idle": 0, "maxsize": 4}
+        assert fmu.slave.calls.count("reset") == 1
+        assert pool.acquire("other.fmu") is not fmu
+
+    def test_bounded(self):
+        pool = fake_pool(maxsize=2)
+        fmus = [pool.acquire("controller.fmu") for i in range(3)]
+        for fmu in fmus:
+            pool.release(fmu)
+
+        assert len(pool) == 2
+        assert fmus[0].slave.calls[-1] == "freeInstance"
+        assert pool.acquire("controller.fmu") is fmus[2]
+
+    def test_system(self):
+        pool = fake_pool()
+
+        sys = PooledFMUSystem("sys", fmu_path="controller.fmu", pool=pool)
+        sys.add_driver(RungeKutta("rk", dt=0.5, time_interval=(0, 1)))
+        sys.is_on = True
+        sys.run_drivers()
+
+        np.testing.assert_allclose(sys.w, 1.0)
+        assert sys.fmu.slave.calls.count("doStep") == 2
+
+        slave = sys.fmu.slave
+        sys.close()
+        sys.close()
+
+        assert len(pool) == 1
+        with PooledFMUSystem("sys", fmu_path="controller.fmu", pool=pool) as other:
+            assert other.fmu.slave is slave
+        assert len(pool) == 1
+
+    def test_rollback(self):
+        pool = fake_pool()
+        sys = PooledFMUSystem("sys", fmu_path="controller.fmu", pool=pool, max_checkpoints=2)
+        sys.add_driver(RungeKutta("rk", dt=0.5, time_interval=(0, 1.5)))
+        sys.run_drivers()
+        calls = sys.fmu.slave.calls
+        assert calls.count("doStep") == 3
+
+        # A rejected step moving the time back rewinds the slave to a saved state
+        UniversalClock().reset(0.75)
+        sys.compute()
+        assert calls.count("setFMUstate") == 1
+        assert calls.count("doStep") == 4
+        assert calls.count("setupExperiment") == 1
+
+        # Further back than the saved states, the slave is restarted
+        UniversalClock().reset(0.25)
+        sys.compute()
+        assert calls.count("setupExperiment") == 2
+
+        sys.close()
+        assert calls.count("getFMUstate") == calls.count("freeFMUstate")
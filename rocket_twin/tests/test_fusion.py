@@ -0,0 +1,31 @@
+import numpy as np
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.gp import gp_Pnt, gp_Vec
+from OCC.Core.GProp import GProp_GProps
+from pyoccad.create import CreateCylinder
+
+from rocket_twin.utils.fusion import fuse_shapes, fuse_tree
+
+
+class TestFusion:
+    """Tests for the fusion utilities."""
+
+    shapes = [
+        CreateCylinder.from_base_and_dir(gp_Pnt(0, 0, 2 * i), gp_Vec(0, 0, 3), 1.0)
+        for i in range(5)
+    ]
+
+    def volume(self, shape):
+        vprop = GProp_GProps()
+        brepgprop.VolumeProperties(shape, vprop)
+        return vprop.Mass()
+
+    def test_general(self):
+        np.testing.assert_allclose(self.volume(fuse_shapes(self.shapes)), 11 * np.pi, rtol=1e-6)
+
+    def test_sequential(self):
+        fusion = fuse_shapes(self.shapes, parallel=False)
+        np.testing.assert_allclose(self.volume(fusion), 11 * np.pi, rtol=1e-6)
+
+    def test_tree(self):
+        np.testing.assert_allclose(self.volume(fuse_tree(self.shapes)), 11 * np.pi, rtol=1e-6)
@@ -4,7 +4,8 @@ from OCC.Core.gp import gp_Pnt, gp_Vec
 from OCC.Core.GProp import GProp_GProps
 from pyoccad.create import CreateCone, CreateCylinder
 
-from rocket_twin.systems import OCCGeometry
+from rocket_twin.systems import OCCGeometry, Stage
+from rocket_twin.utils import build_shapes
 
 
 class TestGeometry:
@@ -49,3 +50,39 @@ class TestGeometry:
         np.testing.assert_allclose(sys.I[0, 0], 431725.5164, atol=10 ** (-2))
         np.testing.assert_allclose(sys.I[1, 1], 431725.5164, atol=10 ** (-2))
         np.testing.assert_allclose(sys.I[2, 2], 30536.2806, atol=10 ** (-2))
+
+    def test_lazy(self):
+
+        sys = OCCGeometry(
+            "sys", shapes=["cylinder_s", "cone_s"], properties=["cylinder", "cone"], lazy=True
+        )
+        sys.cylinder_s = CreateCylinder.from_base_and_dir(gp_Pnt(0, 0, 0), gp_Vec(0, 0, 20), 3.0)
+        sys.cone_s = CreateCone.from_base_and_dir(gp_Pnt(0, 0, 20), gp_Vec(0, 0, 10), 3.0)
+        vprop = GProp_GProps()
+        brepgprop.VolumeProperties(sys.cylinder_s, vprop)
+        sys.cylinder.Add(vprop, 10.0)
+        placeholder = sys.shape
+
+        sys.run_once()
+
+        assert sys.shape is placeholder
+        np.testing.assert_allclose(sys.weight, 5654.867, atol=10 ** (-1))
+
+        sys.request_shape()
+        sys.run_once()
+
+        assert sys.shape is not placeholder
+        fused = GProp_GProps()
+        brepgprop.VolumeProperties(sys.shape, fused)
+        np.testing.assert_allclose(fused.Mass(), 210 * np.pi, atol=10 ** (-1))
+
+    def test_build_shapes(self):
+
+        sys = Stage("sys", lazy=True)
+        placeholder = sys.geom.shape
+
+        sys.run_once()
+        assert sys.geom.shape is placeholder
+
+        build_shapes(sys)
+        assert sys.geom.shape is not placeholder
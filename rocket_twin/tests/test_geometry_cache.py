@@ -0,0 +1,40 @@
+from rocket_twin.systems import Rocket, TubeGeom
+from rocket_twin.utils import GeometryCache, geometry_cache
+
+
+class TestGeometryCache:
+    """Tests for the geometry cache."""
+
+    def test_lru(self):
+        cache = GeometryCache(maxsize=2)
+
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 3)
+        cache.get("c", lambda: 4)
+
+        assert cache.info() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.get("a", lambda: 5) == 1
+
+    def test_shared(self):
+        geometry_cache.clear()
+
+        sys1 = TubeGeom("sys1")
+        sys2 = TubeGeom("sys2")
+        sys1.run_once()
+        sys2.run_once()
+
+        assert geometry_cache.misses == 1
+        assert geometry_cache.hits == 1
+        assert sys1.shape is sys2.shape
+
+    def test_stages(self):
+        geometry_cache.clear()
+
+        sys = Rocket("sys", n_stages=3)
+        sys.run_once()
+
+        # The middle stage reuses the models of the first one
+        assert geometry_cache.hits >= 3
@@ -0,0 +1,60 @@
+import json
+import subprocess
+import sys
+
+import rocket_twin.drivers
+import rocket_twin.systems
+import rocket_twin.utils
+
+HEAVY = ("OCC", "pyoccad", "cosapp_fmu", "OMPython", "fmpy")
+
+
+def run_import(statement):
+    """Run an import statement in a new interpreter, return the loaded modules."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestImports:
+    """Tests for the lazy loading of the packages."""
+
+    def test_systems(self):
+        modules = run_import("import rocket_twin.systems")
+
+        assert not [name for name in modules if name.split(".")[0] in HEAVY]
+        assert "cosapp" not in modules
+        assert "rocket_twin.systems.station.station" not in modules
+
+    def test_utils(self):
+        modules = run_import("import rocket_twin.utils\nrocket_twin.utils.fmu_cache")
+
+        assert not [name for name in modules if name.split(".")[0] in HEAVY]
+        assert "pandas" not in modules
+        assert "rocket_twin.utils.run_branches" not in modules
+
+    def test_analytic_station(self):
+        modules = run_import(
+            "from rocket_twin.systems import Station\nStation('sta', geometry='analytic')"
+        )
+
+        assert not [name for name in modules if name.split(".")[0] in HEAVY]
+        assert "rocket_twin.systems.control.station_controller_fmu" not in modules
+        assert "rocket_twin.drivers.mission" not in modules
+
+    def test_all(self):
+        for package in (rocket_twin.systems, rocket_twin.drivers, rocket_twin.utils):
+            assert set(package.__all__) <= set(dir(package))
+            assert set(package.__all__) <= set(vars(package)) | set(package._modules)
+
+        assert callable(rocket_twin.utils.run_sequences)
+        # Attributes named after their module are not hidden by it
+        from rocket_twin.utils.fmu_pool import FMUPool
+
+        assert isinstance(rocket_twin.utils.fmu_pool, FMUPool)
+        assert rocket_twin.drivers.Mission.__name__ == "Mission"
@@ -0,0 +1,42 @@
+import numpy as np
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+from rocket_twin.systems import Manifold, Station
+
+
+class TestManifold:
+    """Tests for the manifold model."""
+
+    def test_outlet(self):
+        sys = Manifold("sys", n_outlets=3)
+        sys.w_in = 2.0
+        sys.outlet = 2
+
+        sys.run_once()
+
+        np.testing.assert_allclose([sys.w_out_1, sys.w_out_2, sys.w_out_3], [0.0, 2.0, 0.0])
+
+        sys.outlet = 0
+        sys.run_once()
+
+        np.testing.assert_allclose([sys.w_out_1, sys.w_out_2, sys.w_out_3], [0.0, 0.0, 0.0])
+
+    def test_fueling(self):
+        n_stages = 3
+        sys = Station("sys", n_stages=n_stages, geometry="analytic")
+        children = list(sys.children)
+        connectors = set(sys.connectors())
+
+        driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+        driver.add_child(ExplicitSolver("solver"))
+        driver.time_interval = (0.0, 6.0)
+        driver.set_scenario(init={"g_tank.fuel.weight_p": 40.0, "g_tank.fuel.w_out_max": 3.0})
+        sys.run_drivers()
+
+        # Stages hold 5 kg each and are filled one after the other
+        for i in range(1, n_stages + 1):
+            np.testing.assert_allclose(sys[f"rocket.stage_{i}.tank.weight_prop"], 5.0)
+        np.testing.assert_allclose(sys.g_tank.weight_prop, 25.0)
+        assert sys.get_topology() == {"inlet": n_stages}
+        assert list(sys.children) == children
+        assert set(sys.connectors()) == connectors
@@ -0,0 +1,118 @@
+import numpy as np
+import pytest
+from cosapp.drivers import RunOnce
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.systems import (
+    EngineGeom,
+    EngineMass,
+    NoseGeom,
+    NoseMass,
+    TankGeom,
+    TankMass,
+    TubeGeom,
+    TubeMass,
+    WingsGeom,
+    WingsMass,
+)
+from rocket_twin.utils import MassProperties
+
+CASES = [
+    (NoseGeom, {"radius": 5.0, "height": 9.0, "rho": 10.0, "pos": 2.0}),
+    (TubeGeom, {"radius": 0.5, "length": 3.0, "rho": 2.0, "pos": -1.0}),
+    (EngineGeom, {"base_radius": 3.0, "top_radius": 1.0, "height": 2.0, "pos": 0.5}),
+    (WingsGeom, {"n": 3, "l_in": 1.0, "l_out": 0.4, "width": 1.2, "radius": 0.7, "pos": 1.3}),
+    (WingsGeom, {"n": 8, "l_in": 0.6, "l_out": 0.6, "width": 0.3, "th": 0.02, "radius": 1.0}),
+    (
+        TankGeom,
+        {
+            "r_int": 3.0,
+            "r_ext": 4.0,
+            "thickness": 0.1,
+            "height": 1.0,
+            "rho_struct": 0.1,
+            "rho_fuel": 0.2,
+            "weight_prop": 1.0,
+            "pos": 0.5,
+        },
+    ),
+]
+
+
+class TestMassProperties:
+    """Tests for the analytic geometry backend."""
+
+    @pytest.mark.parametrize("cls, values", CASES)
+    def test_against_brep(self, cls, values):
+        occ = cls("occ")
+        analytic = cls("analytic", backend="analytic")
+
+        for sys in (occ, analytic):
+            for key, value in values.items():
+                sys[key] = value
+            sys.run_once()
+
+        ref = MassProperties.from_gprops(occ.props)
+        res = MassProperties.from_gprops(analytic.props)
+
+        np.testing.assert_allclose(res.mass, ref.mass, rtol=1e-5)
+        np.testing.assert_allclose(res.cg, ref.cg, atol=1e-5)
+        np.testing.assert_allclose(res.inertia, ref.inertia, rtol=1e-4, atol=1e-6)
+
+    @pytest.mark.parametrize("cls, values", CASES)
+    def test_mass_systems(self, cls, values):
+        mass_cls = {
+            NoseGeom: NoseMass,
+            TubeGeom: TubeMass,
+            EngineGeom: EngineMass,
+            WingsGeom: WingsMass,
+            TankGeom: TankMass,
+        }[cls]
+        geom = cls("geom", backend="analytic")
+        mass = mass_cls("mass")
+
+        for sys in (geom, mass):
+            for key, value in values.items():
+                sys[key] = value
+            sys.run_once()
+
+        ref = MassProperties.from_gprops(geom.props)
+
+        np.testing.assert_allclose(mass.props.mass, ref.mass, rtol=1e-9)
+        np.testing.assert_allclose(mass.props.cg, ref.cg, atol=1e-9)
+        np.testing.assert_allclose(mass.props.inertia, ref.inertia, rtol=1e-6, atol=1e-9)
+
+    def test_lazy_shape(self):
+        sys = NoseGeom("sys", backend="analytic")
+        placeholder = sys.shape
+
+        sys.run_once()
+        assert sys.shape is placeholder
+
+        sys.request_shape()
+        sys.run_once()
+        assert sys.shape is not placeholder
+
+    def test_recorded_shape(self):
+        sys = NoseGeom("sys", backend="analytic")
+        placeholder = sys.shape
+        driver = sys.add_driver(RunOnce("run"))
+        driver.add_recorder(DataFrameRecorder(includes=["shape"]))
+
+        sys.run_drivers()
+
+        assert sys.shape is not placeholder
+        assert driver.recorder.export_data()["shape"].iloc[-1] is sys.shape
+
+    def test_round_trip(self):
+        props = MassProperties(2.0, [0.0, 0.0, 1.0], np.diag([0.5, 0.3, 3.2]))
+
+        res = MassProperties.from_gprops(props.to_gprops())
+
+        np.testing.assert_allclose(res.mass, props.mass)
+        np.testing.assert_allclose(res.cg, props.cg, atol=1e-12)
+        np.testing.assert_allclose(res.inertia, props.inertia, atol=1e-12)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            TubeGeom("sys", backend="brep")
@@ -0,0 +1,72 @@
+import json
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+from rocket_twin.systems import Station
+from rocket_twin.utils import SystemProfiler
+
+
+def fueling_station():
+    sys = Station("sys", n_stages=2, geometry="analytic")
+    driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=0.5))
+    driver.add_child(ExplicitSolver("nls"))
+    driver.time_interval = (0, 5)
+    driver.set_scenario(init={"g_tank.fuel.weight_p": 40.0, "g_tank.fuel.w_out_max": 3.0})
+    return sys
+
+
+class TestSystemProfiler:
+    """Tests for the system profiler."""
+
+    def test_profile(self):
+        sys = fueling_station()
+
+        with SystemProfiler(sys) as profiler:
+            sys.run_drivers()
+
+        methods = profiler.methods
+        assert methods["sys.rocket.stage_1.tank.fuel", "compute"]["calls"] > 0
+        assert methods["sys.rocket.stage_1.tank.fuel", "compute"]["time"] > 0.0
+        # The first stage is full at t = 5/3, and the manifold feeds the second one
+        assert methods["sys", "transition"]["calls"] >= 1
+        assert methods["sys.manifold", "compute"]["calls"] > 0
+
+        # The steps restart at both fueling events, whose location needs more solver calls
+        steps = profiler.steps
+        assert len(steps) == 12
+        assert [step["solver_calls"] for step in steps].count(4) == 10
+        assert sum(step["iterations"] for step in steps) < profiler.solvers["sys.nls"]["iterations"]
+        assert profiler.events["sys.rocket.stage_1.controller.full"]["evaluations"] > 0
+
+    def test_detach(self):
+        sys = fueling_station()
+
+        with SystemProfiler(sys) as profiler:
+            sys.run_drivers()
+        calls = profiler.methods["sys.g_tank.fuel", "compute"]["calls"]
+
+        assert not [s for s in sys.tree() if "compute" in vars(s) or "transition" in vars(s)]
+        assert "compute" not in vars(sys.drivers["rk"].children["nls"])
+
+        sys.run_drivers()
+        assert profiler.methods["sys.g_tank.fuel", "compute"]["calls"] == calls
+
+    def test_export(self, tmp_path):
+        sys = fueling_station()
+
+        with SystemProfiler(sys) as profiler:
+            sys.run_drivers()
+        profiler.export(tmp_path / "profile.json")
+
+        with open(tmp_path / "profile.json") as file:
+            data = json.load(file)
+
+        assert set(data) == {"methods", "solvers", "events", "steps"}
+        assert len(data["steps"]) == 12
+        assert profiler.report().splitlines()[0].split() == [
+            "system",
+            "method",
+            "calls",
+            "time",
+            "[s]",
+            "share",
+        ]
@@ -0,0 +1,56 @@
+import numpy as np
+from cosapp.base import System
+from cosapp.drivers import RungeKutta
+from cosapp.recorders import DataFrameRecorder
+
+from rocket_twin.utils import RingRecorder
+
+
+class Decay(System):
+    def setup(self):
+        self.add_inward("k", 1.0)
+        self.add_inward("x", np.ones(2))
+        self.add_transient("x", der="-k * x")
+
+
+def run_decay(recorder, duration):
+    sys = Decay("sys")
+    driver = sys.add_driver(RungeKutta("rk", order=4, dt=0.1))
+    driver.time_interval = (0, duration)
+    driver.add_recorder(recorder, period=0.1)
+    sys.run_drivers()
+    return driver.recorder
+
+
+class TestRingRecorder:
+    """Tests for the ring buffer recorder."""
+
+    def test_levels(self):
+        recorder = run_decay(RingRecorder(includes=["x"], capacity=20, levels=3, factor=5), 50)
+
+        # 501 records, the last 20 of each level are kept
+        times = [recorder.export_data(level)["time"] for level in range(3)]
+
+        np.testing.assert_allclose(times[0], np.linspace(48.1, 50.0, 20))
+        np.testing.assert_allclose(times[1], np.linspace(40.4, 49.9, 20))
+        np.testing.assert_allclose(times[2], np.linspace(2.4, 49.9, 20))
+        np.testing.assert_allclose(
+            np.stack(recorder.export_data(2)["x"]), np.exp(-np.c_[times[2], times[2]]), rtol=1e-4
+        )
+
+    def test_mean(self):
+        recorder = run_decay(RingRecorder(capacity=200, levels=2, factor=4, reduce="mean"), 10)
+        reference = run_decay(DataFrameRecorder(), 10).export_data()
+
+        # The 101st record does not complete a block
+        blocks = np.stack(reference["x"])[:100].reshape(25, 4, 2)
+
+        np.testing.assert_allclose(np.stack(recorder.export_data(1)["x"]), blocks.mean(axis=1))
+        np.testing.assert_allclose(recorder.export_data(0)["k"], reference["k"])
+
+    def test_memory(self):
+        short = run_decay(RingRecorder(capacity=50), 10)
+        long = run_decay(RingRecorder(capacity=50), 100)
+
+        assert short.nbytes == long.nbytes == 3 * 50 * (1 + 1 + 2) * 8
+        assert len(long.export_data()) == 50
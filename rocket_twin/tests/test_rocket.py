@@ -0,0 +1,70 @@
+import numpy as np
+
+from rocket_twin.drivers import EventRungeKutta, ExplicitSolver
+from rocket_twin.systems import Rocket
+
+
+class TestRocket:
+    """Tests for the staging of the rocket."""
+
+    def test_staging(self):
+        n_stages = 12
+        sys = Rocket("sys", n_stages=n_stages, geometry="analytic")
+        sys.flying = True
+        sys.run_once()
+
+        children = list(sys.children)
+        connectors = set(sys.connectors())
+        weight = sys.geom.weight
+        stage_weights = [sys[f"stage_{i}"].geom.weight for i in range(1, n_stages + 1)]
+
+        for i in range(1, n_stages):
+            sys.drop_stage(i)
+            sys.run_once()
+
+            np.testing.assert_allclose(sys.geom.weight, weight - sum(stage_weights[:i]), rtol=1e-10)
+
+        # Stages are masked out, the tree is left untouched
+        assert list(sys.children) == children
+        assert set(sys.connectors()) == connectors
+        np.testing.assert_array_equal(sys.attached, np.arange(n_stages) == n_stages - 1)
+
+        sys.set_topology({"dropped": 0})
+        sys.run_once()
+
+        assert sys.get_topology() == {"dropped": 0}
+        np.testing.assert_allclose(sys.geom.weight, weight, rtol=1e-10)
+
+    def test_drop_all(self):
+        sys = Rocket("sys", n_stages=2)
+        sys.run_once()
+
+        for i in (1, 2):
+            sys.drop_stage(i)
+        sys.run_once()
+
+        np.testing.assert_allclose(sys.geom.weight, 0.0, atol=1e-10)
+        assert sys.geom.shape.NbChildren() == 0
+
+    def test_flight(self):
+        n_stages = 4
+        sys = Rocket("sys", n_stages=n_stages, geometry="analytic")
+        trigger = sys.controller.drop.trigger
+
+        init = {"flying": True, "controller.is_on_1": True}
+        for i in range(1, n_stages + 1):
+            init[f"stage_{i}.tank.fuel.weight_p"] = 1.0
+            init[f"stage_{i}.tank.fuel.w_out_max"] = 1.0
+
+        driver = sys.add_driver(EventRungeKutta("rk", order=4, dt=0.25))
+        driver.add_child(ExplicitSolver("solver"))
+        driver.time_interval = (0.0, n_stages + 0.5)
+        driver.set_scenario(init=init)
+        sys.run_drivers()
+
+        # Each stage burns for one second, the drop trigger is never rewritten
+        assert sys.stage == n_stages
+        assert sys.controller.drop.trigger is trigger
+        np.testing.assert_array_equal(sys.attached, np.arange(n_stages) == n_stages - 1)
+        for i in range(1, n_stages + 1):
+            np.testing.assert_allclose(sys[f"stage_{i}.tank.weight_prop"], 0.0, atol=1e-10)
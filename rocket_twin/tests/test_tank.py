@@ -2,6 +2,7 @@ import numpy as np
 from cosapp.drivers import RungeKutta
 
 from rocket_twin.systems import Tank
+from rocket_twin.utils import geometry_cache
 
 
 class TestTank:
@@ -75,3 +76,20 @@ class TestTank:
         np.testing.assert_allclose(
             sys.props.MatrixOfInertia().Diagonal().Z(), 36.0101, atol=10 ** (-2)
         )
+
+    def test_structure_cache(self):
+        geometry_cache.clear()
+
+        sys = Tank("sys")
+        driver = sys.add_driver(RungeKutta(order=4, dt=0.1))
+        driver.time_interval = (0, 5)
+
+        init = {"w_in": 3.0, "fuel.w_out_max": 0.0, "fuel.weight_p": 0.0}
+
+        driver.set_scenario(init=init)
+
+        sys.run_drivers()
+
+        assert geometry_cache.misses == 1
+        assert geometry_cache.hits > 50
+        np.testing.assert_allclose(sys.props.Mass(), 16.0, atol=10 ** (-6))
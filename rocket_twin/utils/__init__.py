@@ -1,3 +1,27 @@
-from rocket_twin.utils.run_sequences import run_sequences
+from rocket_twin.utils.lazy import lazy_module
 
-__all__ = ["run_sequences"]
+__all__ = lazy_module(
+    __name__,
+    {
+        "run_sequences": "rocket_twin.utils.run_sequences",
+        "MassProperties": "rocket_twin.utils.mass_properties",
+        "GeometryCache": "rocket_twin.utils.geometry_cache",
+        "geometry_cache": "rocket_twin.utils.geometry_cache",
+        "build_shapes": "rocket_twin.utils.shapes",
+        "LazyShape": "rocket_twin.utils.shapes",
+        "IndexConnector": "rocket_twin.utils.connectors",
+        "run_ensemble": "rocket_twin.utils.run_ensemble",
+        "BatchFlight": "rocket_twin.utils.batch_flight",
+        "ChunkRecorder": "rocket_twin.utils.chunk_recorder",
+        "ChunkReader": "rocket_twin.utils.chunk_recorder",
+        "RingRecorder": "rocket_twin.utils.ring_recorder",
+        "FMUCache": "rocket_twin.utils.fmu_cache",
+        "fmu_cache": "rocket_twin.utils.fmu_cache",
+        "build_controllers": "rocket_twin.utils.fmu_cache",
+        "FMUPool": "rocket_twin.utils.fmu_pool",
+        "fmu_pool": "rocket_twin.utils.fmu_pool",
+        "SystemProfiler": "rocket_twin.utils.profiler",
+        "Snapshot": "rocket_twin.utils.checkpoint",
+        "run_branches": "rocket_twin.utils.run_branches",
+    },
+)
@@ -0,0 +1,233 @@
+import numpy as np
+
+
+class BatchFlight:
+    """Vertical flight of many rockets at once, integrated with a vectorized RK4 scheme.
+
+    Each case is a rocket described by arrays of shape (n_cases, n_stages). The models are
+    those of the CoSApp rocket: the active stage burns its propellant at `w_out_max` with the
+    `EnginePerfo` thrust law, the `Dynamics` gravity is applied to the whole rocket, and the
+    `RocketControllerCoSApp` staging logic drops the active stage when it is empty. Steps are
+    split at the exact emptying time of each case, since the propellant flow is constant.
+
+    Inputs
+    ------
+    weight_dry [kg]: np.ndarray,
+        weight of each stage without propellant
+    weight_prop [kg]: np.ndarray,
+        initial propellant weight of each stage
+    w_out_max [kg/s]: np.ndarray,
+        fuel output rate of each stage
+    isp [s]: np.ndarray,
+        specific impulsion of each stage
+    g_0 [m/s**2]: float,
+        gravity at Earth's surface, used by the thrust law
+    g [m/s**2]: float,
+        gravity
+
+    Outputs
+    ------
+    time [s]: float,
+        current time
+    stage: np.ndarray,
+        index of the active stage of each case, starting at 0
+    burning: np.ndarray,
+        whether the active stage of each case is still burning
+    weight_p [kg]: np.ndarray,
+        propellant weight of each stage
+    v [m/s]: np.ndarray,
+        velocity of each case
+    z [m]: np.ndarray,
+        altitude of each case
+    """
+
+    def __init__(self, weight_dry, weight_prop, w_out_max, isp, g_0=10.0, g=-10.0):
+
+        weight_dry, weight_prop, w_out_max, isp = np.broadcast_arrays(
+            *(
+                np.atleast_2d(np.asarray(x, dtype=float))
+                for x in (weight_dry, weight_prop, w_out_max, isp)
+            )
+        )
+        self.n_cases, self.n_stages = weight_dry.shape
+
+        self.weight_dry = weight_dry.copy()
+        self.w_out_max = w_out_max.copy()
+        self.isp = isp.copy()
+        self.g_0 = g_0
+        self.g = g
+
+        self.time = 0.0
+        self.stage = np.zeros(self.n_cases, dtype=int)
+        self.burning = np.ones(self.n_cases, dtype=bool)
+        self.weight_p = weight_prop.copy()
+        self.v = np.zeros(self.n_cases)
+        self.z = np.zeros(self.n_cases)
+
+    @classmethod
+    def from_rocket(cls, rocket, n_cases=1):
+        """Create a batch of identical cases from the current state of a CoSApp rocket.
+
+        Inputs
+        ------
+        rocket: Rocket,
+            the rocket, computed at least once
+        n_cases: int,
+            number of cases
+
+        Outputs
+        ------
+        batch: BatchFlight,
+            batch of `n_cases` copies of the rocket
+        """
+        stages = [rocket[f"stage_{i}"] for i in range(1, rocket.n_stages + 1)]
+
+        weight_prop = [stage.tank.fuel.weight_p for stage in stages]
+        weight_dry = [stage.geom.weight - stage.weight_prop for stage in stages]
+        w_out_max = [stage.tank.fuel.w_out_max for stage in stages]
+        isp = [stage.engine.perfo.isp for stage in stages]
+
+        batch = cls(
+            np.tile(weight_dry, (n_cases, 1)),
+            np.tile(weight_prop, (n_cases, 1)),
+            np.tile(w_out_max, (n_cases, 1)),
+            np.tile(isp, (n_cases, 1)),
+            g_0=stages[0].engine.perfo.g_0,
+            g=np.asarray(rocket.dyn.g).flat[-1],
+        )
+        batch.stage[:] = rocket.stage - 1
+
+        return batch
+
+    @property
+    def is_on(self):
+        """np.ndarray: whether each stage of each case is on."""
+        return (np.arange(self.n_stages) == self.stage[:, None]) & self.burning[:, None]
+
+    @property
+    def attached(self):
+        """np.ndarray: whether each stage of each case is still attached to the rocket."""
+        return np.arange(self.n_stages) >= self.stage[:, None]
+
+    @property
+    def weight(self):
+        """np.ndarray: rocket weight of each case."""
+        return np.sum((self.weight_dry + self.weight_p) * self.attached, axis=1)
+
+    @property
+    def a(self):
+        """np.ndarray: rocket acceleration of each case."""
+        return self.derivatives(self.weight_p, self.is_on)[1]
+
+    def derivatives(self, weight_p, is_on):
+        """Compute the time derivatives of the propellant weights and of the velocity.
+
+        Inputs
+        ------
+        weight_p [kg]: np.ndarray,
+            propellant weight of each stage
+        is_on: np.ndarray,
+            whether each stage is on
+
+        Outputs
+        ------
+        w_out [kg/s]: np.ndarray,
+            fuel output rate of each stage
+        a [m/s**2]: np.ndarray,
+            rocket acceleration
+        """
+        w_out = self.w_out_max * is_on
+        thrust = np.sum(self.isp * w_out * self.g_0, axis=1)
+        weight = np.sum((self.weight_dry + weight_p) * self.attached, axis=1)
+
+        return w_out, thrust / weight + self.g
+
+    def advance(self, h):
+        """Advance every case by its own time step with one RK4 step, without staging.
+
+        Inputs
+        ------
+        h [s]: np.ndarray,
+            time step of each case
+        """
+        is_on = self.is_on
+        h_s = h[:, None]
+
+        w_1, a_1 = self.derivatives(self.weight_p, is_on)
+        w_2, a_2 = self.derivatives(self.weight_p - 0.5 * h_s * w_1, is_on)
+        w_3, a_3 = self.derivatives(self.weight_p - 0.5 * h_s * w_2, is_on)
+        w_4, a_4 = self.derivatives(self.weight_p - h_s * w_3, is_on)
+
+        self.z += h * self.v + h**2 / 6.0 * (a_1 + a_2 + a_3)
+        self.v += h / 6.0 * (a_1 + 2.0 * a_2 + 2.0 * a_3 + a_4)
+        self.weight_p -= h_s / 6.0 * (w_1 + 2.0 * w_2 + 2.0 * w_3 + w_4)
+
+    def step(self, dt):
+        """Advance all cases by `dt`, splitting the step at staging events.
+
+        Inputs
+        ------
+        dt [s]: float,
+            time step
+        """
+        remaining = np.full(self.n_cases, float(dt))
+        cases = np.arange(self.n_cases)
+
+        while np.any(remaining > 0.0):
+            w_out = self.w_out_max[cases, self.stage]
+            prop = self.weight_p[cases, self.stage]
+            with np.errstate(divide="ignore"):
+                t_empty = np.where(self.burning & (w_out > 0.0), prop / w_out, np.inf)
+
+            empty = t_empty <= remaining
+            h = np.where(empty, t_empty, remaining)
+            self.advance(h)
+            remaining = np.where(empty, remaining - h, 0.0)
+
+            # Staging, as in RocketControllerCoSApp
+            self.weight_p[cases[empty], self.stage[empty]] = 0.0
+            last = self.stage == self.n_stages - 1
+            self.burning[empty & last] = False
+            self.stage[empty & ~last] += 1
+
+        self.time += dt
+
+    def run(self, duration, dt):
+        """Integrate all cases over a time interval and record their states.
+
+        Inputs
+        ------
+        duration [s]: float,
+            length of the time interval
+        dt [s]: float,
+            time step
+
+        Outputs
+        ------
+        data: dictionary,
+            recorded "time", "a", "v", "z", "weight", "stage" arrays of shape
+            (n_steps + 1, n_cases) and "weight_prop" of shape (n_steps + 1, n_cases, n_stages)
+        """
+        n_steps = int(round(duration / dt))
+        data = {
+            "time": np.zeros(n_steps + 1),
+            "a": np.zeros((n_steps + 1, self.n_cases)),
+            "v": np.zeros((n_steps + 1, self.n_cases)),
+            "z": np.zeros((n_steps + 1, self.n_cases)),
+            "weight": np.zeros((n_steps + 1, self.n_cases)),
+            "stage": np.zeros((n_steps + 1, self.n_cases), dtype=int),
+            "weight_prop": np.zeros((n_steps + 1, self.n_cases, self.n_stages)),
+        }
+
+        for n in range(n_steps + 1):
+            if n > 0:
+                self.step(dt)
+            data["time"][n] = self.time
+            data["a"][n] = self.a
+            data["v"][n] = self.v
+            data["z"][n] = self.z
+            data["weight"][n] = self.weight
+            data["stage"][n] = self.stage
+            data["weight_prop"][n] = self.weight_p
+
+        return data
@@ -0,0 +1,177 @@
+import json
+import numbers
+
+import numpy as np
+from cosapp.core.time import UniversalClock
+from cosapp.multimode.zeroCrossing import EventDirection, ZeroCrossing
+
+
+def _encode(value):
+    """Convert a variable value to JSON, or return None if it is not serializable."""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, str):
+        return {"str": value}
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return {"array": value.tolist(), "dtype": value.dtype.str}
+    return None
+
+
+def _decode(value):
+    """Convert a JSON value back to a variable value."""
+    if isinstance(value, dict):
+        if "str" in value:
+            return value["str"]
+        return np.array(value["array"], dtype=value["dtype"])
+    return value
+
+
+class Snapshot:
+    """State of a system tree at a point in time, to resume a simulation from it.
+
+    The snapshot holds the time, the numerical, boolean and string values of every port
+    variable of the tree, the zero-crossing triggers of the events, and the topology of the
+    systems that change their children or connectors at events. Such systems provide a
+    `get_topology` method returning a JSON-serializable description, and a `set_topology`
+    method applying it. Values that cannot be serialized, such as pyoccad shapes and mass
+    properties, are not stored; they are recomputed at the next run of the tree.
+
+    Inputs
+    ------
+    time [s]: float,
+        time of the snapshot
+    values: dictionary,
+        value of each variable, by path from the head of the tree
+    triggers: dictionary,
+        expression and direction of each zero-crossing event, by path
+    topology: dictionary,
+        description of the topology of each system providing one, by path
+    """
+
+    def __init__(self, time, values, triggers=None, topology=None):
+
+        self.time = time
+        self.values = values
+        self.triggers = {} if triggers is None else triggers
+        self.topology = {} if topology is None else topology
+
+    @classmethod
+    def take(cls, system):
+        """Capture the state of a system tree.
+
+        Inputs
+        ------
+        system: System,
+            the head of the tree
+
+        Outputs
+        ------
+        snapshot: Snapshot,
+            the state of the tree at the current time
+        """
+        values, triggers, topology = {}, {}, {}
+
+        for child in system.tree():
+            path = system.get_path_to_child(child)
+            prefix = f"{path}." if path else ""
+
+            for port in (*child.inputs.values(), *child.outputs.values()):
+                for name in port:
+                    value = _encode(port[name])
+                    if value is not None:
+                        values[f"{prefix}{port.name}.{name}"] = value
+
+            for event in child.events():
+                if isinstance(event.trigger, ZeroCrossing):
+                    triggers[f"{prefix}{event.name}"] = [
+                        event.trigger.expression,
+                        event.trigger.direction.name,
+                    ]
+
+            if hasattr(child, "get_topology"):
+                topology[path] = child.get_topology()
+
+        return cls(float(system.time), values, triggers, topology)
+
+    def restore(self, system):
+        """Bring a system tree to the state of the snapshot.
+
+        The tree must have the same structure as the one of the snapshot, for instance a
+        fresh instance of the same class built with the same arguments. The topology is
+        applied first, then the triggers and the values, and the clock is set to the time of
+        the snapshot.
+
+        Inputs
+        ------
+        system: System,
+            the head of the tree
+        """
+        for path, topology in self.topology.items():
+            self._get(system, path).set_topology(topology)
+
+        for path, (expression, direction) in self.triggers.items():
+            owner, name = self._split(system, path, 1)
+            trigger = ZeroCrossing(expression, EventDirection[direction])
+            event = getattr(owner, name)
+            if event.trigger != trigger:
+                event.trigger = trigger
+
+        for path, value in self.values.items():
+            owner, (port, variable) = self._split(system, path, 2)
+            owner[port][variable] = _decode(value)
+
+        UniversalClock().reset(self.time)
+
+    @staticmethod
+    def _get(system, path):
+        """Return the system at `path` from the head of the tree."""
+        return system[path] if path else system
+
+    @classmethod
+    def _split(cls, system, path, size):
+        """Return the system of a path and the `size` last names of the path."""
+        names = path.split(".")
+        if size == 1:
+            return cls._get(system, ".".join(names[:-1])), names[-1]
+        return cls._get(system, ".".join(names[:-size])), names[-size:]
+
+    def to_dict(self):
+        """Return the snapshot as a JSON-serializable dictionary."""
+        return {
+            "time": self.time,
+            "values": self.values,
+            "triggers": self.triggers,
+            "topology": self.topology,
+        }
+
+    def save(self, path):
+        """Write the snapshot to a JSON file.
+
+        Inputs
+        ------
+        path: string,
+            the path of the JSON file
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path):
+        """Read a snapshot written by `save`.
+
+        Inputs
+        ------
+        path: string,
+            the path of the JSON file
+
+        Outputs
+        ------
+        snapshot: Snapshot,
+            the snapshot
+        """
+        with open(path) as file:
+            return cls(**json.load(file))
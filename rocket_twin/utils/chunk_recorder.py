@@ -0,0 +1,243 @@
+import copy
+import json
+import os
+import pathlib
+
+import numpy as np
+import pandas as pd
+from cosapp.recorders.recorder import BaseRecorder, make_wishlist
+
+INDEX = "index.json"
+
+
+class ChunkRecorder(BaseRecorder):
+    """Recorder streaming fixed-size chunks of columns to .npy archives on disk.
+
+    Records are buffered until `chunk_size` of them are collected, then each column is
+    converted to a numpy array and the chunk is written to a ``chunk_<n>.npz`` archive of the
+    folder. The index file of the folder holds the column names and the row count of each
+    chunk, and is updated after each chunk, so that the recording can be read lazily with
+    `ChunkReader`. The last partial chunk is written when the driver exits.
+
+    Inputs
+    ------
+    folder: string,
+        folder of the chunk files, created if needed and cleared at the first start
+    includes: string or list[string],
+        variables to record
+    excludes: string or list[string],
+        variables not to record
+    chunk_size: int,
+        number of records per chunk
+    hold: boolean,
+        whether the records of previous runs are kept at the next start
+    """
+
+    def __init__(
+        self,
+        folder,
+        includes="*",
+        excludes=None,
+        numerical_only=False,
+        section="",
+        precision=9,
+        hold=False,
+        raw_output=True,
+        chunk_size=1000,
+    ):
+        super().__init__(includes, excludes, numerical_only, section, precision, hold, raw_output)
+        self.folder = pathlib.Path(folder)
+        self.chunk_size = chunk_size
+        self.__buffer = []
+        self.__rows = []
+        self.__started = False
+
+    @classmethod
+    def extend(cls, recorder, includes=None, excludes=None):
+        """Return a recorder writing to the same folder, with extended variable patterns."""
+        return cls(
+            recorder.folder,
+            recorder.includes + make_wishlist(includes, "includes"),
+            recorder.excludes + make_wishlist(excludes, "excludes"),
+            recorder._numerical_only,
+            recorder.section,
+            recorder.precision,
+            recorder.hold,
+            recorder._raw_output,
+            recorder.chunk_size,
+        )
+
+    def headers(self):
+        """Return the column names of the records."""
+        headers = [
+            self.SPECIALS.section,
+            self.SPECIALS.status,
+            self.SPECIALS.code,
+            self.SPECIALS.reference,
+        ]
+        varlist = self.field_names()
+        if self._raw_output:
+            headers.extend(varlist)
+        else:
+            headers.extend(f"{v} [{u}]" for v, u in zip(varlist, self._get_units(varlist)))
+        return headers
+
+    @property
+    def _raw_data(self):
+        """list[list]: records not yet written to disk."""
+        return self.__buffer
+
+    def start(self):
+        """Initialize recording support."""
+        super().start()
+        if not self.__started or not self.hold:
+            self.__remove_chunks()
+        self.__started = True
+
+    def formatted_data(self):
+        """Collect recorded data from watched object into a list."""
+        return [copy.deepcopy(value) for value in self.collected_data()]
+
+    def _record(self, line):
+        self.__buffer.append(line)
+        if len(self.__buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records as a new chunk."""
+        if not self.__buffer:
+            return
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+        columns = {f"c{i}": _column(values) for i, values in enumerate(zip(*self.__buffer))}
+        path = self.folder / f"chunk_{len(self.__rows):06d}.npz"
+        _write(path, lambda file: np.savez(file, **columns))
+
+        self.__rows.append(len(self.__buffer))
+        self.__buffer.clear()
+        index = {"columns": self.headers(), "rows": self.__rows}
+        _write(self.folder / INDEX, lambda file: file.write(json.dumps(index).encode()))
+
+    def exit(self):  # noqa: A003
+        """Close recording session."""
+        self.flush()
+
+    def export_data(self):
+        """Export recorded results into a pandas.DataFrame object."""
+        self.flush()
+        if not self.__rows:
+            return pd.DataFrame(columns=self.headers())
+        return ChunkReader(self.folder).to_dataframe()
+
+    def clear(self):
+        """Clear all previously stored data."""
+        self.__remove_chunks()
+        super().clear()
+
+    def __remove_chunks(self):
+        self.__buffer.clear()
+        self.__rows = []
+        for path in self.folder.glob("chunk_*.npz"):
+            path.unlink()
+        if (self.folder / INDEX).exists():
+            (self.folder / INDEX).unlink()
+
+
+class ChunkReader:
+    """Lazy reader of the recordings of one or more `ChunkRecorder` folders.
+
+    The folders, for instance the fueling and flight phases of a mission, are exposed as a
+    single table. Only the index files are read at creation, and columns or chunks are
+    loaded on request.
+
+    Inputs
+    ------
+    folders: string,
+        folders of the recordings, in order
+    """
+
+    def __init__(self, *folders):
+        self.chunks = []
+        self.rows = []
+        self.columns = None
+
+        for folder in map(pathlib.Path, folders):
+            with open(folder / INDEX) as file:
+                index = json.load(file)
+            if self.columns is None:
+                self.columns = index["columns"]
+            elif index["columns"] != self.columns:
+                raise ValueError(f"Columns of {str(folder)!r} differ from the previous ones")
+            self.chunks.extend(folder / f"chunk_{n:06d}.npz" for n in range(len(index["rows"])))
+            self.rows.extend(index["rows"])
+
+    def __len__(self):
+        """Return the number of records."""
+        return sum(self.rows)
+
+    @property
+    def shape(self):
+        """tuple[int, int]: number of rows and columns of the table."""
+        return len(self), len(self.columns)
+
+    def __getitem__(self, column):
+        """Load a single column of the table as an array."""
+        key = f"c{self.columns.index(column)}"
+        arrays = []
+        for path in self.chunks:
+            with np.load(path, allow_pickle=True) as chunk:
+                arrays.append(chunk[key])
+        return np.concatenate(arrays) if arrays else np.array([])
+
+    def iter_chunks(self, columns=None):
+        """Iterate over the chunks of the table, loaded one at a time.
+
+        Inputs
+        ------
+        columns: list[string],
+            columns to load, defaults to all of them
+
+        Outputs
+        ------
+        chunk: pd.DataFrame,
+            rows of the chunk, indexed by their position in the table
+        """
+        columns = self.columns if columns is None else list(columns)
+        keys = [f"c{self.columns.index(column)}" for column in columns]
+        start = 0
+
+        for path, rows in zip(self.chunks, self.rows):
+            with np.load(path, allow_pickle=True) as chunk:
+                data = {column: _values(chunk[key]) for column, key in zip(columns, keys)}
+            yield pd.DataFrame(data, columns=columns, index=pd.RangeIndex(start, start + rows))
+            start += rows
+
+    def to_dataframe(self, columns=None):
+        """Load the table, or some of its columns, in a DataFrame."""
+        if not self.chunks:
+            return pd.DataFrame(columns=self.columns if columns is None else list(columns))
+        return pd.concat(self.iter_chunks(columns))
+
+
+def _column(values):
+    """Convert the values of a column to an array, of objects if they are not homogeneous."""
+    try:
+        return np.asarray(values)
+    except ValueError:
+        column = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            column[i] = value
+        return column
+
+
+def _values(column):
+    """Convert a column array to DataFrame values, with one item per row."""
+    return column if column.ndim == 1 else list(column)
+
+
+def _write(path, write):
+    """Write a file through a temporary file, so that readers never see a partial file."""
+    temporary = path.with_name(path.name + ".tmp")
+    with open(temporary, "wb") as file:
+        write(file)
+    os.replace(temporary, path)
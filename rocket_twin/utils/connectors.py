@@ -0,0 +1,38 @@
+from cosapp.ports.connectors import BaseConnector
+
+
+class IndexConnector(BaseConnector):
+    """Connector transferring variables into one element of array variables.
+
+    Several connectors may fill the same sink array, each at its own index, so that scalar
+    outputs of many systems can feed a single contiguous NumPy input. The sink variables
+    are reported with their index (e.g. "F[0, 2]") to tell the connectors apart.
+
+    Inputs
+    ------
+    index: int or tuple[int],
+        index of the sink array elements set by the connector
+    indexed: bool,
+        whether the sink variables are reported with their index
+    """
+
+    def __init__(self, name, sink, source, mapping=None, index=0):
+        # The base class checks the plain variable names against the ports
+        self.indexed = False
+        super().__init__(name, sink, source, mapping)
+        self.index = index
+        self.indexed = True
+
+    def sink_variables(self):
+        if not self.indexed:
+            return super().sink_variables()
+        index = self.index if isinstance(self.index, tuple) else (self.index,)
+        suffix = "[" + ", ".join(str(i) for i in index) + "]"
+        return [target + suffix for target in self._mapping]
+
+    def transfer(self):
+        source, sink = self.source, self.sink
+
+        for target, origin in self._mapping.items():
+            getattr(sink, target)[self.index] = getattr(source, origin)
+        sink.touch()
@@ -0,0 +1,280 @@
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+CONTROLLERS = ("station_controller", "rocket_controller", "stage_controller")
+
+
+@functools.lru_cache(maxsize=None)
+def omc_version():
+    """Return the version of the OpenModelica compiler, asked once per process."""
+    from OMPython import OMCSessionZMQ
+
+    return str(OMCSessionZMQ().sendExpression("getVersion()"))
+
+
+def omc_executable():
+    """Return the path of the OpenModelica compiler started by OMPython, None if not found."""
+    home = os.environ.get("OPENMODELICAHOME")
+    if home is None:
+        return shutil.which("omc")
+    path = os.path.join(home, "bin", "omc.exe" if os.name == "nt" else "omc")
+    return path if os.path.exists(path) else None
+
+
+def build_fmu(model_path, model_name, directory):
+    """Compile a Modelica model into an FMU with OpenModelica.
+
+    The compiler works in `directory`, and the working directory of the process is left
+    unchanged.
+
+    Inputs
+    ------
+    model_path: string,
+        the path of the .mo file
+    model_name: string,
+        the name of the model
+    directory: string,
+        the folder where the FMU is built
+
+    Outputs
+    ------
+    fmu: string,
+        the path to the .fmu file
+    """
+    from OMPython import ModelicaSystem
+
+    mod = ModelicaSystem(
+        str(model_path).replace("\\", "/"),
+        model_name,
+        customBuildDirectory=str(directory).replace("\\", "/"),
+    )
+    fmu = mod.convertMo2Fmu()
+
+    return os.path.join(directory, fmu)
+
+
+class FMUCache:
+    """On-disk cache of the FMUs compiled from Modelica models.
+
+    Each FMU is stored under a hash of the .mo source and the model name, followed by a hash
+    of the compiler version, so that a model is compiled once and reused by later runs and
+    other processes, and recompiled whenever its source or the compiler changes. Asking the
+    version to OpenModelica opens a session, so the answer is stored in the cache folder for
+    the path and modification time of the omc executable, and only asked again when the
+    executable changes. Models are compiled in temporary folders and moved atomically into
+    the cache, so that several threads or processes can fill the same cache. Within a
+    process, a model is compiled only once.
+
+    Inputs
+    ------
+    folder: string,
+        cache folder, defaults to the ROCKET_TWIN_FMU_CACHE environment variable or to
+        ~/.cache/rocket_twin/fmu
+    compiler_version: string,
+        version of the compiler, read from the cache folder or asked to OpenModelica if not
+        given
+    build: callable,
+        function compiling a model, with the signature of `build_fmu`
+
+    Outputs
+    ------
+    hits: int,
+        number of FMUs found in the cache
+    misses: int,
+        number of FMUs that had to be compiled
+    """
+
+    def __init__(self, folder=None, compiler_version=None, build=build_fmu):
+
+        if folder is None:
+            folder = os.environ.get(
+                "ROCKET_TWIN_FMU_CACHE", os.path.join("~", ".cache", "rocket_twin", "fmu")
+            )
+        self.folder = pathlib.Path(folder).expanduser()
+        self._compiler_version = compiler_version
+        self.build = build
+        self.hits = 0
+        self.misses = 0
+        self._locks = {}
+        self._lock = threading.Lock()
+        self._version_lock = threading.Lock()
+
+    @property
+    def compiler_version(self):
+        """str: version of the compiler, part of the name of the cached FMUs."""
+        with self._version_lock:
+            if self._compiler_version is None:
+                self._compiler_version = self.stored_version()
+        return self._compiler_version
+
+    def stored_version(self):
+        """Return the version of the compiler stored for its executable.
+
+        The version is asked to OpenModelica and stored if the executable is unknown or has
+        changed.
+        """
+        executable = omc_executable()
+        if executable is None:
+            return omc_version()
+
+        executable = os.path.realpath(executable)
+        key = f"{executable}:{os.stat(executable).st_mtime_ns}"
+        path = self.folder / "compilers.json"
+        try:
+            with open(path) as file:
+                versions = json.load(file)
+        except (OSError, ValueError):
+            versions = {}
+        if key in versions:
+            return versions[key]
+
+        # Entries of a former executable at the same path are replaced
+        versions = {
+            other: version
+            for other, version in versions.items()
+            if other.rsplit(":", 1)[0] != executable
+        }
+        versions[key] = omc_version()
+        self.folder.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(prefix=".compilers-", dir=self.folder)
+        with os.fdopen(descriptor, "w") as file:
+            json.dump(versions, file, indent=2)
+        os.replace(temporary, path)
+        return versions[key]
+
+    def key(self, model_path, model_name):
+        """Return the hash of the .mo source and the model name."""
+        digest = hashlib.sha256()
+        with open(model_path, "rb") as file:
+            digest.update(file.read())
+        digest.update(b"\0" + model_name.encode())
+        return digest.hexdigest()
+
+    def path(self, model_path, model_name):
+        """Return the path of the FMU of a model built by the current compiler.
+
+        The path is returned whether the FMU exists or not.
+        """
+        version = hashlib.sha256(self.compiler_version.encode()).hexdigest()
+        return (
+            self.folder / f"{model_name}-{self.key(model_path, model_name)[:16]}-{version[:8]}.fmu"
+        )
+
+    def get(self, model_path, model_name):
+        """Return the path of the FMU of a model, compiling it if it is not cached.
+
+        Inputs
+        ------
+        model_path: string,
+            the path of the .mo file
+        model_name: string,
+            the name of the model
+
+        Outputs
+        ------
+        fmu: string,
+            the path to the cached .fmu file
+        """
+        path = self.path(model_path, model_name)
+        with self._lock:
+            lock = self._locks.setdefault(path, threading.Lock())
+
+        with lock:
+            if path.exists():
+                self.hits += 1
+                return str(path)
+
+            self.misses += 1
+            self.folder.mkdir(parents=True, exist_ok=True)
+            # The temporary folder is on the same file system, for an atomic replacement
+            directory = tempfile.mkdtemp(prefix=f".{model_name}-", dir=self.folder)
+            try:
+                fmu = self.build(model_path, model_name, directory)
+                os.replace(fmu, path)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+        return str(path)
+
+    def get_many(self, models, workers=None):
+        """Return the paths of the FMUs of several models, compiling the missing ones.
+
+        The missing FMUs are compiled in parallel.
+
+        Inputs
+        ------
+        models: list[tuple[string, string]],
+            the .mo file path and the name of each model
+        workers: int,
+            number of parallel compilations, defaults to the number of models
+
+        Outputs
+        ------
+        fmus: list[string],
+            the paths to the cached .fmu files
+        """
+        models = list(models)
+        with ThreadPoolExecutor(max_workers=workers or max(1, len(models))) as executor:
+            return list(executor.map(lambda model: self.get(*model), models))
+
+    def invalidate(self, model_name=None):
+        """Remove the cached FMUs of a model, or all of them.
+
+        Inputs
+        ------
+        model_name: string,
+            the name of the model, all models if None
+
+        Outputs
+        ------
+        count: int,
+            number of removed FMUs
+        """
+        pattern = "*.fmu" if model_name is None else f"{model_name}-*.fmu"
+        paths = list(self.folder.glob(pattern))
+        if model_name is not None:
+            paths = [path for path in paths if path.stem.rsplit("-", 2)[0] == model_name]
+        for path in paths:
+            path.unlink()
+        return len(paths)
+
+    def info(self):
+        """Return the cache statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(list(self.folder.glob("*.fmu"))),
+            "folder": str(self.folder),
+        }
+
+
+fmu_cache = FMUCache()
+
+
+def build_controllers(cache=None, workers=None):
+    """Compile the station, rocket and stage controller FMUs in parallel.
+
+    Inputs
+    ------
+    cache: FMUCache,
+        the cache receiving the FMUs, defaults to `fmu_cache`
+    workers: int,
+        number of parallel compilations
+
+    Outputs
+    ------
+    fmus: dictionary,
+        the path to the .fmu file of each controller
+    """
+    cache = fmu_cache if cache is None else cache
+    folder = pathlib.Path(__file__).parents[1] / "systems" / "control"
+    models = [(folder / f"{name}.mo", name) for name in CONTROLLERS]
+
+    return dict(zip(CONTROLLERS, cache.get_many(models, workers=workers)))
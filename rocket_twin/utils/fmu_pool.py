@@ -0,0 +1,205 @@
+import shutil
+import threading
+from collections import defaultdict
+
+
+def instantiate_slave(model_description, unzipdir, instance_name):
+    """Load the binary of an unpacked FMU and instantiate a co-simulation slave.
+
+    Inputs
+    ------
+    model_description: fmpy.model_description.ModelDescription,
+        the model description of the FMU
+    unzipdir: string,
+        the folder of the unpacked FMU
+    instance_name: string,
+        the name of the instance
+
+    Outputs
+    ------
+    slave: fmpy.fmi2.FMU2Slave,
+        the instantiated slave
+    """
+    from fmpy.fmi2 import FMU2Slave
+
+    slave = FMU2Slave(
+        guid=model_description.guid,
+        unzipDirectory=unzipdir,
+        modelIdentifier=model_description.coSimulation.modelIdentifier,
+        instanceName=instance_name,
+    )
+    slave.instantiate()
+    return slave
+
+
+def unpack_fmu(fmu_path):
+    """Read the model description of an FMU and unpack it in a temporary folder.
+
+    Inputs
+    ------
+    fmu_path: string,
+        the path to the .fmu file
+
+    Outputs
+    ------
+    model_description: fmpy.model_description.ModelDescription,
+        the model description of the FMU
+    unzipdir: string,
+        the folder of the unpacked FMU
+    """
+    from fmpy import extract, read_model_description
+
+    return read_model_description(fmu_path), extract(fmu_path)
+
+
+class PooledFMU:
+    """Co-simulation slave of an FMU, lent by an `FMUPool`.
+
+    Inputs
+    ------
+    fmu_path: string,
+        the path to the .fmu file
+    model_description: fmpy.model_description.ModelDescription,
+        the model description of the FMU
+    slave: fmpy.fmi2.FMU2Slave,
+        the instantiated slave
+    """
+
+    def __init__(self, fmu_path, model_description, slave):
+
+        self.fmu_path = fmu_path
+        self.model_description = model_description
+        self.slave = slave
+        self.initialized = False
+
+    def initialize(self, start_time=0.0):
+        """Reset the slave if it was used, and initialize it for a new simulation."""
+        if self.initialized:
+            self.slave.reset()
+        self.slave.setupExperiment(startTime=start_time)
+        self.slave.enterInitializationMode()
+        self.slave.exitInitializationMode()
+        self.initialized = True
+
+    def free(self):
+        """Terminate the slave and unload its binary."""
+        if self.initialized:
+            self.slave.terminate()
+        self.slave.freeInstance()
+
+
+class FMUPool:
+    """Bounded pool of unpacked FMUs and instantiated co-simulation slaves.
+
+    Each FMU is unpacked once, and its slaves are lent to the systems that need one. A
+    released slave is kept for the next request of the same FMU, and reset before its next
+    simulation, so that systems created one after the other, for instance in the cases of an
+    ensemble, skip the unpacking, loading and instantiation of their FMUs. At most `maxsize`
+    idle slaves are kept, the older ones are freed first.
+
+    Inputs
+    ------
+    maxsize: int,
+        maximum number of idle slaves kept in the pool
+    unpack: callable,
+        function unpacking an FMU, with the signature of `unpack_fmu`
+    instantiate: callable,
+        function instantiating a slave, with the signature of `instantiate_slave`
+
+    Outputs
+    ------
+    hits: int,
+        number of requests answered with an idle slave
+    misses: int,
+        number of requests that had to instantiate a slave
+    """
+
+    def __init__(self, maxsize=16, unpack=unpack_fmu, instantiate=instantiate_slave):
+
+        self.maxsize = maxsize
+        self.unpack = unpack
+        self.instantiate = instantiate
+        self.hits = 0
+        self.misses = 0
+        self._unpacked = {}
+        self._idle = defaultdict(list)
+        self._order = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of idle slaves."""
+        return len(self._order)
+
+    def acquire(self, fmu_path, instance_name="instance"):
+        """Lend a slave of an FMU, reusing an idle one if any.
+
+        Inputs
+        ------
+        fmu_path: string,
+            the path to the .fmu file
+        instance_name: string,
+            the name of a new instance
+
+        Outputs
+        ------
+        fmu: PooledFMU,
+            the slave, to be initialized before use and given back with `release`
+        """
+        fmu_path = str(fmu_path)
+        with self._lock:
+            if self._idle[fmu_path]:
+                self.hits += 1
+                fmu = self._idle[fmu_path].pop()
+                self._order.remove(fmu)
+                return fmu
+
+            self.misses += 1
+            if fmu_path not in self._unpacked:
+                self._unpacked[fmu_path] = self.unpack(fmu_path)
+            model_description, unzipdir = self._unpacked[fmu_path]
+
+        slave = self.instantiate(model_description, unzipdir, instance_name)
+        return PooledFMU(fmu_path, model_description, slave)
+
+    def release(self, fmu):
+        """Give a slave back to the pool, freeing the oldest idle one if the pool is full."""
+        with self._lock:
+            self._idle[fmu.fmu_path].append(fmu)
+            self._order.append(fmu)
+            freed = []
+            while len(self._order) > self.maxsize:
+                oldest = self._order.pop(0)
+                self._idle[oldest.fmu_path].remove(oldest)
+                freed.append(oldest)
+
+        for oldest in freed:
+            oldest.free()
+
+    def clear(self):
+        """Free the idle slaves, remove the unpacked FMUs and reset the counters.
+
+        Lent slaves must not be used after the clearing.
+        """
+        with self._lock:
+            idle, self._order = self._order, []
+            self._idle.clear()
+            unpacked, self._unpacked = self._unpacked, {}
+            self.hits = 0
+            self.misses = 0
+
+        for fmu in idle:
+            fmu.free()
+        for _, unzipdir in unpacked.values():
+            shutil.rmtree(unzipdir, ignore_errors=True)
+
+    def info(self):
+        """Return the pool statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "idle": len(self._order),
+            "maxsize": self.maxsize,
+        }
+
+
+fmu_pool = FMUPool()
@@ -0,0 +1,68 @@
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.TopTools import TopTools_ListOfShape
+
+
+def fuse_shapes(shapes, parallel=True):
+    """Fuse a list of shapes with a single multi-argument boolean operation.
+
+    The first shape is the argument of OCCT's General Fuse and the others are its tools, so
+    all intersections are computed at once instead of in a chain of pairwise fusions over a
+    growing shape. If the operation fails, a balanced pairwise fusion is used instead.
+
+    Inputs
+    ------
+    shapes: list[TopoDS_Shape],
+        the shapes to fuse
+    parallel: boolean,
+        whether OCCT may run the operation on several threads
+
+    Outputs
+    ------
+    fusion: TopoDS_Shape,
+        fusion of all shapes
+    """
+    shapes = list(shapes)
+    if len(shapes) == 1:
+        return shapes[0]
+
+    arguments = TopTools_ListOfShape()
+    arguments.Append(shapes[0])
+    tools = TopTools_ListOfShape()
+    for shape in shapes[1:]:
+        tools.Append(shape)
+
+    fuse = BRepAlgoAPI_Fuse()
+    fuse.SetArguments(arguments)
+    fuse.SetTools(tools)
+    fuse.SetRunParallel(parallel)
+    fuse.Build()
+
+    if not fuse.IsDone():
+        return fuse_tree(shapes)
+
+    return fuse.Shape()
+
+
+def fuse_tree(shapes):
+    """Fuse a list of shapes pairwise along a balanced binary tree.
+
+    Inputs
+    ------
+    shapes: list[TopoDS_Shape],
+        the shapes to fuse
+
+    Outputs
+    ------
+    fusion: TopoDS_Shape,
+        fusion of all shapes
+    """
+    shapes = list(shapes)
+    while len(shapes) > 1:
+        fused = [
+            BRepAlgoAPI_Fuse(shapes[i], shapes[i + 1]).Shape() for i in range(0, len(shapes) - 1, 2)
+        ]
+        if len(shapes) % 2:
+            fused.append(shapes[-1])
+        shapes = fused
+
+    return shapes[0]
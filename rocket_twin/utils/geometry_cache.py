@@ -0,0 +1,84 @@
+from collections import OrderedDict
+
+
+class GeometryCache:
+    """Bounded LRU cache of pyoccad models and volume properties.
+
+    Geometry systems key their entries on the tuple of their geometric inwards, so that
+    identical components, in the same system or in different ones, share their models
+    instead of rebuilding them at each computation.
+
+    Inputs
+    ------
+    maxsize: int,
+        maximum number of entries kept in the cache
+
+    Outputs
+    ------
+    hits: int,
+        number of lookups answered from the cache
+    misses: int,
+        number of lookups that had to create the entry
+    """
+
+    def __init__(self, maxsize=256):
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Whether `key` has an entry, without counting a lookup."""
+        return key in self._entries
+
+    def get(self, key, create):
+        """Return the entry stored under `key`, creating it with `create()` if missing.
+
+        Inputs
+        ------
+        key: tuple,
+            hashable description of the geometry
+        create: callable,
+            function without arguments returning the value to cache
+
+        Outputs
+        ------
+        value: object,
+            cached value
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = create()
+            self._entries[key] = value
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+        return value
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Return the cache statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+geometry_cache = GeometryCache()
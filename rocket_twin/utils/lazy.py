@@ -0,0 +1,56 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """Package whose attributes are imported from their modules on first access.
+
+    An attribute named after its own module (e.g. the `fmu_cache` instance of the
+    `fmu_cache` module) is not replaced by the module when the import system loads it.
+    """
+
+    def __getattr__(self, name):
+        """Import an attribute that was not accessed yet from its module."""
+        try:
+            module = self._modules[name]
+        except KeyError:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(module), name)
+        setattr(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        """Set an attribute, unless it is a submodule named after its own attribute."""
+        # The import system sets each loaded module as an attribute of its package
+        if isinstance(value, ModuleType) and value.__name__ == self._modules.get(name):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        """Names of the loaded and of the lazy attributes."""
+        return sorted(set(vars(self)) | set(self.__all__))
+
+
+def lazy_module(name, modules):
+    """Make a package import its attributes from their modules on first access.
+
+    Importing the package then does not load the dependencies of its modules.
+
+    Inputs
+    ------
+    name: string,
+        the name of the package
+    modules: dictionary,
+        the module of each attribute
+
+    Outputs
+    ------
+    names: list[string],
+        the names of the attributes, in the order of `modules`
+    """
+    package = sys.modules[name]
+    package._modules = modules
+    package.__class__ = LazyModule
+    return list(modules)
@@ -0,0 +1,328 @@
+import numpy as np
+from numpy.polynomial import Polynomial
+
+from rocket_twin.utils.geometry_cache import geometry_cache
+
+
+class MassProperties:
+    """Closed-form mass properties of a rigid body.
+
+    The body is described by its raw moments about the global origin, which makes the
+    properties of an assembly the plain sum of the properties of its components.
+
+    Inputs
+    ------
+    mass [kg]: float,
+        total mass
+    first [kg*m]: np.ndarray,
+        first moment of mass (3,)
+    second [kg*m**2]: np.ndarray,
+        second moment of mass about the origin, integral of x_i * x_j (3, 3)
+    """
+
+    def __init__(self, mass=0.0, first=None, second=None):
+
+        self.mass = float(mass)
+        self.first = np.zeros(3) if first is None else np.asarray(first, dtype=float)
+        self.second = np.zeros((3, 3)) if second is None else np.asarray(second, dtype=float)
+
+    def __repr__(self):
+        """Mass and center of gravity of the body."""
+        return f"MassProperties(mass={self.mass}, cg={self.cg.tolist()})"
+
+    def __add__(self, other):
+        """Properties of the union of two disjoint bodies."""
+        return MassProperties(
+            self.mass + other.mass, self.first + other.first, self.second + other.second
+        )
+
+    def __sub__(self, other):
+        """Properties of a body with another one carved out of it."""
+        return MassProperties(
+            self.mass - other.mass, self.first - other.first, self.second - other.second
+        )
+
+    def __mul__(self, density):
+        """Properties of a unit-density body made of a material of the given density."""
+        return MassProperties(self.mass * density, self.first * density, self.second * density)
+
+    __rmul__ = __mul__
+
+    @property
+    def cg(self):
+        """np.ndarray: center of gravity."""
+        if self.mass == 0.0:
+            return np.zeros(3)
+        return self.first / self.mass
+
+    @property
+    def inertia(self):
+        """np.ndarray: inertia matrix about the center of gravity."""
+        central = self.central_second()
+        return np.trace(central) * np.eye(3) - central
+
+    def central_second(self):
+        """Second moment of mass about the center of gravity."""
+        if self.mass == 0.0:
+            return np.zeros((3, 3))
+        return self.second - np.outer(self.first, self.first) / self.mass
+
+    def rotated_z(self, angle):
+        """Properties of the body rotated by `angle` [rad] around the z axis."""
+        c, s = np.cos(angle), np.sin(angle)
+        rot = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+        return MassProperties(self.mass, rot @ self.first, rot @ self.second @ rot.T)
+
+    def to_gprops(self):
+        """Convert to an OCC `GProp_GProps` with the same mass, center and inertia.
+
+        The body is replaced by six point masses placed on its principal axes, which
+        reproduce the mass, the center of gravity and the inertia matrix exactly.
+
+        Outputs
+        ------
+        props: GProp_GProps,
+            equivalent OCC properties
+        """
+        from OCC.Core.gp import gp_Pnt
+        from OCC.Core.GProp import GProp_GProps, GProp_PGProps
+
+        props = GProp_GProps()
+        if self.mass <= 0.0:
+            return props
+
+        cg = self.cg
+        moments, axes = np.linalg.eigh(self.central_second())
+        points = GProp_PGProps()
+        for moment, axis in zip(np.clip(moments, 0.0, None), axes.T):
+            offset = np.sqrt(3.0 * moment / self.mass) * axis
+            for sign in (1.0, -1.0):
+                points.AddPoint(gp_Pnt(*(cg + sign * offset)), self.mass / 6.0)
+
+        props.Add(points)
+        return props
+
+    @classmethod
+    def from_gprops(cls, props):
+        """Build mass properties from an OCC `GProp_GProps`.
+
+        Inputs
+        ------
+        props: GProp_GProps,
+            OCC properties
+
+        Outputs
+        ------
+        mass_props: MassProperties,
+            equivalent closed-form properties
+        """
+        mass = props.Mass()
+        if mass == 0.0:
+            return cls()
+
+        center = props.CentreOfMass()
+        cg = np.array([center.X(), center.Y(), center.Z()])
+        matrix = props.MatrixOfInertia()
+        inertia = np.array([[matrix.Value(i, j) for j in range(1, 4)] for i in range(1, 4)])
+        central = 0.5 * np.trace(inertia) * np.eye(3) - inertia
+
+        return cls(mass, mass * cg, central + mass * np.outer(cg, cg))
+
+
+def _integral(poly, upper):
+    """Integral of a polynomial between 0 and `upper`."""
+    primitive = poly.integ()
+    return primitive(upper) - primitive(0.0)
+
+
+def frustum(base_radius, top_radius, height, pos):
+    """Unit-density properties of a z-axis frustum.
+
+    Inputs
+    ------
+    base_radius [m]: float,
+        radius at z = pos
+    top_radius [m]: float,
+        radius at z = pos + height
+    height [m]: float,
+        height
+    pos [m]: float,
+        base center z-coordinate
+
+    Outputs
+    ------
+    props: MassProperties,
+        volume properties
+    """
+    slope = (top_radius - base_radius) / height if height != 0.0 else 0.0
+    radius = Polynomial([base_radius, slope])
+    z = Polynomial([pos, 1.0])
+    area = np.pi * radius**2
+
+    second = np.zeros((3, 3))
+    second[0, 0] = second[1, 1] = _integral(np.pi * radius**4 / 4.0, height)
+    second[2, 2] = _integral(z**2 * area, height)
+
+    return MassProperties(
+        _integral(area, height), np.array([0.0, 0.0, _integral(z * area, height)]), second
+    )
+
+
+def cone(radius, height, pos):
+    """Unit-density properties of a z-axis cone pointing upwards from z = pos."""
+    return frustum(radius, 0.0, height, pos)
+
+
+def cylinder(radius, height, pos):
+    """Unit-density properties of a z-axis cylinder going upwards from z = pos."""
+    return frustum(radius, radius, height, pos)
+
+
+def tank_structure(r_int, r_ext, height, thickness, pos):
+    """Unit-density properties of an empty cylindrical tank, as built by `TankGeom`.
+
+    Inputs
+    ------
+    r_int [m]: float,
+        internal radius
+    r_ext [m]: float,
+        external radius
+    height [m]: float,
+        height
+    thickness [m]: float,
+        base thickness
+    pos [m]: float,
+        base center z-coordinate
+
+    Outputs
+    ------
+    props: MassProperties,
+        volume properties
+    """
+    shell = cylinder(r_ext, height, pos) - cylinder(r_int, height, pos)
+    bottom = cylinder(r_ext, thickness, pos - thickness)
+
+    return shell + bottom
+
+
+def wings(n_wings, radius, pos, l_in, l_out, width, th):
+    """Unit-density properties of a set of trapezoidal wings, as built by `WingsGeom`.
+
+    Each wing is a right prism whose trapezoidal section lies in a radial plane and is
+    extruded by `th` in the tangential direction.
+
+    Inputs
+    ------
+    n_wings: int,
+        the number of wings
+    radius [m]: float,
+        the distance of the internal edges to the center
+    pos [m]: float,
+        the lower edges' z-coordinate
+    l_in [m]: float,
+        the length of the inner edges
+    l_out [m]: float,
+        the length of the outer edges
+    width [m]: float,
+        width
+    th [m]: float,
+        thickness
+
+    Outputs
+    ------
+    props: MassProperties,
+        volume properties
+    """
+    s = Polynomial([0.0, 1.0])
+    h = Polynomial([l_in, (l_out - l_in) / width])
+
+    area = _integral(h, width)
+    s_1 = _integral(s * h, width)
+    s_2 = _integral(s**2 * h, width)
+    z_1 = _integral(h**2 / 2.0, width)
+    z_2 = _integral(h**3 / 3.0, width)
+    sz = _integral(s * h**2 / 2.0, width)
+
+    # Local frame: u radial, v tangential, z axial
+    u_1 = radius * area + s_1
+    w_1 = pos * area + z_1
+    first = np.array([th * u_1, th**2 / 2.0 * area, th * w_1])
+
+    second = np.empty((3, 3))
+    second[0, 0] = th * (radius**2 * area + 2.0 * radius * s_1 + s_2)
+    second[1, 1] = th**3 / 3.0 * area
+    second[2, 2] = th * (pos**2 * area + 2.0 * pos * z_1 + z_2)
+    second[0, 1] = second[1, 0] = th**2 / 2.0 * u_1
+    second[0, 2] = second[2, 0] = th * (radius * w_1 + pos * s_1 + sz)
+    second[1, 2] = second[2, 1] = th**2 / 2.0 * w_1
+
+    wing = MassProperties(th * area, first, second)
+    theta = 2 * np.pi / n_wings
+
+    props = MassProperties()
+    for i in range(n_wings):
+        props = props + wing.rotated_z(theta * i)
+
+    return props
+
+
+# Geometric inwards of each component, in the order of the arguments of its properties
+GEOMETRIC_INWARDS = {
+    "nose": ("radius", "height", "pos"),
+    "tube": ("radius", "length", "pos"),
+    "engine": ("base_radius", "top_radius", "height", "pos"),
+    "wings": ("n", "radius", "pos", "l_in", "l_out", "width", "th"),
+    "tank": ("r_int", "r_ext", "height", "thickness", "pos"),
+}
+
+
+def geometry_key(component, inwards):
+    """Key of a component in the geometry cache.
+
+    Inputs
+    ------
+    component: string,
+        the name of the component, a key of `GEOMETRIC_INWARDS`
+    inwards: System,
+        the system holding the geometric inwards of the component
+
+    Outputs
+    ------
+    key: tuple,
+        the name of the component followed by the values of its geometric inwards
+    """
+    return (component,) + tuple(getattr(inwards, name) for name in GEOMETRIC_INWARDS[component])
+
+
+def _cached(component, inwards, build):
+    """Unit-density properties of a component, looked up in the geometry cache."""
+    key = geometry_key(component, inwards)
+    return geometry_cache.get(key + ("analytic",), lambda: build(*key[1:]))
+
+
+def nose_properties(inwards):
+    """Unit-density properties of the solid nose of `NoseGeom` and `NoseMass`."""
+    return _cached("nose", inwards, cone)
+
+
+def tube_properties(inwards):
+    """Unit-density properties of the solid tube of `TubeGeom` and `TubeMass`."""
+    return _cached("tube", inwards, cylinder)
+
+
+def engine_properties(inwards):
+    """Unit-density properties of the engine of `EngineGeom` and `EngineMass`."""
+    return _cached("engine", inwards, frustum)
+
+
+def wings_properties(inwards):
+    """Unit-density properties of the set of wings of `WingsGeom` and `WingsMass`."""
+    return _cached("wings", inwards, wings)
+
+
+def tank_properties(inwards):
+    """Unit-density properties of the empty tank of `TankGeom` and `TankMass`.
+
+    The fuel column changes in time, so it is left out of the cached structure.
+    """
+    return _cached("tank", inwards, tank_structure)
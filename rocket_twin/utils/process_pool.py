@@ -0,0 +1,54 @@
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+def run_pool(function, jobs, workers=None):
+    """Run a function for each job in a pool of processes and gather the recorded data.
+
+    A job raising in the pool (e.g. arguments that cannot be sent to the worker, or a worker
+    dying) is reported as a failure of that job, like the errors caught by the workers
+    themselves, instead of aborting the other ones.
+
+    Inputs
+    ------
+    function: callable,
+        job to run, returning a pd.DataFrame
+    jobs: dictionary,
+        arguments of the function, by job id
+    workers: int,
+        number of processes, defaults to the number of processors
+
+    Outputs
+    ------
+    frames: dictionary,
+        recorded data of every job, by job id
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {job: executor.submit(function, *args) for job, args in jobs.items()}
+        frames = {}
+        for job, future in futures.items():
+            try:
+                frames[job] = future.result()
+            except Exception as error:
+                frames[job] = error_frame(error)
+
+    return frames
+
+
+def error_frame(error):
+    """Report an error as the recorded data of a failed job.
+
+    Inputs
+    ------
+    error: Exception,
+        error raised by the job
+
+    Outputs
+    ------
+    data: pd.DataFrame,
+        single row with the error message
+    """
+    message = "".join(traceback.format_exception_only(type(error), error)).strip()
+    return pd.DataFrame({"error": [message]})
@@ -0,0 +1,271 @@
+import json
+import time
+from collections import defaultdict
+
+from cosapp.drivers import NonLinearSolver
+from cosapp.drivers.time.interfaces import ExplicitTimeDriver
+from cosapp.multimode.event import ZeroCrossingEvent
+
+from rocket_twin.drivers.event_location import private
+
+
+class SystemProfiler:
+    """Opt-in profiler of the systems, solvers and events of a system tree.
+
+    Once attached, the profiler wraps the `compute` and `transition` methods of every system
+    of the tree, the solvers and time drivers of their drivers, and the zero-crossing
+    functions of their events. It records the wall time and call count of each method, the
+    solver calls and iterations of each time step, and the evaluations of each event. The
+    wrappers are removed when the profiler is detached, and systems added by a transition are
+    profiled from their creation. Compute times are exclusive, since CoSApp runs the children
+    of a system before its `compute`.
+
+    Inputs
+    ------
+    system: System,
+        the head of the profiled tree
+
+    Outputs
+    ------
+    methods: dictionary,
+        call count and wall time of each (system, method) pair
+    solvers: dictionary,
+        calls and iterations of each solver
+    steps: list[dictionary],
+        time, step size, solver calls, iterations and event evaluations of each time step
+    events: dictionary,
+        evaluation count and wall time of each event
+    """
+
+    def __init__(self, system):
+
+        self.system = system
+        self._wrapped = []
+        self._seen = {}
+        self.reset()
+
+    def __enter__(self):
+        """Attach the profiler for the duration of the block."""
+        self.attach()
+        return self
+
+    def __exit__(self, *args):
+        """Detach the profiler."""
+        self.detach()
+
+    def reset(self):
+        """Clear the recorded statistics."""
+        self.methods = defaultdict(lambda: {"calls": 0, "time": 0.0})
+        self.solvers = defaultdict(lambda: {"calls": 0, "iterations": 0, "time": 0.0})
+        self.events = defaultdict(lambda: {"evaluations": 0, "time": 0.0})
+        self.steps = []
+
+    def attach(self):
+        """Wrap the methods of the systems, drivers and events of the tree."""
+        for system in self.system.tree():
+            # Systems are kept, so that the id of a removed one is not reused
+            if id(system) in self._seen:
+                continue
+            self._seen[id(system)] = system
+            name = self._name(system)
+
+            self._wrap(system, "compute", self._timer(self.methods[name, "compute"]))
+            # Transitions may add systems to the tree
+            self._wrap(
+                system, "transition", self._timer(self.methods[name, "transition"], attach=True)
+            )
+
+            for event in system.events():
+                state = private(event, "_state")
+                if isinstance(state, ZeroCrossingEvent):
+                    stats = self.events[f"{name}.{event.name}"]
+                    self._wrap(state, "value", self._event_timer(stats))
+
+            for driver in self._drivers(system):
+                if isinstance(driver, NonLinearSolver):
+                    stats = self.solvers[f"{name}.{driver.name}"]
+                    self._wrap(driver, "compute", self._solver_timer(driver, stats))
+                    self._wrap(driver, "_fresidues", self._counter(stats))
+                elif isinstance(driver, ExplicitTimeDriver):
+                    self._wrap(driver, "_update_transients", self._stepper(driver, name))
+
+    def detach(self):
+        """Remove the wrappers, keeping the recorded statistics."""
+        for obj, method in reversed(self._wrapped):
+            vars(obj).pop(method, None)
+        self._wrapped = []
+        self._seen = {}
+
+    def _name(self, system):
+        """Path of a system from the head of the tree."""
+        if system is self.system:
+            return system.name
+        return f"{self.system.name}.{self.system.get_path_to_child(system)}"
+
+    @staticmethod
+    def _drivers(system):
+        """Iterate over the drivers of a system and their sub-drivers."""
+        drivers = list(system.drivers.values())
+        while drivers:
+            driver = drivers.pop(0)
+            yield driver
+            drivers.extend(driver.children.values())
+
+    def _wrap(self, obj, method, wrapper):
+        """Replace a method of an object by a wrapper of the bound method."""
+        setattr(obj, method, wrapper(getattr(obj, method)))
+        self._wrapped.append((obj, method))
+
+    def _timer(self, stats, attach=False):
+        def wrapper(function):
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    stats["calls"] += 1
+                    stats["time"] += time.perf_counter() - start
+                    if attach:
+                        self.attach()
+
+            return timed
+
+        return wrapper
+
+    def _event_timer(self, stats):
+        def wrapper(function):
+            def timed():
+                start = time.perf_counter()
+                try:
+                    return function()
+                finally:
+                    stats["evaluations"] += 1
+                    stats["time"] += time.perf_counter() - start
+                    if self.steps:
+                        self.steps[-1]["event_evaluations"] += 1
+
+            return timed
+
+        return wrapper
+
+    def _solver_timer(self, solver, stats):
+        def wrapper(function):
+            def timed():
+                # Model passes of `ExplicitSolver` are iterations without residue evaluation
+                passes = getattr(solver, "statistics", {}).get("passes", 0)
+                iterations = stats["iterations"]
+                start = time.perf_counter()
+                try:
+                    return function()
+                finally:
+                    stats["time"] += time.perf_counter() - start
+                    stats["calls"] += 1
+                    stats["iterations"] += getattr(solver, "statistics", {}).get("passes", 0)
+                    stats["iterations"] -= passes
+                    if self.steps:
+                        self.steps[-1]["solver_calls"] += 1
+                        self.steps[-1]["iterations"] += stats["iterations"] - iterations
+
+            return timed
+
+        return wrapper
+
+    @staticmethod
+    def _counter(stats):
+        def wrapper(function):
+            def counted(*args, **kwargs):
+                stats["iterations"] += 1
+                return function(*args, **kwargs)
+
+            return counted
+
+        return wrapper
+
+    def _stepper(self, driver, name):
+        def wrapper(function):
+            def step(dt):
+                # Work done after the step, such as event location, is counted in the step
+                self.steps.append(
+                    {
+                        "driver": f"{name}.{driver.name}",
+                        "time": float(driver.time),
+                        "dt": float(dt),
+                        "solver_calls": 0,
+                        "iterations": 0,
+                        "event_evaluations": 0,
+                    }
+                )
+                return function(dt)
+
+            return step
+
+        return wrapper
+
+    def to_dict(self):
+        """Return the recorded statistics as a JSON-serializable dictionary."""
+        return {
+            "methods": [
+                {"system": system, "method": method, **stats}
+                for (system, method), stats in self.methods.items()
+                if stats["calls"]
+            ],
+            "solvers": [{"solver": name, **stats} for name, stats in self.solvers.items()],
+            "events": [{"event": name, **stats} for name, stats in self.events.items()],
+            "steps": self.steps,
+        }
+
+    def export(self, path):
+        """Write the recorded statistics to a JSON file.
+
+        Inputs
+        ------
+        path: string,
+            the path of the JSON file
+        """
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def report(self, limit=20):
+        """Return a text report of the recorded statistics, slowest first.
+
+        Inputs
+        ------
+        limit: int,
+            maximum number of rows of the method and event tables, all rows if None
+
+        Outputs
+        ------
+        report: string,
+            the methods, solvers and events, sorted by decreasing wall time
+        """
+        data = self.to_dict()
+        total = sum(row["time"] for row in data["methods"]) or 1.0
+        lines = [f"{'system':<40}{'method':>12}{'calls':>10}{'time [s]':>12}{'share':>8}"]
+        methods = sorted(data["methods"], key=lambda row: row["time"], reverse=True)
+        for row in methods[:limit]:
+            lines.append(
+                f"{row['system']:<40}{row['method']:>12}{row['calls']:>10d}"
+                f"{row['time']:>12.4f}{100 * row['time'] / total:>7.1f}%"
+            )
+
+        if data["solvers"]:
+            iterations = [step["iterations"] for step in self.steps]
+            lines += ["", f"{'solver':<40}{'calls':>10}{'iterations':>12}{'time [s]':>12}"]
+            for row in sorted(data["solvers"], key=lambda row: row["time"], reverse=True):
+                lines.append(
+                    f"{row['solver']:<40}{row['calls']:>10d}{row['iterations']:>12d}"
+                    f"{row['time']:>12.4f}"
+                )
+            if iterations:
+                lines.append(
+                    f"{len(iterations)} time steps, {sum(iterations) / len(iterations):.2f} "
+                    f"iterations per step on average, {max(iterations)} at most"
+                )
+
+        if data["events"]:
+            lines += ["", f"{'event':<40}{'evaluations':>12}{'time [s]':>12}"]
+            events = sorted(data["events"], key=lambda row: row["time"], reverse=True)
+            for row in events[:limit]:
+                lines.append(f"{row['event']:<40}{row['evaluations']:>12d}{row['time']:>12.4f}")
+
+        return "\n".join(lines)
@@ -0,0 +1,171 @@
+import numpy as np
+import pandas as pd
+from cosapp.recorders.recorder import BaseRecorder, make_wishlist
+
+
+class RingRecorder(BaseRecorder):
+    """Recorder of the latest records and of a decimated history, in constant memory.
+
+    Each level of the recorder is a preallocated ring buffer of `capacity` rows per variable.
+    Level 0 holds the latest records at full rate, and each following level holds one row
+    per `factor` rows of the previous one, either the last of them or their mean. Level k
+    thus spans `capacity * factor**k` records, and the memory use does not depend on the
+    length of the run. Only numerical variables can be recorded.
+
+    Inputs
+    ------
+    includes: string or list[string],
+        variables to record
+    excludes: string or list[string],
+        variables not to record
+    capacity: int,
+        number of rows of each level
+    levels: int,
+        number of levels, including the full rate one
+    factor: int,
+        decimation factor between two levels
+    reduce: string,
+        "last" to keep the last row of each block of the previous level, "mean" for their mean
+    """
+
+    def __init__(
+        self,
+        includes="*",
+        excludes=None,
+        numerical_only=True,
+        section="",
+        precision=9,
+        hold=False,
+        raw_output=True,
+        capacity=1000,
+        levels=3,
+        factor=10,
+        reduce="last",
+    ):
+        if reduce not in ("last", "mean"):
+            raise ValueError(f"Unknown reduction {reduce!r}")
+
+        super().__init__(includes, excludes, numerical_only, section, precision, hold, raw_output)
+        self.capacity = capacity
+        self.levels = levels
+        self.factor = factor
+        self.reduce = reduce
+        self.__buffers = None
+        self.__count = [0] * levels
+        self.__block = [None] * levels
+        self.__block_size = [0] * levels
+
+    @classmethod
+    def extend(cls, recorder, includes=None, excludes=None):
+        """Return a recorder with the same buffers settings and extended variable patterns."""
+        return cls(
+            recorder.includes + make_wishlist(includes, "includes"),
+            recorder.excludes + make_wishlist(excludes, "excludes"),
+            recorder._numerical_only,
+            recorder.section,
+            recorder.precision,
+            recorder.hold,
+            recorder._raw_output,
+            capacity=recorder.capacity,
+            levels=recorder.levels,
+            factor=recorder.factor,
+            reduce=recorder.reduce,
+        )
+
+    @property
+    def nbytes(self):
+        """int: memory used by the buffers, in bytes."""
+        if self.__buffers is None:
+            return 0
+        return sum(buffer.nbytes for level in self.__buffers for buffer in level)
+
+    @property
+    def _raw_data(self):
+        """list[list]: full rate records, oldest first."""
+        return self.export_data().values.tolist()
+
+    def start(self):
+        """Initialize recording support."""
+        super().start()
+        if not self.hold:
+            self.__reset()
+
+    def formatted_data(self):
+        """Collect recorded data from watched object into a list."""
+        return self.collected_data()
+
+    def _record(self, line):
+        # Section, status, error code and reference are not buffered
+        values = [np.asarray(value, dtype=float) for value in line[4:]]
+        if self.__buffers is None:
+            self.__buffers = [
+                [np.zeros((self.capacity,) + value.shape) for value in values]
+                for level in range(self.levels)
+            ]
+        self.__push(0, values)
+
+    def __push(self, level, values):
+        """Write a row at a level and feed the block of the next level."""
+        row = self.__count[level] % self.capacity
+        for buffer, value in zip(self.__buffers[level], values):
+            buffer[row] = value
+        self.__count[level] += 1
+
+        level += 1
+        if level == self.levels:
+            return
+
+        if self.reduce == "mean":
+            block = self.__block[level]
+            if block is None:
+                self.__block[level] = [np.array(value) for value in values]
+            else:
+                for total, value in zip(block, values):
+                    total += value
+        self.__block_size[level] += 1
+
+        if self.__block_size[level] == self.factor:
+            if self.reduce == "mean":
+                values = [total / self.factor for total in self.__block[level]]
+                self.__block[level] = None
+            self.__block_size[level] = 0
+            self.__push(level, values)
+
+    def export_data(self, level=0):
+        """Export the rows of a level into a pandas.DataFrame object, oldest first.
+
+        Inputs
+        ------
+        level: int,
+            0 for the full rate records, k for the history decimated by `factor**k`
+
+        Outputs
+        ------
+        data: pd.DataFrame,
+            one column per recorded variable
+        """
+        names = self.field_names()
+        if self.__buffers is None:
+            return pd.DataFrame(columns=names)
+
+        count = self.__count[level]
+        rows = np.arange(max(0, count - self.capacity), count) % self.capacity
+        data = {}
+        for name, buffer in zip(names, self.__buffers[level]):
+            values = buffer[rows]
+            data[name] = values if values.ndim == 1 else list(values)
+        return pd.DataFrame(data, columns=names)
+
+    def exit(self):  # noqa: A003
+        """Close recording session."""
+        pass
+
+    def clear(self):
+        """Clear all previously stored data."""
+        self.__reset()
+        super().clear()
+
+    def __reset(self):
+        self.__count = [0] * self.levels
+        self.__block = [None] * self.levels
+        self.__block_size = [0] * self.levels
@@ -0,0 +1,116 @@
+import pandas as pd
+
+from rocket_twin.utils.checkpoint import Snapshot
+from rocket_twin.utils.process_pool import error_frame, run_pool
+
+
+def run_branches(variants, init=None, stop=None, includes=None, dt=0.1, options=None, workers=None):
+    """Fuel a Station once, then fly each variant from the fueled state, in a pool of processes.
+
+    The fueling phase of the mission runs once, up to the launch. Its final state is taken as
+    a `Snapshot`, and each variant restores it into its own Station, sets its parameters on
+    top of the flight initial conditions of `Mission` and runs a `VerticalFlyingRocket`. The
+    shared fueling is thus never recomputed. A failing variant is reported in the results
+    instead of aborting the other ones.
+
+    Inputs
+    ------
+    variants: pd.DataFrame,
+        parameter table, one row per variant indexed by variant id, one column per flight
+        variable; an optional "stop" column overrides the stop condition of the flight
+    init: dictionary,
+        initial conditions of the fueling
+    stop: string,
+        stop condition of the flight
+    includes: list[string],
+        variables to record
+    dt [s]: float,
+        integration time step
+    options: dictionary,
+        Station construction options (n_stages, geometry...)
+    workers: int,
+        number of processes, defaults to the number of processors
+
+    Outputs
+    ------
+    fueling: pd.DataFrame,
+        recorded data of the shared fueling
+    flights: pd.DataFrame,
+        recorded data of every flight, indexed by variant id and record number, with an
+        "error" column holding the error message of failed variants
+    """
+    from rocket_twin.drivers import FuelingRocket
+    from rocket_twin.drivers.mission import STOP_FUELING
+    from rocket_twin.systems import Station
+
+    options = {} if options is None else options
+    variants = pd.DataFrame(variants)
+
+    sys = Station("sys", **options)
+    sys.add_driver(
+        FuelingRocket("fr", owner=sys, init=init, stop=STOP_FUELING, includes=includes, dt=dt)
+    )
+    sys.run_drivers()
+    fueling = sys.drivers["fr"].data
+    snapshot = Snapshot.take(sys)
+
+    jobs = {}
+    for variant, params in variants.iterrows():
+        params = params.to_dict()
+        # Variants without a stop condition of their own use the shared one
+        variant_stop = params.pop("stop", None)
+        if not isinstance(variant_stop, str):
+            variant_stop = stop
+        jobs[variant] = (snapshot, params, variant_stop, includes, dt, options)
+    frames = run_pool(run_branch, jobs, workers)
+
+    return fueling, pd.concat(frames, names=[variants.index.name or "variant", "record"])
+
+
+def run_branch(snapshot, init, stop, includes, dt, options):
+    """Run the flight of a single variant from a snapshot.
+
+    Inputs
+    ------
+    snapshot: Snapshot,
+        state of the Station at the start of the flight
+    init: dictionary,
+        flight parameters of the variant
+    stop: string,
+        stop condition of the flight
+    includes: list[string],
+        variables to record
+    dt [s]: float,
+        integration time step
+    options: dictionary,
+        Station construction options
+
+    Outputs
+    ------
+    data: pd.DataFrame,
+        recorded data of the flight, or a single row with the error message if it failed
+    """
+    from rocket_twin.drivers import VerticalFlyingRocket
+    from rocket_twin.drivers.mission import INIT_FLIGHT
+    from rocket_twin.systems import Station
+
+    try:
+        sys = Station("sys", **options)
+        snapshot.restore(sys)
+        sys.add_driver(
+            VerticalFlyingRocket(
+                "vfr",
+                owner=sys,
+                init={**INIT_FLIGHT, **init},
+                stop=stop,
+                includes=includes,
+                dt=dt,
+            )
+        )
+        sys.run_drivers()
+    except Exception as error:
+        return error_frame(error)
+
+    data = sys.drivers["vfr"].data
+    data["error"] = None
+    return data
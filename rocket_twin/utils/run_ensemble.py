@@ -0,0 +1,84 @@
+import pandas as pd
+
+from rocket_twin.utils.process_pool import error_frame, run_pool
+
+
+def run_ensemble(cases, init=None, stop=None, includes=None, dt=0.1, options=None, workers=None):
+    """Run a Station mission for each case of a parameter table, in a pool of processes.
+
+    Each case builds its own Station, sets its parameters on top of the initial conditions
+    and runs a Mission. A failing case is reported in the results instead of aborting the
+    other ones.
+
+    Inputs
+    ------
+    cases: pd.DataFrame,
+        parameter table, one row per case indexed by case id, one column per variable
+    init: dictionary,
+        initial conditions shared by all cases
+    stop: string,
+        stop condition of the flight
+    includes: list[string],
+        variables to record
+    dt [s]: float,
+        integration time step
+    options: dictionary,
+        Station construction options (n_stages, geometry...)
+    workers: int,
+        number of processes, defaults to the number of processors
+
+    Outputs
+    ------
+    results: pd.DataFrame,
+        recorded data of every case, indexed by case id and record number, with an "error"
+        column holding the error message of failed cases
+    """
+    init = {} if init is None else init
+    options = {} if options is None else options
+    cases = pd.DataFrame(cases)
+
+    jobs = {
+        case: ({**init, **params.to_dict()}, stop, includes, dt, options)
+        for case, params in cases.iterrows()
+    }
+    frames = run_pool(run_case, jobs, workers)
+
+    return pd.concat(frames, names=[cases.index.name or "case", "record"])
+
+
+def run_case(init, stop, includes, dt, options):
+    """Run the Station mission of a single case.
+
+    Inputs
+    ------
+    init: dictionary,
+        initial conditions of the case
+    stop: string,
+        stop condition of the flight
+    includes: list[string],
+        variables to record
+    dt [s]: float,
+        integration time step
+    options: dictionary,
+        Station construction options
+
+    Outputs
+    ------
+    data: pd.DataFrame,
+        recorded data of the mission, or a single row with the error message if it failed
+    """
+    from rocket_twin.drivers import Mission
+    from rocket_twin.systems import Station
+
+    try:
+        sys = Station("sys", **options)
+        sys.add_driver(
+            Mission("mission", owner=sys, init=init, stop=stop, includes=includes, dt=dt)
+        )
+        sys.run_drivers()
+    except Exception as error:
+        return error_frame(error)
+
+    data = sys.drivers["mission"].data
+    data["error"] = None
+    return data
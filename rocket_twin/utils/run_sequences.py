@@ -1,6 +1,8 @@
-from cosapp.drivers import NonLinearSolver, RungeKutta
 from cosapp.recorders import DataFrameRecorder
 
+from rocket_twin.drivers.event_location import EventRungeKutta
+from rocket_twin.drivers.explicit_solver import ExplicitSolver
+
 
 def run_sequences(sys, sequences, includes):
     """Run the command sequences over a system.
@@ -12,7 +14,7 @@ def run_sequences(sys, sequences, includes):
     sequences: dictionary,
         the commands to be applied
     """
-    rk = sys.add_driver(RungeKutta("rk"))
+    rk = sys.add_driver(EventRungeKutta("rk"))
     rk.add_recorder(DataFrameRecorder(includes=includes, hold=True))
 
     for seq in sequences:
@@ -23,7 +25,7 @@ def run_sequences(sys, sequences, includes):
             rk.children.clear()
 
             sys.add_driver(rk)
-            run = rk.add_driver(NonLinearSolver("nls", tol=1e-6))
+            run = rk.add_driver(ExplicitSolver("nls", tol=1e-6))
             rk.time_interval = (rk.time, rk.time + 10000)
 
             if "dt" in seq:
@@ -34,7 +36,7 @@ def run_sequences(sys, sequences, includes):
 
         if seq["type"] == "static":
             sys.drivers.clear()
-            run = sys.add_driver(NonLinearSolver("nls", tol=1e-6))
+            run = sys.add_driver(ExplicitSolver("nls", tol=1e-6))
 
         if "init" in seq:
             for key, val in seq["init"].items():
@@ -0,0 +1,110 @@
+BACKENDS = ("occ", "analytic")
+
+# Backend of the pyoccad components of each geometry, None for mass models without pyoccad
+GEOMETRIES = {"occ": "occ", "hybrid": "analytic", "analytic": None}
+
+
+def geometry_backend(geometry):
+    """Check the geometry of a composite system and return the backend of its components.
+
+    Inputs
+    ------
+    geometry: string,
+        "occ" for pyoccad models, "hybrid" for closed-form properties and pyoccad models only
+        built on request, "analytic" for mass models without pyoccad
+
+    Outputs
+    ------
+    backend: string,
+        backend of the pyoccad components, None if mass models are used
+    """
+    if geometry not in GEOMETRIES:
+        raise ValueError(f"Unknown geometry {geometry!r}")
+    return GEOMETRIES[geometry]
+
+
+class LazyShape:
+    """Mixin of the geometry systems whose pyoccad model is only built on request.
+
+    With the analytic backend, or with a lazy `OCCGeometry`, the `shape` outward is not
+    updated at each computation: it only reflects the current inwards after `request_shape`
+    and the next computation, which `build_shapes` does for a whole tree. Reading `shape` at
+    any other time returns the last built model, or the default one if none was built yet.
+    A `shape` collected by the recorder of a driver is built at each computation of the run.
+    """
+
+    _shape_requested = False
+    _shape_recorded = False
+
+    def add_backend(self, backend):
+        """Check the geometry backend and store it as the `backend` property.
+
+        Inputs
+        ------
+        backend: string,
+            "occ" to compute properties from the pyoccad model, "analytic" to use closed-form
+            formulas and only build the model on request
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown geometry backend {backend!r}")
+        self.add_property("backend", backend)
+
+    def request_shape(self):
+        """Ask for the pyoccad model to be built at the next computation."""
+        self._shape_requested = True
+        self.inwards.touch()
+
+    def setup_run(self):
+        super().setup_run()
+        self._shape_recorded = self.is_shape_recorded()
+        if self._shape_recorded:
+            self.inwards.touch()
+
+    def is_shape_recorded(self):
+        """Return whether the `shape` outward is collected by the recorder of a driver."""
+        for system in self.path_to_root():
+            for driver in system.drivers.values():
+                for child in driver.tree():
+                    recorder = child.recorder
+                    if recorder is None or recorder.watched_object is None:
+                        continue
+                    try:
+                        path = recorder.watched_object.get_path_to_child(self)
+                    except ValueError:
+                        continue
+                    if f"{path}.shape".lstrip(".") in recorder.field_names():
+                        return True
+        return False
+
+    def update_shape(self, create_shape, force=False):
+        """Build the `shape` outward if it was requested or is recorded.
+
+        Inputs
+        ------
+        create_shape: callable,
+            function returning the pyoccad model
+        force: boolean,
+            if True, the model is built even if it was not requested
+        """
+        if force or self._shape_requested or self._shape_recorded:
+            self._shape_requested = False
+            self.shape = create_shape()
+
+
+def build_shapes(sys):
+    """Build the pyoccad models of every geometry system of a tree.
+
+    Geometry systems with a lazy shape (analytic backend, lazy `OCCGeometry`) only update
+    their `shape` on request. This function requests all of them and runs the system once,
+    so that every shape of the tree reflects the current inwards.
+
+    Inputs
+    ------
+    sys: System,
+        the system whose shapes are built
+    """
+    for system in sys.tree():
+        if isinstance(system, LazyShape):
+            system.request_shape()
+
+    sys.run_once()